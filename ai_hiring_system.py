@@ -16,12 +16,29 @@ Author: AI Hiring Challenge Participant
 Date: August 2024
 """
 
+import bisect
+import functools
+import gzip
+import hashlib
+import io
 import json
+import math
+import os
+import queue
 import re
+import sqlite3
+import sys
+import tarfile
+import threading
+import time
+import zipfile
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Optional, Iterable, Iterator, Callable, Hashable, Protocol, Union
+from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import logging
 
@@ -80,43 +97,281 @@ class EvaluationResult:
 # CORE AI COMPONENTS
 # ============================================================================
 
+def _split_word_pattern(pattern: str) -> Optional[List[str]]:
+    """Return the alternatives of a r'\\b(a|b|c)\\b' word-list pattern, or None."""
+    inner = re.fullmatch(r'\\b\((.*)\)\\b', pattern)
+    if not inner or '(' in inner.group(1):
+        return None
+    return inner.group(1).split('|')
+
+def _is_word_char(char: str) -> bool:
+    """Characters that may not touch either end of a skill match."""
+    return char.isalnum() or char == '_'
+
+class ResumeDocument:
+    """A resume normalized once and shared by every stage that reads it.
+    
+    Holds the original text and its lowercased form. Stages keep derived
+    results (parsed fields, bias hits) in the document's feature cache, so
+    scoring one resume against many jobs only processes its text once.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self._features = {}
+    
+    @classmethod
+    def of(cls, resume: Union[str, 'ResumeDocument']) -> 'ResumeDocument':
+        """Wrap a resume text, or return an existing document unchanged."""
+        return resume if isinstance(resume, cls) else cls(resume)
+    
+    def feature(self, key, compute: Callable[['ResumeDocument'], object]):
+        """Return a derived feature, computing it with compute(self) the first time."""
+        if key not in self._features:
+            self._features[key] = compute(self)
+        return self._features[key]
+
+class SkillDictionary:
+    """Skill vocabulary matched with an Aho-Corasick automaton.
+    
+    Matching walks the text once, so its cost is linear in the resume length
+    regardless of how many skills are in the vocabulary. A hit only counts when
+    the characters on either side are not word characters, which keeps 'java'
+    out of 'javascript' while still matching tokens like 'c++' and 'node.js'.
+    Overlapping hits resolve to the leftmost, then longest, skill.
+    """
+    
+    def __init__(self, skills: Dict[str, Iterable[str]]):
+        start = time.perf_counter()
+        
+        # skill -> category, skills are matched case-insensitively
+        self.categories = {}
+        for category, category_skills in skills.items():
+            for skill in category_skills:
+                skill = skill.strip().lower()
+                if skill and skill not in self.categories:
+                    self.categories[skill] = category
+        
+        self._build_automaton()
+        self.fingerprint = hashlib.sha256(
+            '\n'.join(f"{skill}\t{category}" for skill, category in sorted(self.categories.items())).encode('utf-8')
+        ).hexdigest()
+        self.build_seconds = time.perf_counter() - start
+        self.load_seconds = 0.0
+    
+    def __len__(self) -> int:
+        return len(self.categories)
+    
+    def _build_automaton(self):
+        """Build the goto, failure and output tables."""
+        goto = [{}]
+        output = [()]
+        for skill in self.categories:
+            node = 0
+            for char in skill:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    output.append(())
+                node = next_node
+            output[node] = (len(skill),)
+        
+        # Breadth-first pass to link each node to its longest proper suffix
+        fail = [0] * len(goto)
+        frontier = list(goto[0].values())
+        for node in frontier:
+            for char, child in goto[node].items():
+                frontier.append(child)
+                suffix = fail[node]
+                while suffix and char not in goto[suffix]:
+                    suffix = fail[suffix]
+                fail[child] = goto[suffix].get(char, 0)
+                output[child] = output[child] + output[fail[child]]
+        
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+    
+    def find_all(self, text: str) -> List[str]:
+        """Return the skills found in text, in order of appearance."""
+        text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        
+        hits = []
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length in output[node]:
+                hits.append((end - length, end))
+        
+        # Keep word-bounded hits, leftmost first and longest on ties
+        skills = []
+        last_end = 0
+        for start, end in sorted(hits, key=lambda hit: (hit[0], -hit[1])):
+            if start < last_end:
+                continue
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            skills.append(text[start:end])
+            last_end = end
+        return skills
+    
+    @classmethod
+    def from_patterns(cls, skill_patterns: Dict[str, str]) -> 'SkillDictionary':
+        """Build a dictionary from ResumeParser-style r'\\b(a|b)\\b' patterns."""
+        skills = {}
+        for category, pattern in skill_patterns.items():
+            alternatives = _split_word_pattern(pattern)
+            if alternatives is None:
+                raise ValueError(f"Skill pattern for '{category}' is not a plain word list")
+            skills[category] = [re.sub(r'\\(.)', r'\1', alternative) for alternative in alternatives]
+        return cls(skills)
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'SkillDictionary':
+        """Load a skill taxonomy file.
+        
+        JSON files map each category to a list of skills. Any other file is read
+        as one skill per line, optionally prefixed by a category and a tab.
+        Blank lines and lines starting with '#' are ignored.
+        """
+        start = time.perf_counter()
+        if path.endswith('.json'):
+            with open(path, encoding='utf-8') as f:
+                skills = json.load(f)
+        else:
+            skills = {}
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    category, _, skill = line.rpartition('\t')
+                    skills.setdefault(category or 'general', []).append(skill)
+        load_seconds = time.perf_counter() - start
+        
+        dictionary = cls(skills)
+        dictionary.load_seconds = load_seconds
+        logger.info(f"Loaded {len(dictionary)} skills from {path} in {load_seconds:.3f}s "
+                    f"(automaton built in {dictionary.build_seconds:.3f}s)")
+        return dictionary
+
+# Taxonomy files already loaded, keyed by path and file version
+_skill_dictionary_cache: Dict[Tuple[str, int, int], SkillDictionary] = {}
+
+def load_skill_dictionary(path: str) -> SkillDictionary:
+    """Load a skill taxonomy file, reusing the automaton while the file is unchanged."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    
+    dictionary = _skill_dictionary_cache.get(key)
+    if dictionary is None:
+        dictionary = SkillDictionary.from_file(path)
+        # Drop stale versions of the same file
+        for cached_key in [k for k in _skill_dictionary_cache if k[0] == path]:
+            del _skill_dictionary_cache[cached_key]
+        _skill_dictionary_cache[key] = dictionary
+    return dictionary
+
 class ResumeParser:
     """AI-powered resume parsing and analysis system."""
     
-    def __init__(self):
+    def __init__(self, compiled: bool = False, skill_dictionary: Optional[SkillDictionary] = None):
         self.skill_patterns = {
             'programming': r'\b(python|java|c\+\+|javascript|react|node\.js|sql|aws|docker|kubernetes)\b',
             'soft_skills': r'\b(leadership|communication|teamwork|problem-solving|analytical|creative)\b',
             'tools': r'\b(git|jira|confluence|slack|zoom|teams|figma|photoshop)\b',
             'certifications': r'\b(certified|certification|cert|aws|azure|google|microsoft)\b'
         }
+        self.experience_pattern = r'(\d+)\s*(?:years?|yrs?)'
+        self.education_levels = ['phd', 'masters', 'bachelor', 'associate', 'high school']
+        self.location_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})'
+        
+        # Optional skill vocabulary that replaces skill_patterns
+        self.skill_dictionary = skill_dictionary
+        
+        # Compiled mode builds every extractor once instead of on each call
+        self.compiled = compiled
+        self._skill_regexes = []
+        self._experience_regex = None
+        self._location_regex = None
+        if compiled:
+            self.compile_extractors()
+    
+    def compile_extractors(self):
+        """Compile all extractors once (call again after changing the patterns)."""
+        self._skill_regexes = [re.compile(pattern) for pattern in self._merge_skill_patterns()]
+        self._experience_regex = re.compile(self.experience_pattern)
+        self._location_regex = re.compile(self.location_pattern)
+    
+    def config_key(self) -> str:
+        """Fingerprint of every setting that can change what parse_resume returns."""
+        config = {
+            'skill_patterns': self.skill_patterns,
+            'experience_pattern': self.experience_pattern,
+            'education_levels': self.education_levels,
+            'location_pattern': self.location_pattern,
+            'skill_dictionary': self.skill_dictionary.fingerprint if self.skill_dictionary else None
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def _merge_skill_patterns(self) -> List[str]:
+        """Merge the per-category skill patterns into one word-bounded alternation."""
+        alternatives = []
+        for pattern in self.skill_patterns.values():
+            words = _split_word_pattern(pattern)
+            if words is None:
+                # Not a plain word list - keep one pattern per category
+                return list(self.skill_patterns.values())
+            alternatives.extend(word for word in words if word not in alternatives)
+        return [r'\b(?:' + '|'.join(alternatives) + r')\b']
+    
+    def parse_resume(self, resume_text: Union[str, ResumeDocument]) -> Dict:
+        """Extract structured information from resume text using NLP techniques.
+        
+        A ResumeDocument is parsed once; later calls with the same document
+        return a copy of the stored result.
+        """
+        if isinstance(resume_text, ResumeDocument):
+            parsed = resume_text.feature(('parsed', self), lambda document: self._parse_text(document.text, document.lower))
+            return dict(parsed, skills=list(parsed['skills']))
+        return self._parse_text(resume_text, resume_text.lower())
+    
+    def _parse_text(self, resume_text: str, text_lower: str) -> Dict:
+        if self.compiled:
+            return self._parse_resume_compiled(resume_text, text_lower)
         
-    def parse_resume(self, resume_text: str) -> Dict:
-        """Extract structured information from resume text using NLP techniques."""
         try:
-            # Convert to lowercase for pattern matching
-            text_lower = resume_text.lower()
-            
-            # Extract skills using regex patterns
+            # Extract skills using the skill dictionary or regex patterns
             extracted_skills = []
-            for category, pattern in self.skill_patterns.items():
-                matches = re.findall(pattern, text_lower)
-                extracted_skills.extend(matches)
+            if self.skill_dictionary is not None:
+                extracted_skills = self.skill_dictionary.find_all(text_lower)
+            else:
+                for category, pattern in self.skill_patterns.items():
+                    matches = re.findall(pattern, text_lower)
+                    extracted_skills.extend(matches)
             
             # Extract experience (look for years, months patterns)
-            experience_match = re.search(r'(\d+)\s*(?:years?|yrs?)', text_lower)
+            experience_match = re.search(self.experience_pattern, text_lower)
             experience_years = float(experience_match.group(1)) if experience_match else 0.0
             
             # Extract education level
-            education_levels = ['phd', 'masters', 'bachelor', 'associate', 'high school']
             education_level = 'bachelor'  # default
-            for level in education_levels:
+            for level in self.education_levels:
                 if level in text_lower:
                     education_level = level
                     break
             
             # Extract location (look for city, state patterns)
-            location_match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})', resume_text)
+            location_match = re.search(self.location_pattern, resume_text)
             location = location_match.group(0) if location_match else "Unknown"
             
             return {
@@ -128,11 +383,185 @@ class ResumeParser:
             
         except Exception as e:
             logger.error(f"Error parsing resume: {e}")
+            return self._empty_result()
+    
+    def _parse_resume_compiled(self, resume_text: str, text_lower: str) -> Dict:
+        """Parse a resume with the precompiled extractors.
+        
+        All skill categories share one alternation, so the skill vocabulary is
+        matched in a single walk over the text. Experience, education and location
+        only need their first hit and stop there.
+        """
+        try:
+            if self.skill_dictionary is not None:
+                skills = set(self.skill_dictionary.find_all(text_lower))
+            else:
+                skills = set()
+                for skill_regex in self._skill_regexes:
+                    skills.update(skill_regex.findall(text_lower))
+            
+            experience_match = self._experience_regex.search(text_lower)
+            
+            education_level = 'bachelor'  # default
+            for level in self.education_levels:
+                if level in text_lower:
+                    education_level = level
+                    break
+            
+            location_match = self._location_regex.search(resume_text)
+            
             return {
-                'skills': [],
-                'experience_years': 0.0,
-                'education_level': 'unknown',
-                'location': 'unknown'
+                'skills': list(skills),
+                'experience_years': float(experience_match.group(1)) if experience_match else 0.0,
+                'education_level': education_level,
+                'location': location_match.group(0) if location_match else "Unknown"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error parsing resume: {e}")
+            return self._empty_result()
+    
+    @staticmethod
+    def _empty_result() -> Dict:
+        """Result returned when a resume cannot be parsed."""
+        return {
+            'skills': [],
+            'experience_years': 0.0,
+            'education_level': 'unknown',
+            'location': 'unknown'
+        }
+
+class ResumeParseCache:
+    """Content-addressed cache of parsed resumes.
+    
+    Entries are keyed by a hash of the resume text and the parser configuration,
+    so a re-uploaded resume is only parsed again when the parser changes. The
+    in-memory tier is an LRU bounded by the serialized size of its entries. When
+    a directory is given, entries are also written there as JSON files and
+    survive restarts.
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._entries = OrderedDict()  # key -> (parsed result, size in bytes)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        
+        # Counters for sizing the cache
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(parser: ResumeParser, resume_text: str) -> str:
+        """Hash the parser configuration and resume text into a cache key."""
+        digest = hashlib.sha256(parser.config_key().encode('utf-8'))
+        digest.update(resume_text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+    
+    def parse(self, parser: ResumeParser, resume_text: str) -> Dict:
+        """Return the parsed resume from the cache, parsing it on a miss."""
+        key = self.make_key(parser, resume_text)
+        result = self.get(key)
+        if result is None:
+            result = parser.parse_resume(resume_text)
+            self.put(key, result)
+        return result
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a parsed resume by key, checking memory first and then disk."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry[0])
+        
+        result = self._read_disk(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        self._store(key, result, len(json.dumps(result)))
+        return self._copy(result)
+    
+    def put(self, key: str, result: Dict):
+        """Store a parsed resume in memory and, if configured, on disk."""
+        serialized = json.dumps(result)
+        self._store(key, self._copy(result), len(serialized))
+        if self.directory:
+            self._write_disk(key, serialized)
+    
+    def _store(self, key: str, result: Dict, size: int):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self.current_bytes += size
+            
+            # Evict least recently used entries until we fit again
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+    
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+    
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_disk(self, key: str, serialized: str):
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(serialized)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing parse cache entry: {e}")
+    
+    @staticmethod
+    def _copy(result: Dict) -> Dict:
+        # Callers own the returned skills list, the cache keeps its own
+        return dict(result, skills=list(result['skills']))
+    
+    def clear(self):
+        """Drop the in-memory tier and reset the counters (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size, for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
             }
 
 class SkillsMatcher:
@@ -150,20 +579,40 @@ class SkillsMatcher:
                              required_skills: List[str], 
                              preferred_skills: List[str]) -> float:
         """Calculate skills match score using weighted matching algorithm."""
+        try:
+            return self.calculate_lowered_skills_match(
+                [skill.lower() for skill in candidate_skills],
+                [skill.lower() for skill in required_skills],
+                [skill.lower() for skill in preferred_skills]
+            )
+            
+        except Exception as e:
+            logger.error(f"Error calculating skills match: {e}")
+            return 0.0
+    
+    def calculate_lowered_skills_match(self, candidate_skills: List[str],
+                                       required_skills: List[str],
+                                       preferred_skills: List[str]) -> float:
+        """calculate_skills_match for skill lists that are already lowercased.
+        
+        Candidate skills count as a set, as in SkillsIndex: case variants such
+        as "Docker" and "docker" only earn the preferred bonus once.
+        """
         try:
             if not required_skills:
                 return 0.0
+            candidate_skills = list(dict.fromkeys(candidate_skills))
             
-            # Calculate required skills match
-            required_matches = sum(1 for skill in required_skills 
-                                if any(req_skill.lower() in skill.lower() 
-                                      for req_skill in required_skills))
+            # Calculate required skills match; a newline-joined string finds a required
+            # skill inside any candidate skill with one substring search
+            joined_skills = '\n'.join(candidate_skills)
+            required_matches = sum(1 for req_skill in required_skills
+                                if candidate_skills and req_skill in joined_skills and '\n' not in req_skill)
             required_score = required_matches / len(required_skills)
             
             # Calculate preferred skills bonus
             preferred_matches = sum(1 for skill in candidate_skills 
-                                 if any(pref_skill.lower() in skill.lower() 
-                                       for pref_skill in preferred_skills))
+                                 if any(pref_skill in skill for pref_skill in preferred_skills))
             preferred_bonus = min(preferred_matches * 0.1, 0.2)  # Max 20% bonus
             
             # Calculate weighted score
@@ -175,8 +624,115 @@ class SkillsMatcher:
             logger.error(f"Error calculating skills match: {e}")
             return 0.0
 
+# Number of set bits in every possible byte
+_POPCOUNT8 = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class SkillsIndex:
+    """Candidate skills stored as a packed bit matrix for vectorized matching.
+    
+    Every distinct (lowercased) skill gets an integer id and every candidate a
+    row of bits, one per skill id. Scoring a job against all candidates then
+    comes down to AND/popcount over the matrix, using the same rules as
+    SkillsMatcher.calculate_skills_match: a job skill matches any candidate
+    skill that contains it. A candidate's skills are treated as a set, so
+    repeated entries are only counted once.
+    """
+    
+    def __init__(self):
+        self.skill_ids = {}        # skill -> column
+        self.candidate_ids = []    # row -> candidate id
+        self._rows = {}            # candidate id -> row
+        self._bits = np.zeros((0, 1), dtype=np.uint8)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add_candidates(self, candidates: Iterable[Candidate]):
+        """Add candidates, replacing the skills of any that are already indexed."""
+        rows, columns = [], []
+        for candidate in candidates:
+            row = self._rows.get(candidate.id)
+            if row is None:
+                row = len(self.candidate_ids)
+                self._rows[candidate.id] = row
+                self.candidate_ids.append(candidate.id)
+            else:
+                self._bits[row] = 0
+            for skill in candidate.skills:
+                rows.append(row)
+                columns.append(self.skill_ids.setdefault(skill.lower(), len(self.skill_ids)))
+        
+        self._size = len(self.candidate_ids)
+        self._reserve(self._size, len(self.skill_ids))
+        if rows:
+            rows = np.asarray(rows, dtype=np.int64)
+            columns = np.asarray(columns, dtype=np.int64)
+            np.bitwise_or.at(self._bits, (rows, columns >> 3),
+                             (128 >> (columns & 7)).astype(np.uint8))
+    
+    def _reserve(self, rows: int, skills: int):
+        """Grow the matrix geometrically so repeated adds stay amortized O(1)."""
+        capacity, width = self._bits.shape
+        needed_width = max(1, (skills + 7) // 8)
+        if rows <= capacity and needed_width <= width:
+            return
+        grown = np.zeros((max(rows, capacity * 2), max(needed_width, width * 2)), dtype=np.uint8)
+        grown[:capacity, :width] = self._bits
+        self._bits = grown
+    
+    def skill_mask(self, skills: Iterable[str]) -> np.ndarray:
+        """Packed mask of every indexed skill that contains one of the given skills."""
+        mask = np.zeros(self._bits.shape[1] * 8, dtype=bool)
+        needles = [skill.lower() for skill in skills]
+        for skill, column in self.skill_ids.items():
+            if any(needle in skill for needle in needles):
+                mask[column] = True
+        return np.packbits(mask)
+    
+    def calculate_skills_match(self, required_skills: List[str],
+                               preferred_skills: List[str]) -> np.ndarray:
+        """Skills match score of every indexed candidate, aligned with candidate_ids."""
+        scores = np.zeros(self._size)
+        if not required_skills:
+            return scores
+        bits = self._bits[:self._size]
+        
+        # A required skill is covered when any candidate bit falls inside its mask
+        required_matches = np.zeros(self._size, dtype=np.int64)
+        for required_skill in required_skills:
+            required_matches += self._any_bits(bits, self.skill_mask([required_skill]))
+        required_score = required_matches / len(required_skills)
+        
+        # Preferred bonus counts candidate skills matching any preferred skill
+        preferred_matches = self._count_bits(bits, self.skill_mask(preferred_skills))
+        preferred_bonus = np.minimum(preferred_matches * 0.1, 0.2)
+        
+        return np.minimum((required_score * 0.8) + preferred_bonus, 1.0)
+    
+    @staticmethod
+    def _any_bits(bits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        # Only the bytes the mask touches can produce a hit
+        columns = np.flatnonzero(mask)
+        if not len(columns):
+            return np.zeros(len(bits), dtype=bool)
+        return (bits[:, columns] & mask[columns]).any(axis=1)
+    
+    @staticmethod
+    def _count_bits(bits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        columns = np.flatnonzero(mask)
+        if not len(columns):
+            return np.zeros(len(bits), dtype=np.int64)
+        return _POPCOUNT8[bits[:, columns] & mask[columns]].sum(axis=1, dtype=np.int64)
+
 class BiasDetector:
-    """AI system for detecting and mitigating bias in hiring decisions."""
+    """AI system for detecting and mitigating bias in hiring decisions.
+    
+    All indicators are compiled into one case-insensitive, word-bounded
+    pattern, so 'he' is found in "he led" but not in "the" or "experience",
+    and a text is scanned once however many indicators there are. Call
+    compile_indicators() again after editing bias_indicators.
+    """
     
     def __init__(self):
         self.bias_indicators = {
@@ -185,33 +741,325 @@ class BiasDetector:
             'location_bias': ['local', 'remote', 'onsite', 'relocation'],
             'education_bias': ['ivy league', 'top university', 'prestigious']
         }
+        self.compile_indicators()
+    
+    def compile_indicators(self):
+        """Compile bias_indicators into a single word-bounded matcher."""
+        # indicator -> bitmask of the bias types listing it
+        self._indicator_bits = {}
+        for bit, indicators in enumerate(self.bias_indicators.values()):
+            for indicator in indicators:
+                self._indicator_bits[indicator] = self._indicator_bits.get(indicator, 0) | 1 << bit
+        
+        # Longest first, so the alternation prefers 'fresh graduate' over any shorter prefix
+        alternatives = sorted(self._indicator_bits, key=len, reverse=True)
+        self._indicator_regex = re.compile(
+            r'(?<!\w)(?:' + '|'.join(re.escape(indicator) for indicator in alternatives) + r')(?!\w)'
+            if alternatives else r'(?!)'
+        )
+        
+        # Multi-word indicators split at each space, for matches spanning two joined texts
+        self._indicator_splits = [
+            (indicator, indicator[:i], indicator[i + 1:])
+            for indicator in self._indicator_bits
+            for i, char in enumerate(indicator) if char == ' '
+        ]
+    
+    def _resume_hits(self, resume: Union[str, ResumeDocument]) -> frozenset:
+        """Indicators found in a resume, stored on the document after the first scan."""
+        document = ResumeDocument.of(resume)
+        return document.feature(('bias_hits', self), lambda d: self.text_hits(d.lower))
+    
+    def _join_hits(self, resume_lower: str, job_lower: str) -> List[str]:
+        """Multi-word indicators that only appear across the space joining resume and job text."""
+        return [indicator for indicator, prefix, suffix in self._indicator_splits
+                if self._ends_with_word(resume_lower, prefix) and self._starts_with_word(job_lower, suffix)]
+    
+    @staticmethod
+    def _ends_with_word(text: str, word: str) -> bool:
+        start = len(text) - len(word)
+        return text.endswith(word) and (start == 0 or not _is_word_char(text[start - 1]))
+    
+    @staticmethod
+    def _starts_with_word(text: str, word: str) -> bool:
+        return text.startswith(word) and (len(text) == len(word) or not _is_word_char(text[len(word)]))
+    
+    def _group_hits(self, hits: Iterable[str]) -> Dict[str, List[str]]:
+        """Group matched indicators by bias type, in bias_indicators order."""
+        hits = set(hits)
+        bias_found = {}
+        for bias_type, indicators in self.bias_indicators.items():
+            matches = [indicator for indicator in indicators if indicator in hits]
+            if matches:
+                bias_found[bias_type] = matches
+        return bias_found
     
-    def detect_bias(self, resume_text: str, job_description: str) -> Dict:
-        """Detect potential bias indicators in resume and job description."""
+    def detect_bias(self, resume_text: Union[str, ResumeDocument], job_description: str) -> Dict:
+        """Detect potential bias indicators in resume and job description.
+        
+        The resume may be a ResumeDocument, in which case its own hits are only
+        computed once however many job descriptions it is checked against.
+        """
         try:
-            bias_found = {}
-            text_lower = resume_text.lower() + " " + job_description.lower()
-            
-            for bias_type, indicators in self.bias_indicators.items():
-                matches = [indicator for indicator in indicators 
-                          if indicator in text_lower]
-                if matches:
-                    bias_found[bias_type] = matches
-            
-            return bias_found
+            job_lower = job_description.lower()
+            return self.detect_bias_precomputed(resume_text, job_lower, self.text_hits(job_lower))
             
         except Exception as e:
             logger.error(f"Error detecting bias: {e}")
             return {}
+    
+    def text_hits(self, text_lower: str) -> frozenset:
+        """Indicators found in an already lowercased text."""
+        return frozenset(self._indicator_regex.findall(text_lower))
+    
+    def detect_bias_precomputed(self, resume_text: Union[str, ResumeDocument], job_lower: str,
+                                job_hits: frozenset) -> Dict:
+        """detect_bias with the job description already lowercased and scanned by text_hits."""
+        document = ResumeDocument.of(resume_text)
+        hits = self._resume_hits(document) | job_hits
+        join_hits = self._join_hits(document.lower, job_lower)
+        return self._group_hits(hits.union(join_hits) if join_hits else hits)
+    
+    def detect_bias_batch(self, texts: Iterable[Union[str, ResumeDocument]]) -> List[Dict]:
+        """Detect bias indicators in each text of a corpus, one pass per text."""
+        return [self._group_hits(self._resume_hits(text)) for text in texts]
+    
+    def detect_bias_matrix(self, resume_texts: List[Union[str, ResumeDocument]],
+                           job_descriptions: List[str]) -> np.ndarray:
+        """Bias categories for every resume/job pair, as a bitmask matrix.
+        
+        Bit i of entry [r, j] is set when detect_bias(resume_texts[r],
+        job_descriptions[j]) reports the i-th category of bias_indicators. Each
+        text is scanned once; only indicators that contain a space can match
+        across the space that joins the two texts, and those are checked at the
+        end of each resume and the start of each job description instead of
+        scanning every pair.
+        """
+        documents = [ResumeDocument.of(text) for text in resume_texts]
+        jobs_lower = [text.lower() for text in job_descriptions]
+        
+        resume_masks = np.array([self._category_mask(self._resume_hits(document)) for document in documents],
+                                dtype=np.int64)
+        job_masks = np.array([self._category_mask(self._indicator_regex.findall(text)) for text in jobs_lower],
+                             dtype=np.int64)
+        masks = resume_masks[:, None] | job_masks[None, :]
+        
+        for indicator, prefix, suffix in self._indicator_splits:
+            resume_ends = np.array([self._ends_with_word(d.lower, prefix) for d in documents], dtype=bool)
+            job_starts = np.array([self._starts_with_word(text, suffix) for text in jobs_lower], dtype=bool)
+            masks[np.outer(resume_ends, job_starts)] |= self._indicator_bits[indicator]
+        return masks
+    
+    def _category_mask(self, hits: Iterable[str]) -> int:
+        mask = 0
+        for indicator in set(hits):
+            mask |= self._indicator_bits[indicator]
+        return mask
+
+# Path of the bundled city gazetteer
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'us_cities.tsv')
+
+US_STATES = {
+    'alabama': 'al', 'alaska': 'ak', 'arizona': 'az', 'arkansas': 'ar', 'california': 'ca',
+    'colorado': 'co', 'connecticut': 'ct', 'delaware': 'de', 'district of columbia': 'dc',
+    'florida': 'fl', 'georgia': 'ga', 'hawaii': 'hi', 'idaho': 'id', 'illinois': 'il',
+    'indiana': 'in', 'iowa': 'ia', 'kansas': 'ks', 'kentucky': 'ky', 'louisiana': 'la',
+    'maine': 'me', 'maryland': 'md', 'massachusetts': 'ma', 'michigan': 'mi', 'minnesota': 'mn',
+    'mississippi': 'ms', 'missouri': 'mo', 'montana': 'mt', 'nebraska': 'ne', 'nevada': 'nv',
+    'new hampshire': 'nh', 'new jersey': 'nj', 'new mexico': 'nm', 'new york': 'ny',
+    'north carolina': 'nc', 'north dakota': 'nd', 'ohio': 'oh', 'oklahoma': 'ok', 'oregon': 'or',
+    'pennsylvania': 'pa', 'rhode island': 'ri', 'south carolina': 'sc', 'south dakota': 'sd',
+    'tennessee': 'tn', 'texas': 'tx', 'utah': 'ut', 'vermont': 'vt', 'virginia': 'va',
+    'washington': 'wa', 'west virginia': 'wv', 'wisconsin': 'wi', 'wyoming': 'wy'
+}
+
+EARTH_RADIUS_KM = 6371.0
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points given in degrees."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+class GeoGridIndex:
+    """Points bucketed into a latitude/longitude grid for radius queries.
+    
+    A query only visits the cells overlapping the search radius, then checks
+    the exact distance of the points found there.
+    """
+    
+    def __init__(self, cell_degrees: float = 1.0):
+        self.cell_degrees = cell_degrees
+        self._cells = {}
+        self._points = {}
+    
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self.cell_degrees)), int(math.floor(lon / self.cell_degrees))
+    
+    def add(self, item, lat: float, lon: float):
+        self._points[item] = (lat, lon)
+        self._cells.setdefault(self._cell(lat, lon), []).append(item)
+    
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List:
+        """Items within radius_km of (lat, lon), nearest first."""
+        lat_span = radius_km / 111.0
+        lon_span = radius_km / (111.0 * max(math.cos(math.radians(lat)), 0.01))
+        min_row, min_col = self._cell(lat - lat_span, lon - lon_span)
+        max_row, max_col = self._cell(lat + lat_span, lon + lon_span)
+        
+        found = []
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                for item in self._cells.get((row, col), ()):
+                    distance = haversine_km(lat, lon, *self._points[item])
+                    if distance <= radius_km:
+                        found.append((distance, item))
+        found.sort(key=lambda hit: hit[0])
+        return [item for _, item in found]
+
+class Gazetteer:
+    """Offline city gazetteer that resolves location strings to interned ids.
+    
+    'Seattle, WA', 'seattle wa' and 'Seattle, Washington, USA' all resolve to
+    the same id. A bare city name resolves when only one state has a city of
+    that name. Resolutions are memoized, so repeated strings cost one dict
+    lookup, and a GeoGridIndex over the cities answers radius queries.
+    """
+    
+    ALIASES = {'nyc': 'new york|ny', 'new york city': 'new york|ny', 'sf': 'san francisco|ca',
+               'washington dc': 'washington|dc'}
+    
+    def __init__(self, cities: Iterable[Tuple[str, str, float, float]], max_resolved: int = 10000):
+        self.names = []
+        self.states = []
+        self.coordinates = []
+        self._ids = {}
+        city_ids = {}
+        for city, state, lat, lon in cities:
+            key = f"{self._normalize(city)}|{state.strip().lower()}"
+            if key in self._ids:
+                continue
+            location_id = self._ids[key] = len(self.names)
+            self.names.append(f"{city}, {state.upper()}")
+            self.states.append(state.strip().lower())
+            self.coordinates.append((float(lat), float(lon)))
+            city_ids.setdefault(self._normalize(city), []).append(location_id)
+        
+        # Bare city names only when unambiguous
+        self._city_ids = {city: ids[0] for city, ids in city_ids.items() if len(ids) == 1}
+        for alias, key in self.ALIASES.items():
+            if key in self._ids:
+                self._city_ids[alias] = self._ids[key]
+        
+        self.grid = GeoGridIndex()
+        for location_id, (lat, lon) in enumerate(self.coordinates):
+            self.grid.add(location_id, lat, lon)
+        
+        # Location strings come from user input, so only the most recent lookups are kept
+        self._resolve_cached = functools.lru_cache(maxsize=max_resolved)(self._resolve)
+        self._state_pattern = re.compile(
+            r'^(.+?)[\s,]+(' + '|'.join(sorted(map(re.escape, US_STATES), key=len, reverse=True))
+            + r'|[a-z]{2})$'
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ' '.join(text.lower().replace('.', '').replace(',', ' ').split())
+    
+    @classmethod
+    def from_file(cls, path: str = GAZETTEER_PATH) -> 'Gazetteer':
+        """Load a tab-separated city, state, latitude, longitude file."""
+        cities = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip() and not line.startswith('#'):
+                    city, state, lat, lon = line.rstrip('\n').split('\t')
+                    cities.append((city, state, float(lat), float(lon)))
+        return cls(cities)
+    
+    def resolve(self, location: str) -> Optional[int]:
+        """Location id of a 'City, ST' style string, or None when it is not known."""
+        return self._resolve_cached(location)
+    
+    def _resolve(self, location: str) -> Optional[int]:
+        text = self._normalize(location)
+        text = re.sub(r'\s+(usa|us|united states)$', '', text)
+        if text in self._city_ids:
+            return self._city_ids[text]
+        match = self._state_pattern.match(text)
+        if match:
+            city, state = match.groups()
+            return self._ids.get(f"{city}|{US_STATES.get(state, state)}")
+        return None
+    
+    def distance_km(self, first_id: int, second_id: int) -> float:
+        return haversine_km(*self.coordinates[first_id], *self.coordinates[second_id])
+    
+    def near(self, location_id: int, radius_km: float) -> List[int]:
+        """Ids of the gazetteer cities within radius_km of a city, nearest first."""
+        return self.grid.query_radius(*self.coordinates[location_id], radius_km)
+
+_default_gazetteer: Optional[Gazetteer] = None
+
+def default_gazetteer() -> Gazetteer:
+    """The bundled US city gazetteer, loaded on first use."""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        _default_gazetteer = Gazetteer.from_file(GAZETTEER_PATH)
+    return _default_gazetteer
+
+@dataclass
+class CompiledJob:
+    """Job-side inputs to scoring, prepared once per job version.
+    
+    Built by CandidateEvaluator.compile_job. Scoring a candidate against a
+    compiled job does no work on the job's own fields.
+    """
+    job: Job
+    required_skills: List[str]  # lowercased
+    preferred_skills: List[str]  # lowercased
+    experience_required: float
+    education_level: int
+    location: str  # lowercased
+    location_words: List[str]
+    remote: bool
+    location_id: Optional[int]  # gazetteer id, None when the location is not a known city
+    description: str  # lowercased "title company" text checked for bias
+    bias_hits: frozenset
 
 class CandidateEvaluator:
-    """Main AI system for comprehensive candidate evaluation."""
+    """Main AI system for comprehensive candidate evaluation.
     
-    def __init__(self):
+    One evaluator may be shared by several threads: its resume, job and
+    distance caches, and the fields it fills in on candidates, are updated
+    under a lock.
+    """
+    
+    def __init__(self, parse_cache: Optional[ResumeParseCache] = None, max_documents: int = 4096,
+                 gazetteer: Optional[Gazetteer] = None, commute_km: float = 80.0, max_jobs: int = 1024):
         self.resume_parser = ResumeParser()
+        self.parse_cache = parse_cache
         self.skills_matcher = SkillsMatcher()
         self.bias_detector = BiasDetector()
         
+        self._lock = threading.Lock()
+        
+        # Recently evaluated resumes by candidate id, so each is processed once across jobs
+        self.max_documents = max_documents
+        self._documents = OrderedDict()
+        
+        # Recently used compiled job profiles by job id, dropped by invalidate_job
+        self.max_jobs = max_jobs
+        self._compiled_jobs = OrderedDict()
+        
+        # Known cities in the same state or within commuting distance count as nearby
+        self.gazetteer = gazetteer if gazetteer is not None else default_gazetteer()
+        self.commute_km = commute_km
+        self._nearby = {}
+        
         # Evaluation weights
         self.weights = {
             'skills': 0.35,
@@ -220,38 +1068,80 @@ class CandidateEvaluator:
             'location': 0.10,
             'bias_penalty': 0.10
         }
+        
+        self.education_hierarchy = {
+            'high school': 1,
+            'associate': 2,
+            'bachelor': 3,
+            'masters': 4,
+            'phd': 5
+        }
     
-    def evaluate_candidate(self, candidate: Candidate, job: Job) -> EvaluationResult:
+    def compile_job(self, job: Job) -> CompiledJob:
+        """The compiled profile of a job, built on first use.
+        
+        Profiles are cached by job id, keeping the max_jobs most recently used.
+        A different Job object with the same id replaces the cached profile;
+        after editing a Job in place, call invalidate_job.
+        """
+        with self._lock:
+            compiled = self._compiled_jobs.get(job.id)
+            if compiled is None or compiled.job is not job:
+                location = job.location.lower()
+                description = f"{job.title} {job.company}".lower()
+                compiled = self._compiled_jobs[job.id] = CompiledJob(
+                    job=job,
+                    required_skills=[skill.lower() for skill in job.required_skills],
+                    preferred_skills=[skill.lower() for skill in job.preferred_skills],
+                    experience_required=job.experience_required,
+                    education_level=self.education_hierarchy.get(job.education_required.lower(), 1),
+                    location=location,
+                    location_words=location.split(),
+                    remote='remote' in location,
+                    location_id=self.gazetteer.resolve(location),
+                    description=description,
+                    bias_hits=self.bias_detector.text_hits(description)
+                )
+                while len(self._compiled_jobs) > self.max_jobs:
+                    self._compiled_jobs.popitem(last=False)
+            self._compiled_jobs.move_to_end(job.id)
+            return compiled
+    
+    def invalidate_job(self, job_id: str):
+        """Drop the compiled profile of a job that has been edited."""
+        with self._lock:
+            self._compiled_jobs.pop(job_id, None)
+    
+    def evaluate_candidate(self, candidate: Candidate, job: Union[Job, CompiledJob]) -> EvaluationResult:
         """Perform comprehensive AI-powered candidate evaluation."""
         try:
+            compiled_job = job if isinstance(job, CompiledJob) else self.compile_job(job)
+            job = compiled_job.job
+            document = self.document_for(candidate)
+            
             # Parse resume if not already done
             if not candidate.skills:
-                parsed_data = self.resume_parser.parse_resume(candidate.resume_text)
-                candidate.skills = parsed_data['skills']
-                candidate.experience_years = parsed_data['experience_years']
-                candidate.education_level = parsed_data['education_level']
-                candidate.location = parsed_data['location']
+                self._fill_from_resume(candidate, document)
             
-            # Calculate individual match scores
-            skills_match = self.skills_matcher.calculate_skills_match(
-                candidate.skills, job.required_skills, job.preferred_skills
+            # Calculate individual match scores against the precompiled job profile
+            skills_match = self.skills_matcher.calculate_lowered_skills_match(
+                [skill.lower() for skill in candidate.skills],
+                compiled_job.required_skills, compiled_job.preferred_skills
             )
             
             experience_match = self._calculate_experience_match(
-                candidate.experience_years, job.experience_required
+                candidate.experience_years, compiled_job.experience_required
             )
             
-            education_match = self._calculate_education_match(
-                candidate.education_level, job.education_required
+            education_match = self._education_level_match(
+                self.education_hierarchy.get(candidate.education_level.lower(), 1), compiled_job.education_level
             )
             
-            location_match = self._calculate_location_match(
-                candidate.location, job.location
-            )
+            location_match = self._compiled_location_match(candidate.location.lower(), compiled_job)
             
             # Detect bias
-            bias_indicators = self.bias_detector.detect_bias(
-                candidate.resume_text, f"{job.title} {job.company}"
+            bias_indicators = self.bias_detector.detect_bias_precomputed(
+                document, compiled_job.description, compiled_job.bias_hits
             )
             
             # Calculate overall score
@@ -290,6 +1180,114 @@ class CandidateEvaluator:
             logger.error(f"Error evaluating candidate: {e}")
             return None
     
+    def evaluate_many(self, candidates: List[Candidate], jobs: List[Job]) -> 'EvaluationMatrix':
+        """Evaluate every candidate against every job with vectorized scoring.
+        
+        Produces the same scores as calling evaluate_candidate for each pair, but
+        each component is computed for the whole candidates x jobs grid at once.
+        EvaluationResult objects are only built when requested from the matrix.
+        """
+        # Parse resumes up front, as evaluate_candidate would on first use
+        documents = [self.document_for(candidate) for candidate in candidates]
+        for candidate, document in zip(candidates, documents):
+            if not candidate.skills:
+                self._fill_from_resume(candidate, document)
+        
+        shape = (len(candidates), len(jobs))
+        
+        # Skills: one bit-matrix pass per job
+        skills_index = SkillsIndex()
+        skills_index.add_candidates(candidates)
+        skills_match = np.zeros(shape)
+        for column, job in enumerate(jobs):
+            skills_match[:, column] = skills_index.calculate_skills_match(job.required_skills, job.preferred_skills)
+        
+        # Experience: the step function as np.select over the broadcast grid
+        candidate_experience = np.array([c.experience_years for c in candidates], dtype=float)[:, None]
+        required_experience = np.array([j.experience_required for j in jobs], dtype=float)[None, :]
+        experience_match = np.select(
+            [candidate_experience >= required_experience,
+             candidate_experience >= required_experience * 0.7,
+             candidate_experience >= required_experience * 0.5],
+            [1.0, 0.8, 0.6], default=0.3
+        )
+        
+        # Education: look levels up once, then compare as integers
+        candidate_level = np.array([self.education_hierarchy.get(c.education_level.lower(), 1)
+                                    for c in candidates])[:, None]
+        required_level = np.array([self.compile_job(j).education_level for j in jobs])[None, :]
+        education_match = np.select(
+            [candidate_level >= required_level, candidate_level >= required_level - 1],
+            [1.0, 0.7], default=0.4
+        )
+        
+        # Location: score each distinct candidate location once per job, then gather
+        location_codes, distinct_locations = pd.factorize(pd.Series([c.location for c in candidates], dtype=object))
+        location_table = np.array([[self._calculate_location_match(location, job.location) for job in jobs]
+                                   for location in distinct_locations]).reshape(len(distinct_locations), len(jobs))
+        location_match = location_table[location_codes] if len(candidates) else np.zeros(shape)
+        
+        bias_masks = self.bias_detector.detect_bias_matrix(
+            documents, [f"{job.title} {job.company}" for job in jobs]
+        ).reshape(shape)
+        
+        overall_score = (
+            skills_match * self.weights['skills'] +
+            experience_match * self.weights['experience'] +
+            education_match * self.weights['education'] +
+            location_match * self.weights['location']
+        )
+        bias_detected = bias_masks != 0
+        overall_score = np.where(bias_detected, overall_score * (1 - self.weights['bias_penalty']), overall_score)
+        
+        for candidate, flagged in zip(candidates, bias_detected.any(axis=1)):
+            if flagged:
+                candidate.bias_detected = True
+        
+        return EvaluationMatrix(
+            evaluator=self,
+            candidate_ids=[c.id for c in candidates],
+            job_ids=[j.id for j in jobs],
+            overall_score=overall_score,
+            skills_match=skills_match,
+            experience_match=experience_match,
+            education_match=education_match,
+            location_match=location_match,
+            bias_masks=bias_masks,
+            timestamp=datetime.now()
+        )
+    
+    def document_for(self, candidate: Candidate) -> ResumeDocument:
+        """The shared ResumeDocument for a candidate's current resume text."""
+        with self._lock:
+            document = self._documents.get(candidate.id)
+            if document is None or document.text != candidate.resume_text:
+                document = self._documents[candidate.id] = ResumeDocument(candidate.resume_text)
+                while len(self._documents) > self.max_documents:
+                    self._documents.popitem(last=False)
+            self._documents.move_to_end(candidate.id)
+            return document
+    
+    def _fill_from_resume(self, candidate: Candidate, document: ResumeDocument):
+        """Fill in a candidate's profile fields from its parsed resume."""
+        parsed_data = self._parse_resume(document)
+        with self._lock:
+            # Another thread may have filled the same candidate in meanwhile
+            if not candidate.skills:
+                candidate.skills = parsed_data['skills']
+                candidate.experience_years = parsed_data['experience_years']
+                candidate.education_level = parsed_data['education_level']
+                candidate.location = parsed_data['location']
+    
+    def _parse_resume(self, resume: Union[str, ResumeDocument]) -> Dict:
+        """Parse a resume, going through the parse cache when one is configured."""
+        if self.parse_cache is not None:
+            document = ResumeDocument.of(resume)
+            parsed = document.feature(('parse_cache', self.parse_cache),
+                                      lambda d: self.parse_cache.parse(self.resume_parser, d.text))
+            return dict(parsed, skills=list(parsed['skills']))
+        return self.resume_parser.parse_resume(resume)
+    
     def _calculate_experience_match(self, candidate_exp: float, required_exp: float) -> float:
         """Calculate experience match score."""
         if candidate_exp >= required_exp:
@@ -303,17 +1301,13 @@ class CandidateEvaluator:
     
     def _calculate_education_match(self, candidate_edu: str, required_edu: str) -> float:
         """Calculate education match score."""
-        education_hierarchy = {
-            'high school': 1,
-            'associate': 2,
-            'bachelor': 3,
-            'masters': 4,
-            'phd': 5
-        }
-        
-        candidate_level = education_hierarchy.get(candidate_edu.lower(), 1)
-        required_level = education_hierarchy.get(required_edu.lower(), 1)
-        
+        return self._education_level_match(
+            self.education_hierarchy.get(candidate_edu.lower(), 1),
+            self.education_hierarchy.get(required_edu.lower(), 1)
+        )
+    
+    @staticmethod
+    def _education_level_match(candidate_level: int, required_level: int) -> float:
         if candidate_level >= required_level:
             return 1.0
         elif candidate_level >= required_level - 1:
@@ -323,15 +1317,42 @@ class CandidateEvaluator:
     
     def _calculate_location_match(self, candidate_loc: str, job_loc: str) -> float:
         """Calculate location match score."""
-        if candidate_loc.lower() == job_loc.lower():
+        job_loc = job_loc.lower()
+        return self._location_score(candidate_loc.lower(), job_loc, job_loc.split(), 'remote' in job_loc,
+                                    self.gazetteer.resolve(job_loc))
+    
+    def _compiled_location_match(self, candidate_loc: str, job: CompiledJob) -> float:
+        """_calculate_location_match with a lowercased candidate location and compiled job."""
+        return self._location_score(candidate_loc, job.location, job.location_words, job.remote, job.location_id)
+    
+    def _location_score(self, candidate_loc: str, job_loc: str, job_words: List[str], remote: bool,
+                        job_location_id: Optional[int]) -> float:
+        """Score lowercased locations, by gazetteer id when both are known cities."""
+        if candidate_loc == job_loc:
             return 1.0
-        elif 'remote' in job_loc.lower():
+        elif remote:
             return 0.9
-        elif any(word in candidate_loc.lower() for word in job_loc.lower().split()):
+        
+        candidate_location_id = self.gazetteer.resolve(candidate_loc) if job_location_id is not None else None
+        if candidate_location_id is not None:
+            if candidate_location_id == job_location_id:
+                return 1.0
+            return 0.7 if self._is_nearby(candidate_location_id, job_location_id) else 0.3
+        elif any(word in candidate_loc for word in job_words):
             return 0.7
         else:
             return 0.3
     
+    def _is_nearby(self, first_id: int, second_id: int) -> bool:
+        key = (first_id, second_id) if first_id < second_id else (second_id, first_id)
+        nearby = self._nearby.get(key)
+        if nearby is None:
+            nearby = (self.gazetteer.states[first_id] == self.gazetteer.states[second_id]
+                      or self.gazetteer.distance_km(first_id, second_id) <= self.commute_km)
+            with self._lock:
+                self._nearby[key] = nearby
+        return nearby
+    
     def _generate_recommendations(self, skills_match: float, experience_match: float,
                                 education_match: float, location_match: float,
                                 bias_indicators: Dict) -> List[str]:
@@ -358,85 +1379,1513 @@ class CandidateEvaluator:
         
         return recommendations
 
+@dataclass
+class EvaluationMatrix:
+    """Columnar scores from CandidateEvaluator.evaluate_many.
+    
+    Every score array is indexed [candidate, job] in the order of candidate_ids
+    and job_ids. bias_masks holds one bit per bias category, in the order of the
+    evaluator's bias_indicators.
+    """
+    evaluator: 'CandidateEvaluator'
+    candidate_ids: List[str]
+    job_ids: List[str]
+    overall_score: np.ndarray
+    skills_match: np.ndarray
+    experience_match: np.ndarray
+    education_match: np.ndarray
+    location_match: np.ndarray
+    bias_masks: np.ndarray
+    timestamp: datetime
+    
+    def result(self, candidate_index: int, job_index: int) -> EvaluationResult:
+        """Build the EvaluationResult for one candidate/job pair."""
+        categories = list(self.evaluator.bias_detector.bias_indicators)
+        mask = int(self.bias_masks[candidate_index, job_index])
+        bias_indicators = [category for bit, category in enumerate(categories) if mask >> bit & 1]
+        
+        scores = (
+            float(self.skills_match[candidate_index, job_index]),
+            float(self.experience_match[candidate_index, job_index]),
+            float(self.education_match[candidate_index, job_index]),
+            float(self.location_match[candidate_index, job_index])
+        )
+        return EvaluationResult(
+            candidate_id=self.candidate_ids[candidate_index],
+            job_id=self.job_ids[job_index],
+            overall_score=float(self.overall_score[candidate_index, job_index]),
+            skills_match=scores[0],
+            experience_match=scores[1],
+            education_match=scores[2],
+            location_match=scores[3],
+            bias_indicators=bias_indicators,
+            recommendations=self.evaluator._generate_recommendations(*scores, bias_indicators),
+            timestamp=self.timestamp
+        )
+    
+    def iter_results(self) -> Iterator[EvaluationResult]:
+        """Yield an EvaluationResult for every pair, job by job."""
+        for job_index in range(len(self.job_ids)):
+            for candidate_index in range(len(self.candidate_ids)):
+                yield self.result(candidate_index, job_index)
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per candidate/job pair with all component scores."""
+        candidates, jobs = len(self.candidate_ids), len(self.job_ids)
+        return pd.DataFrame({
+            'candidate_id': np.repeat(np.asarray(self.candidate_ids, dtype=object), jobs),
+            'job_id': np.tile(np.asarray(self.job_ids, dtype=object), candidates),
+            'overall_score': self.overall_score.ravel(),
+            'skills_match': self.skills_match.ravel(),
+            'experience_match': self.experience_match.ravel(),
+            'education_match': self.education_match.ravel(),
+            'location_match': self.location_match.ravel(),
+            'bias_detected': (self.bias_masks != 0).ravel()
+        })
+
+# ============================================================================
+# BATCH PROCESSING
+# ============================================================================
+
+@dataclass
+class WorkerThroughput:
+    """Resumes parsed by one worker process and the time it spent parsing them."""
+    worker_id: int
+    documents: int = 0
+    busy_seconds: float = 0.0
+    
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.busy_seconds if self.busy_seconds else 0.0
+
+# Parser installed in each pool process by _init_parse_worker
+_worker_parser: Optional[ResumeParser] = None
+
+def _init_parse_worker(parser: ResumeParser):
+    global _worker_parser
+    _worker_parser = parser
+
+def _parse_chunk(parser: ResumeParser, resume_texts: List[str]) -> Tuple[int, float, List[Dict]]:
+    """Parse one chunk and report which process did it and how long it took."""
+    start = time.perf_counter()
+    results = [parser.parse_resume(resume_text) for resume_text in resume_texts]
+    return os.getpid(), time.perf_counter() - start, results
+
+def _parse_chunk_in_worker(resume_texts: List[str]) -> Tuple[int, float, List[Dict]]:
+    return _parse_chunk(_worker_parser, resume_texts)
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def parse_resumes(resume_texts: Iterable[str], workers: Optional[int] = None, chunksize: int = 64,
+                  parser: Optional[ResumeParser] = None,
+                  throughput: Optional[Dict[int, WorkerThroughput]] = None) -> Iterator[Dict]:
+    """Parse many resumes on a process pool, yielding results in input order.
+    
+    The input is consumed lazily and at most two chunks per worker are in flight,
+    so memory stays bounded however long the iterable is. Per-worker counts are
+    collected in `throughput` (keyed by process id) when a dict is passed in,
+    and a docs/sec summary per worker is logged once the input is exhausted.
+    """
+    parser = parser or ResumeParser(compiled=True)
+    workers = workers or os.cpu_count() or 1
+    throughput = {} if throughput is None else throughput
+    chunks = _chunked(resume_texts, chunksize)
+    
+    def record(worker_id: int, seconds: float, results: List[Dict]) -> List[Dict]:
+        stats = throughput.setdefault(worker_id, WorkerThroughput(worker_id))
+        stats.documents += len(results)
+        stats.busy_seconds += seconds
+        return results
+    
+    if workers == 1:
+        # No pool needed - parse in this process
+        for chunk in chunks:
+            yield from record(*_parse_chunk(parser, chunk))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                   initargs=(parser,))
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_parse_chunk_in_worker, chunk))
+                if len(pending) >= workers * 2:
+                    yield from record(*pending.popleft().result())
+            while pending:
+                yield from record(*pending.popleft().result())
+        finally:
+            # Drop chunks not yet started if the consumer stopped early
+            # (shutdown's cancel_futures needs Python 3.9)
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+    
+    for stats in throughput.values():
+        logger.info(f"Worker {stats.worker_id}: parsed {stats.documents} resumes "
+                    f"at {stats.docs_per_second:.0f} docs/sec")
+
+# ============================================================================
+# RESUME FILE INGESTION
+# ============================================================================
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.txt')
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz')
+_EMAIL_REGEX = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+
+def extract_resume_text(name: str, data: bytes) -> str:
+    """Extract plain text from a PDF, DOCX or text resume."""
+    extension = os.path.splitext(name)[1].lower()
+    if extension == '.pdf':
+        from PyPDF2 import PdfReader
+        reader = PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    if extension == '.docx':
+        import docx
+        document = docx.Document(io.BytesIO(data))
+        return "\n".join(paragraph.text for paragraph in document.paragraphs)
+    if extension == '.txt':
+        return data.decode('utf-8', errors='replace')
+    raise ValueError(f"Unsupported resume format: {name}")
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+def iter_resume_sources(path: str) -> Iterator[Tuple[str, Callable[[], bytes]]]:
+    """Walk a directory or archive lazily, yielding (name, loader) for each resume.
+    
+    Files on disk are read by the loader, so the read happens on whichever thread
+    calls it. Archive members are read while walking because zip and tar handles
+    are not shared with other threads.
+    """
+    if os.path.isdir(path):
+        # scandir streams entries instead of listing whole directories up front
+        with os.scandir(path) as entries:
+            for entry in entries:
+                yield from iter_resume_sources(entry.path)
+    elif path.lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(RESUME_EXTENSIONS):
+                    data = archive.read(info)
+                    yield f"{path}!{info.filename}", lambda data=data: data
+    elif path.lower().endswith(ARCHIVE_EXTENSIONS):
+        with tarfile.open(path) as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith(RESUME_EXTENSIONS):
+                    data = archive.extractfile(member).read()
+                    yield f"{path}!{member.name}", lambda data=data: data
+    elif path.lower().endswith(RESUME_EXTENSIONS):
+        yield path, lambda: _read_file(path)
+
+class ResumeIngestionPipeline:
+    """Streaming pipeline from resume files to parsed Candidate records.
+    
+    Stages run concurrently: one thread walks the source, a pool of threads reads
+    and extracts text, and the calling thread parses and builds candidates. The
+    stages are joined by bounded queues, so memory stays constant no matter how
+    many files the source holds. Candidates are yielded in completion order.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, parser: Optional[ResumeParser] = None, workers: int = 4,
+                 queue_size: int = 64, parse_cache: Optional[ResumeParseCache] = None):
+        self.parser = parser or ResumeParser(compiled=True)
+        self.parse_cache = parse_cache
+        self.workers = workers
+        self.queue_size = queue_size
+        self.processed = 0
+        self.failed = 0
+        self._failed_lock = threading.Lock()
+    
+    def run(self, path: str) -> Iterator[Candidate]:
+        """Ingest every resume under path (a directory, archive or single file)."""
+        sources = queue.Queue(maxsize=self.queue_size)
+        texts = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        
+        threads = [threading.Thread(target=self._walk, args=(path, sources, stop), daemon=True)]
+        threads += [threading.Thread(target=self._extract, args=(sources, texts, stop), daemon=True)
+                    for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            finished_workers = 0
+            while finished_workers < self.workers:
+                item = texts.get()
+                if item is self._DONE:
+                    finished_workers += 1
+                    continue
+                yield self._build_candidate(*item)
+                self.processed += 1
+        finally:
+            # Unblock the other stages if the consumer stopped early
+            stop.set()
+            for thread in threads:
+                thread.join()
+            logger.info(f"Ingested {self.processed} resumes from {path} ({self.failed} failed)")
+    
+    def _walk(self, path: str, sources: queue.Queue, stop: threading.Event):
+        try:
+            for source in iter_resume_sources(path):
+                if not self._put(sources, source, stop):
+                    return
+        except Exception as e:
+            logger.error(f"Error walking {path}: {e}")
+        finally:
+            for _ in range(self.workers):
+                self._put(sources, self._DONE, stop)
+    
+    def _extract(self, sources: queue.Queue, texts: queue.Queue, stop: threading.Event):
+        try:
+            while not stop.is_set():
+                try:
+                    item = sources.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is self._DONE:
+                    break
+                name, load = item
+                try:
+                    text = extract_resume_text(name, load())
+                except Exception as e:
+                    with self._failed_lock:
+                        self.failed += 1
+                    logger.error(f"Error extracting text from {name}: {e}")
+                    continue
+                if not self._put(texts, (name, text), stop):
+                    return
+        finally:
+            self._put(texts, self._DONE, stop)
+    
+    @staticmethod
+    def _put(target: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put with back-pressure, giving up once the pipeline is stopped."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _build_candidate(self, name: str, resume_text: str) -> Candidate:
+        if self.parse_cache is not None:
+            parsed_data = self.parse_cache.parse(self.parser, resume_text)
+        else:
+            parsed_data = self.parser.parse_resume(resume_text)
+        
+        # Text without an '@' has no email address, so skip the regex scan
+        email_match = _EMAIL_REGEX.search(resume_text) if '@' in resume_text else None
+        base_name = os.path.splitext(os.path.basename(name.split('!')[-1]))[0]
+        
+        return Candidate(
+            id=f"R{hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]}",
+            name=re.sub(r'[_\-.]+', ' ', base_name).strip().title(),
+            email=email_match.group(0) if email_match else "",
+            resume_text=resume_text,
+            skills=parsed_data['skills'],
+            experience_years=parsed_data['experience_years'],
+            education_level=parsed_data['education_level'],
+            location=parsed_data['location']
+        )
+
 # ============================================================================
 # DATA MANAGEMENT
 # ============================================================================
 
-class HiringDatabase:
-    """Database management for candidates, jobs, and evaluations."""
+class _Interner:
+    """Maps hashable values to dense integer codes."""
     
     def __init__(self):
+        self.codes = {}
+        self.values = []
+    
+    def code(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+class EvaluationStore:
+    """Evaluation results stored column by column in growable NumPy arrays.
+    
+    Candidate and job ids, bias indicator lists and recommendation lists are
+    interned to integer codes, so a stored evaluation costs a few dozen bytes
+    instead of a dataclass with its own lists and strings. Row ids are indexed
+    by job and by candidate. The store still behaves like the list it replaces:
+    append, len, iteration and indexing return EvaluationResult objects built
+    on demand.
+    """
+    
+    SCORE_COLUMNS = ('overall_score', 'skills_match', 'experience_match', 'education_match', 'location_match')
+    
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._columns = {
+            'candidate_code': np.zeros(capacity, dtype=np.int32),
+            'job_code': np.zeros(capacity, dtype=np.int32),
+            'timestamp': np.zeros(capacity, dtype='datetime64[us]'),
+            'bias_detected': np.zeros(capacity, dtype=bool),
+            'bias_code': np.zeros(capacity, dtype=np.int32),
+            'recommendation_code': np.zeros(capacity, dtype=np.int32)
+        }
+        for name in self.SCORE_COLUMNS:
+            self._columns[name] = np.zeros(capacity)
+        
+        self._candidate_ids = _Interner()
+        self._job_ids = _Interner()
+        self._bias_lists = _Interner()
+        self._recommendation_lists = _Interner()
+        
+        # code -> row ids, as compact int32 arrays
+        self._rows_by_job = {}
+        self._rows_by_candidate = {}
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, evaluation: EvaluationResult):
+        """Store one evaluation result."""
+        if self._size == len(self._columns['job_code']):
+            self._grow()
+        row = self._size
+        columns = self._columns
+        
+        candidate_code = self._candidate_ids.code(evaluation.candidate_id)
+        job_code = self._job_ids.code(evaluation.job_id)
+        columns['candidate_code'][row] = candidate_code
+        columns['job_code'][row] = job_code
+        for name in self.SCORE_COLUMNS:
+            columns[name][row] = getattr(evaluation, name)
+        columns['timestamp'][row] = np.datetime64(evaluation.timestamp, 'us')
+        columns['bias_detected'][row] = bool(evaluation.bias_indicators)
+        columns['bias_code'][row] = self._bias_lists.code(tuple(evaluation.bias_indicators))
+        columns['recommendation_code'][row] = self._recommendation_lists.code(tuple(evaluation.recommendations))
+        
+        self._rows_by_job.setdefault(job_code, array('i')).append(row)
+        self._rows_by_candidate.setdefault(candidate_code, array('i')).append(row)
+        self._size += 1
+    
+    def remove_candidate(self, candidate_id: str) -> int:
+        """Delete every evaluation of a candidate, returning how many were removed.
+        
+        The remaining rows are compacted, so row ids after the removed rows
+        shift down. This costs one pass over the store, which is fine for an
+        operation far rarer than append.
+        """
+        code = self._candidate_ids.codes.get(candidate_id)
+        removed = self._rows_by_candidate.pop(code, None) if code is not None else None
+        if not removed:
+            return 0
+        size = self._size
+        keep = np.ones(size, dtype=bool)
+        keep[np.array(removed, dtype=np.int64)] = False
+        kept = int(keep.sum())
+        for column in self._columns.values():
+            column[:kept] = column[:size][keep]
+        self._size = kept
+        self._rows_by_job = self._index_rows(self._columns['job_code'][:kept])
+        self._rows_by_candidate = self._index_rows(self._columns['candidate_code'][:kept])
+        return size - kept
+    
+    @staticmethod
+    def _index_rows(codes: np.ndarray) -> Dict[int, array]:
+        """code -> row ids in ascending order, rebuilt from a code column."""
+        if not len(codes):
+            return {}
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        return {int(codes[rows[0]]): array('i', rows.tolist()) for rows in np.split(order, boundaries)}
+    
+    def _grow(self):
+        for name, column in self._columns.items():
+            grown = np.zeros(max(len(column) * 2, 1), dtype=column.dtype)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+    
+    def __getitem__(self, row: int) -> EvaluationResult:
+        """Build the EvaluationResult stored at a row."""
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError("evaluation index out of range")
+        columns = self._columns
+        return EvaluationResult(
+            candidate_id=self._candidate_ids.values[columns['candidate_code'][row]],
+            job_id=self._job_ids.values[columns['job_code'][row]],
+            overall_score=float(columns['overall_score'][row]),
+            skills_match=float(columns['skills_match'][row]),
+            experience_match=float(columns['experience_match'][row]),
+            education_match=float(columns['education_match'][row]),
+            location_match=float(columns['location_match'][row]),
+            bias_indicators=list(self._bias_lists.values[columns['bias_code'][row]]),
+            recommendations=list(self._recommendation_lists.values[columns['recommendation_code'][row]]),
+            timestamp=columns['timestamp'][row].item()
+        )
+    
+    def __iter__(self) -> Iterator[EvaluationResult]:
+        for row in range(self._size):
+            yield self[row]
+    
+    def rows(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None) -> np.ndarray:
+        """Row ids of the evaluations for a candidate and/or job, in insertion order."""
+        selected = None
+        for interner, index, key in ((self._job_ids, self._rows_by_job, job_id),
+                                     (self._candidate_ids, self._rows_by_candidate, candidate_id)):
+            if key is None:
+                continue
+            code = interner.codes.get(key)
+            found = np.array(index.get(code, ()), dtype=np.int64)
+            selected = found if selected is None else np.intersect1d(selected, found, assume_unique=True)
+        if selected is None:
+            return np.arange(self._size)
+        return selected
+    
+    def page(self, after: int = -1, limit: int = 100, candidate_id: Optional[str] = None,
+             job_id: Optional[str] = None) -> np.ndarray:
+        """Up to limit row ids after row `after`, for a candidate and/or job.
+        
+        Keyset pagination over the row indexes: the cost follows the page size
+        rather than the number of stored evaluations.
+        """
+        filters = []
+        for interner, index, column, key in ((self._job_ids, self._rows_by_job, 'job_code', job_id),
+                                             (self._candidate_ids, self._rows_by_candidate, 'candidate_code',
+                                              candidate_id)):
+            if key is None:
+                continue
+            code = interner.codes.get(key)
+            if code is None:
+                return np.zeros(0, dtype=np.int64)
+            filters.append((index.get(code, array('i')), column, code))
+        
+        if not filters:
+            start = max(after + 1, 0)
+            return np.arange(start, min(start + limit, self._size))
+        
+        # Walk the shorter posting list from the cursor, checking any other filter on its column
+        filters.sort(key=lambda f: len(f[0]))
+        postings = filters[0][0]
+        start = bisect.bisect_right(postings, after)
+        if len(filters) == 1:
+            return np.array(postings[start:start + limit], dtype=np.int64)
+        _, column, code = filters[1]
+        values = self._columns[column]
+        selected = []
+        for position in range(start, len(postings)):
+            row = postings[position]
+            if values[row] == code:
+                selected.append(row)
+                if len(selected) == limit:
+                    break
+        return np.array(selected, dtype=np.int64)
+    
+    def select(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None) -> List[EvaluationResult]:
+        """EvaluationResult objects for a candidate and/or job."""
+        return [self[row] for row in self.rows(candidate_id, job_id)]
+    
+    def column(self, name: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """A stored column, either whole (a view) or for the given rows (a copy)."""
+        column = self._columns[name][:self._size]
+        return column if rows is None else column[rows]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame over the stored columns.
+        
+        Score, timestamp and bias flag columns share memory with the store. The
+        id columns are categoricals over the interned ids.
+        """
+        size = self._size
+        frame = {
+            'candidate_id': pd.Categorical.from_codes(
+                self._columns['candidate_code'][:size], categories=pd.Index(self._candidate_ids.values, dtype=object)),
+            'job_id': pd.Categorical.from_codes(
+                self._columns['job_code'][:size], categories=pd.Index(self._job_ids.values, dtype=object))
+        }
+        for name in self.SCORE_COLUMNS + ('bias_detected', 'timestamp'):
+            frame[name] = self._columns[name][:size]
+        return pd.DataFrame(frame, copy=False)
+    
+    @property
+    def candidate_ids(self) -> List[str]:
+        """Interned candidate ids; the candidate_code column indexes into this list."""
+        return self._candidate_ids.values
+    
+    @property
+    def job_ids(self) -> List[str]:
+        """Interned job ids; the job_code column indexes into this list."""
+        return self._job_ids.values
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes used by the stored rows and their indexes."""
+        row_bytes = sum(column.itemsize for column in self._columns.values())
+        index_bytes = 2 * 4 * self._size
+        return row_bytes * self._size + index_bytes
+
+class JobRanking:
+    """Candidates for one job kept in score order.
+    
+    Entries are sorted by descending score, with earlier evaluations first on
+    ties. Top-k reads the first k entries and a candidate's rank is a binary
+    search on its key. Re-evaluating a candidate replaces its entry.
+    """
+    
+    def __init__(self):
+        self._entries = []  # sorted (-score, sequence, candidate_id)
+        self._keys = {}     # candidate_id -> its entry
+        self._sequence = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def update(self, candidate_id: str, score: float):
+        """Insert or replace the score of a candidate."""
+        self.remove(candidate_id)
+        self._sequence += 1
+        entry = (-score, self._sequence, candidate_id)
+        bisect.insort(self._entries, entry)
+        self._keys[candidate_id] = entry
+    
+    def remove(self, candidate_id: str):
+        entry = self._keys.pop(candidate_id, None)
+        if entry is not None:
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+    
+    def top(self, limit: int) -> List[Tuple[str, float]]:
+        """The best `limit` (candidate_id, score) pairs."""
+        return [(candidate_id, -negative_score) for negative_score, _, candidate_id in self._entries[:limit]]
+    
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        for negative_score, _, candidate_id in self._entries:
+            yield candidate_id, -negative_score
+    
+    def rank(self, candidate_id: str) -> Optional[int]:
+        """1-based rank of a candidate, or None when it has not been evaluated."""
+        entry = self._keys.get(candidate_id)
+        if entry is None:
+            return None
+        return bisect.bisect_left(self._entries, entry) + 1
+
+@dataclass
+class JobStatistics:
+    """Running score aggregates for one job, updated one evaluation at a time.
+    
+    Like JobRanking, only the latest evaluation of each candidate counts: a
+    re-evaluation first takes the previous one back out of the aggregates.
+    Scores are also kept sorted, so the bounds survive removals with a
+    binary search instead of a rescan.
+    """
+    count: int = 0
+    mean_score: float = 0.0
+    score_m2: float = 0.0  # sum of squared deviations from the mean (Welford)
+    bias_count: int = 0
+    mean_skills_match: float = 0.0
+    mean_experience_match: float = 0.0
+    # candidate id -> (overall_score, skills_match, experience_match, biased) currently counted
+    _latest: Dict[str, Tuple[float, float, float, bool]] = field(default_factory=dict, repr=False)
+    # overall scores currently counted, in ascending order
+    _scores: List[float] = field(default_factory=list, repr=False)
+    
+    def add(self, evaluation: EvaluationResult):
+        """Fold one evaluation into the aggregates, replacing the candidate's previous one."""
+        self.remove(evaluation.candidate_id)
+        values = (evaluation.overall_score, evaluation.skills_match, evaluation.experience_match,
+                  bool(evaluation.bias_indicators))
+        self._latest[evaluation.candidate_id] = values
+        
+        score, skills_match, experience_match, biased = values
+        self.count += 1
+        delta = score - self.mean_score
+        self.mean_score += delta / self.count
+        self.score_m2 += delta * (score - self.mean_score)
+        bisect.insort(self._scores, score)
+        if biased:
+            self.bias_count += 1
+        self.mean_skills_match += (skills_match - self.mean_skills_match) / self.count
+        self.mean_experience_match += (experience_match - self.mean_experience_match) / self.count
+    
+    def remove(self, candidate_id: str):
+        """Take a candidate's evaluation back out of the aggregates (reverse Welford update)."""
+        values = self._latest.pop(candidate_id, None)
+        if values is None:
+            return
+        score, skills_match, experience_match, biased = values
+        
+        self.count -= 1
+        if biased:
+            self.bias_count -= 1
+        del self._scores[bisect.bisect_left(self._scores, score)]
+        if not self.count:
+            self.mean_score = self.score_m2 = self.mean_skills_match = self.mean_experience_match = 0.0
+            return
+        
+        previous_mean = self.mean_score - (score - self.mean_score) / self.count
+        self.score_m2 = max(self.score_m2 - (score - previous_mean) * (score - self.mean_score), 0.0)
+        self.mean_score = previous_mean
+        self.mean_skills_match -= (skills_match - self.mean_skills_match) / self.count
+        self.mean_experience_match -= (experience_match - self.mean_experience_match) / self.count
+    
+    @property
+    def min_score(self) -> float:
+        return self._scores[0] if self._scores else float('inf')
+    
+    @property
+    def max_score(self) -> float:
+        return self._scores[-1] if self._scores else float('-inf')
+    
+    @property
+    def score_std(self) -> float:
+        """Population standard deviation of the overall scores, as np.std computes it."""
+        return float(np.sqrt(self.score_m2 / self.count)) if self.count else 0.0
+    
+    @property
+    def bias_percentage(self) -> float:
+        return (self.bias_count / self.count) * 100 if self.count else 0.0
+
+class StorageBackend(Protocol):
+    """What HiringDatabase needs from a persistent storage backend."""
+    
+    def save_candidates(self, candidates: Iterable[Candidate]): ...
+    
+    def delete_candidate(self, candidate_id: str):
+        """Delete a candidate together with its evaluations."""
+    
+    def save_jobs(self, jobs: Iterable[Job]): ...
+    
+    def save_evaluations(self, evaluations: Iterable[EvaluationResult]): ...
+    
+    def load_candidates(self) -> List[Candidate]: ...
+    
+    def load_jobs(self) -> List[Job]: ...
+    
+    def load_evaluations(self) -> List[EvaluationResult]: ...
+    
+    def find_evaluations(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None,
+                         min_score: Optional[float] = None) -> List[EvaluationResult]: ...
+    
+    def close(self): ...
+
+class SQLiteStorage:
+    """Persistent storage for HiringDatabase on a local SQLite file.
+    
+    The database runs in WAL mode so readers are not blocked by the writer.
+    Evaluations are indexed by job, candidate and score, bulk writes go through
+    executemany in one transaction, and every query uses a fixed SQL string so
+    sqlite3 reuses its prepared statement.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS candidates (
+            id TEXT PRIMARY KEY, name TEXT, email TEXT, resume_text TEXT, skills TEXT,
+            experience_years REAL, education_level TEXT, location TEXT,
+            evaluation_score REAL, bias_detected INTEGER, evaluation_timestamp TEXT
+        );
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY, title TEXT, company TEXT, required_skills TEXT, preferred_skills TEXT,
+            experience_required REAL, education_required TEXT, location TEXT, department TEXT,
+            salary_range TEXT
+        );
+        CREATE TABLE IF NOT EXISTS evaluations (
+            id INTEGER PRIMARY KEY, candidate_id TEXT NOT NULL, job_id TEXT NOT NULL,
+            overall_score REAL, skills_match REAL, experience_match REAL, education_match REAL,
+            location_match REAL, bias_indicators TEXT, recommendations TEXT, timestamp TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_evaluations_job_score ON evaluations (job_id, overall_score DESC);
+        CREATE INDEX IF NOT EXISTS idx_evaluations_job_candidate ON evaluations (job_id, candidate_id);
+        CREATE INDEX IF NOT EXISTS idx_evaluations_candidate ON evaluations (candidate_id);
+        CREATE INDEX IF NOT EXISTS idx_evaluations_score ON evaluations (overall_score);
+    """
+    
+    INSERT_CANDIDATE = "INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    DELETE_CANDIDATE = "DELETE FROM candidates WHERE id = ?"
+    DELETE_CANDIDATE_EVALUATIONS = "DELETE FROM evaluations WHERE candidate_id = ?"
+    INSERT_JOB = "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    INSERT_EVALUATION = """
+        INSERT INTO evaluations (candidate_id, job_id, overall_score, skills_match, experience_match,
+                                 education_match, location_match, bias_indicators, recommendations, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    SELECT_EVALUATION = """
+        SELECT candidate_id, job_id, overall_score, skills_match, experience_match, education_match,
+               location_match, bias_indicators, recommendations, timestamp FROM evaluations
+    """
+    FILTERS = {
+        'candidate_id': "candidate_id = ?",
+        'job_id': "job_id = ?",
+        'min_score': "overall_score >= ?"
+    }
+    
+    def __init__(self, path: str = "hiring.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+        self.connection.commit()
+    
+    def close(self):
+        self.connection.close()
+    
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value is not None else None
+    
+    @staticmethod
+    def _datetime(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value is not None else None
+    
+    def _candidate_row(self, c: Candidate) -> tuple:
+        return (c.id, c.name, c.email, c.resume_text, json.dumps(c.skills), c.experience_years,
+                c.education_level, c.location, c.evaluation_score, int(c.bias_detected),
+                self._timestamp(c.evaluation_timestamp))
+    
+    def _evaluation_row(self, e: EvaluationResult) -> tuple:
+        return (e.candidate_id, e.job_id, e.overall_score, e.skills_match, e.experience_match,
+                e.education_match, e.location_match, json.dumps(e.bias_indicators),
+                json.dumps(e.recommendations), self._timestamp(e.timestamp))
+    
+    def _write(self, sql: str, rows: List[tuple]):
+        with self._lock, self.connection:
+            self.connection.executemany(sql, rows)
+    
+    def save_candidates(self, candidates: Iterable[Candidate]):
+        self._write(self.INSERT_CANDIDATE, [self._candidate_row(c) for c in candidates])
+    
+    def delete_candidate(self, candidate_id: str):
+        # Drop the evaluations as well, or a reload would put the candidate back into rankings
+        with self._lock, self.connection:
+            self.connection.execute(self.DELETE_CANDIDATE_EVALUATIONS, (candidate_id,))
+            self.connection.execute(self.DELETE_CANDIDATE, (candidate_id,))
+    
+    def save_jobs(self, jobs: Iterable[Job]):
+        self._write(self.INSERT_JOB, [
+            (j.id, j.title, j.company, json.dumps(j.required_skills), json.dumps(j.preferred_skills),
+             j.experience_required, j.education_required, j.location, j.department,
+             json.dumps(list(j.salary_range)))
+            for j in jobs
+        ])
+    
+    def save_evaluations(self, evaluations: Iterable[EvaluationResult]):
+        self._write(self.INSERT_EVALUATION, [self._evaluation_row(e) for e in evaluations])
+    
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+    
+    def load_candidates(self) -> List[Candidate]:
+        return [
+            Candidate(id=row[0], name=row[1], email=row[2], resume_text=row[3], skills=json.loads(row[4]),
+                      experience_years=row[5], education_level=row[6], location=row[7],
+                      evaluation_score=row[8], bias_detected=bool(row[9]),
+                      evaluation_timestamp=self._datetime(row[10]))
+            for row in self._query("SELECT * FROM candidates ORDER BY rowid")
+        ]
+    
+    def load_jobs(self) -> List[Job]:
+        return [
+            Job(id=row[0], title=row[1], company=row[2], required_skills=json.loads(row[3]),
+                preferred_skills=json.loads(row[4]), experience_required=row[5], education_required=row[6],
+                location=row[7], department=row[8], salary_range=tuple(json.loads(row[9])))
+            for row in self._query("SELECT * FROM jobs ORDER BY rowid")
+        ]
+    
+    def _evaluation(self, row: tuple) -> EvaluationResult:
+        return EvaluationResult(
+            candidate_id=row[0], job_id=row[1], overall_score=row[2], skills_match=row[3],
+            experience_match=row[4], education_match=row[5], location_match=row[6],
+            bias_indicators=json.loads(row[7]), recommendations=json.loads(row[8]),
+            timestamp=self._datetime(row[9])
+        )
+    
+    def load_evaluations(self) -> List[EvaluationResult]:
+        return [self._evaluation(row) for row in self._query(self.SELECT_EVALUATION + " ORDER BY id")]
+    
+    def find_evaluations(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None,
+                         min_score: Optional[float] = None) -> List[EvaluationResult]:
+        """Evaluations matching every given filter, in insertion order."""
+        filters = {'candidate_id': candidate_id, 'job_id': job_id, 'min_score': min_score}
+        clauses = [self.FILTERS[name] for name, value in filters.items() if value is not None]
+        params = tuple(value for value in filters.values() if value is not None)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return [self._evaluation(row) for row in self._query(self.SELECT_EVALUATION + where + " ORDER BY id", params)]
+
+
+class HiringDatabase:
+    """Database management for candidates, jobs, and evaluations.
+    
+    Records live in memory for fast lookups. With a storage backend such as
+    SQLiteStorage, existing records are loaded on start and every write is
+    also persisted. Top-k queries are answered by the in-memory JobRanking,
+    which every write keeps current. Writes are serialized by a lock, so
+    background workers can store results while requests are being served.
+    """
+    
+    def __init__(self, storage: Optional[StorageBackend] = None, gazetteer: Optional[Gazetteer] = None):
         self.candidates = {}
         self.jobs = {}
-        self.evaluations = []
+        self.evaluations = EvaluationStore()
+        
+        # Serializes writes, which may come from the event loop and worker threads at once
+        self._lock = threading.RLock()
+        
+        # Incremented by every write, so derived results can be cached per version
+        self.version = 0
+        
+        # (str(id), id) pairs in sorted order, for keyset pagination
+        self._candidate_order = []
+        self._job_order = []
+        
+        # Per-job score rankings and report aggregates maintained by add_evaluation
+        self.rankings = {}
+        self.job_statistics = {}
+        
+        # Inverted index: lowercased skill -> ids of candidates listing it
+        self.skill_index = {}
+        self._indexed_skills = {}  # candidate id -> skills currently in the index
+        
+        # Gazetteer location id -> ids of candidates located there
+        self.gazetteer = gazetteer if gazetteer is not None else default_gazetteer()
+        self.location_index = {}
+        self._indexed_locations = {}  # candidate id -> location id currently in the index
+        
+        self.storage = None
+        if storage is not None:
+            for candidate in storage.load_candidates():
+                self.add_candidate(candidate)
+            for job in storage.load_jobs():
+                self.add_job(job)
+            self.add_evaluations(storage.load_evaluations())
+            self.storage = storage
+    
+    def touch(self):
+        """Bump the write version, e.g. after editing a record in place."""
+        with self._lock:
+            self.version += 1
     
     def add_candidate(self, candidate: Candidate):
         """Add a new candidate to the database."""
-        self.candidates[candidate.id] = candidate
-        logger.info(f"Added candidate: {candidate.name}")
+        with self._lock:
+            if candidate.id in self.candidates:
+                self._unindex_skills(candidate.id)
+            else:
+                bisect.insort(self._candidate_order, (str(candidate.id), candidate.id))
+            self.candidates[candidate.id] = candidate
+            self._index_skills(candidate)
+            self._index_location(candidate)
+            self.touch()
+            if self.storage:
+                self.storage.save_candidates([candidate])
+            logger.info(f"Added candidate: {candidate.name}")
+    
+    def add_candidates(self, candidates: Iterable[Candidate]):
+        """Add a batch of candidates with one skill index update and one bulk write."""
+        candidates = list(candidates)
+        with self._lock:
+            postings = {}
+            new_ids = []
+            for candidate in candidates:
+                if candidate.id in self.candidates:
+                    self._unindex_skills(candidate.id)
+                else:
+                    new_ids.append(candidate.id)
+                self.candidates[candidate.id] = candidate
+                skills = frozenset(map(str.lower, candidate.skills))
+                for skill in skills:
+                    postings.setdefault(skill, []).append(candidate.id)
+                self._indexed_skills[candidate.id] = skills
+                self._index_location(candidate)
+            for skill, candidate_ids in postings.items():
+                self.skill_index.setdefault(skill, set()).update(candidate_ids)
+            self._extend_order(self._candidate_order, new_ids)
+            self.touch()
+            
+            if self.storage and candidates:
+                self.storage.save_candidates(candidates)
+            logger.info(f"Added {len(candidates)} candidates")
+    
+    def update_candidate(self, candidate: Candidate):
+        """Store an edited candidate and refresh its skill postings."""
+        with self._lock:
+            self.candidates[candidate.id] = candidate
+            self._reindex_skills(candidate)
+            self._index_location(candidate)
+            self.touch()
+            if self.storage:
+                self.storage.save_candidates([candidate])
+    
+    def remove_candidate(self, candidate_id: str) -> Optional[Candidate]:
+        """Remove a candidate from the database and the skill index."""
+        with self._lock:
+            candidate = self.candidates.pop(candidate_id, None)
+            if candidate is not None:
+                self._remove_order(self._candidate_order, candidate.id)
+                self._unindex_skills(candidate_id)
+                self._unindex_location(candidate_id)
+                for ranking in self.rankings.values():
+                    ranking.remove(candidate_id)
+                for stats in self.job_statistics.values():
+                    stats.remove(candidate_id)
+                self.evaluations.remove_candidate(candidate_id)
+                self.touch()
+                if self.storage:
+                    self.storage.delete_candidate(candidate_id)
+                logger.info(f"Removed candidate: {candidate.name}")
+            return candidate
+    
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        return self.jobs.get(job_id)
+    
+    def update_job(self, job: Job):
+        """Store an edited job posting."""
+        with self._lock:
+            self.jobs[job.id] = job
+            self.touch()
+            if self.storage:
+                self.storage.save_jobs([job])
+    
+    def find_evaluations(self, candidate_id: Optional[str] = None, job_id: Optional[str] = None,
+                         min_score: Optional[float] = None) -> List[EvaluationResult]:
+        """Evaluations matching every given filter, in insertion order.
+        
+        Answered by the storage backend's indexed query when one is configured,
+        otherwise from the in-memory store's indexes.
+        """
+        if self.storage:
+            return self.storage.find_evaluations(candidate_id=candidate_id, job_id=job_id, min_score=min_score)
+        rows = self.evaluations.rows(candidate_id=candidate_id, job_id=job_id)
+        if min_score is not None:
+            rows = rows[self.evaluations.column('overall_score', rows) >= min_score]
+        return [self.evaluations[int(row)] for row in rows]
+    
+    def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
+        """Get a candidate by id."""
+        return self.candidates.get(candidate_id)
+    
+    @staticmethod
+    def _extend_order(order: List, new_ids: List):
+        entries = [(str(record_id), record_id) for record_id in new_ids]
+        if len(entries) > 64:
+            # Bulk inserts: one sort beats many list insertions
+            order.extend(entries)
+            order.sort()
+        else:
+            for entry in entries:
+                bisect.insort(order, entry)
+    
+    @staticmethod
+    def _remove_order(order: List, record_id):
+        del order[bisect.bisect_left(order, (str(record_id),))]
+    
+    @staticmethod
+    def _order_start(order: List, after: Optional[str]) -> int:
+        """Position of the first id sorting after the cursor id."""
+        if after is None:
+            return 0
+        key = str(after)
+        start = bisect.bisect_left(order, (key,))
+        while start < len(order) and order[start][0] == key:
+            start += 1
+        return start
+    
+    def iter_candidates(self, after: Optional[str] = None) -> Iterator[Candidate]:
+        """Candidates ordered by id, starting after the cursor id."""
+        order = self._candidate_order
+        for position in range(self._order_start(order, after), len(order)):
+            yield self.candidates[order[position][1]]
+    
+    def iter_jobs(self, after: Optional[str] = None) -> Iterator[Job]:
+        """Jobs ordered by id, starting after the cursor id."""
+        order = self._job_order
+        for position in range(self._order_start(order, after), len(order)):
+            yield self.jobs[order[position][1]]
+    
+    def get_all_candidates(self) -> List[Candidate]:
+        """Get all candidates in insertion order."""
+        return list(self.candidates.values())
+    
+    def find_candidates_by_skills(self, skills: List[str], match_all: bool = False) -> List[Candidate]:
+        """Find candidates listing any (or, with match_all, every) of the given skills.
+        
+        Answered from the skill posting lists, so the cost follows the size of the
+        postings involved rather than the number of candidates. Results are
+        ordered by candidate id.
+        """
+        postings = [self.skill_index.get(skill.strip().lower(), set()) for skill in skills]
+        if not postings:
+            return []
+        
+        if match_all:
+            # Intersect smallest first so the working set only shrinks
+            postings.sort(key=len)
+            candidate_ids = set(postings[0])
+            for posting in postings[1:]:
+                if not candidate_ids:
+                    break
+                candidate_ids &= posting
+        else:
+            candidate_ids = set().union(*postings)
+        
+        return [self.candidates[candidate_id] for candidate_id in sorted(candidate_ids, key=str)]
+    
+    def skills_filter(self, skills: List[str], match_all: bool = False) -> Callable[[Candidate], bool]:
+        """A predicate matching what find_candidates_by_skills would return.
+        
+        Each check is a few posting lookups, so a paginated listing can walk
+        candidates in id order and stop once its page is full.
+        """
+        postings = [self.skill_index.get(skill.strip().lower(), set()) for skill in skills]
+        if not postings:
+            return lambda candidate: False
+        if match_all:
+            # Smallest posting first, so most misses are found on the first lookup
+            postings.sort(key=len)
+            return lambda candidate: all(candidate.id in posting for posting in postings)
+        postings.sort(key=len, reverse=True)
+        return lambda candidate: any(candidate.id in posting for posting in postings)
+    
+    def _index_skills(self, candidate: Candidate):
+        skills = frozenset(skill.lower() for skill in candidate.skills)
+        for skill in skills:
+            self.skill_index.setdefault(skill, set()).add(candidate.id)
+        self._indexed_skills[candidate.id] = skills
+    
+    def _unindex_skills(self, candidate_id: str):
+        for skill in self._indexed_skills.pop(candidate_id, ()):
+            posting = self.skill_index[skill]
+            posting.discard(candidate_id)
+            if not posting:
+                del self.skill_index[skill]
+    
+    def _reindex_skills(self, candidate: Candidate):
+        """Update the postings of a candidate whose skills may have changed in place."""
+        skills = frozenset(skill.lower() for skill in candidate.skills)
+        if skills != self._indexed_skills.get(candidate.id):
+            self._unindex_skills(candidate.id)
+            self._index_skills(candidate)
+    
+    def _index_location(self, candidate: Candidate):
+        """Post a candidate under the gazetteer id of its current location."""
+        location_id = self.gazetteer.resolve(candidate.location)
+        if self._indexed_locations.get(candidate.id, -1) == location_id:
+            return
+        self._unindex_location(candidate.id)
+        self._indexed_locations[candidate.id] = location_id
+        if location_id is not None:
+            self.location_index.setdefault(location_id, set()).add(candidate.id)
+    
+    def _unindex_location(self, candidate_id: str):
+        location_id = self._indexed_locations.pop(candidate_id, None)
+        if location_id is not None:
+            posting = self.location_index[location_id]
+            posting.discard(candidate_id)
+            if not posting:
+                del self.location_index[location_id]
+    
+    def find_candidates_by_location(self, location: str, radius_km: float = 0.0) -> List[Candidate]:
+        """Find candidates in a city, or within radius_km of it.
+        
+        Known cities are answered from the location index and the gazetteer's
+        grid. Locations the gazetteer does not know fall back to a substring
+        scan. Results are ordered by candidate id.
+        """
+        location_id = self.gazetteer.resolve(location)
+        if location_id is None:
+            needle = location.lower()
+            return sorted((c for c in self.candidates.values() if needle in c.location.lower()), key=lambda c: str(c.id))
+        
+        location_ids = self.gazetteer.near(location_id, radius_km) if radius_km > 0 else [location_id]
+        candidate_ids = set().union(*(self.location_index.get(i, ()) for i in location_ids))
+        return [self.candidates[candidate_id] for candidate_id in sorted(candidate_ids, key=str)]
+    
+    def location_filter(self, location: str, radius_km: float = 0.0) -> Callable[[Candidate], bool]:
+        """A predicate matching what find_candidates_by_location would return."""
+        location_id = self.gazetteer.resolve(location)
+        if location_id is None:
+            needle = location.lower()
+            return lambda candidate: needle in candidate.location.lower()
+        location_ids = set(self.gazetteer.near(location_id, radius_km)) if radius_km > 0 else {location_id}
+        return lambda candidate: self._indexed_locations.get(candidate.id) in location_ids
     
     def add_job(self, job: Job):
         """Add a new job posting to the database."""
-        self.jobs[job.id] = job
-        logger.info(f"Added job: {job.title} at {job.company}")
+        with self._lock:
+            if job.id not in self.jobs:
+                bisect.insort(self._job_order, (str(job.id), job.id))
+            self.jobs[job.id] = job
+            self.touch()
+            if self.storage:
+                self.storage.save_jobs([job])
+            logger.info(f"Added job: {job.title} at {job.company}")
+    
+    def add_jobs(self, jobs: Iterable[Job]):
+        """Add a batch of job postings with one bulk write."""
+        jobs = list(jobs)
+        with self._lock:
+            self._extend_order(self._job_order, list(dict.fromkeys(job.id for job in jobs if job.id not in self.jobs)))
+            for job in jobs:
+                self.jobs[job.id] = job
+            self.touch()
+            if self.storage and jobs:
+                self.storage.save_jobs(jobs)
+            logger.info(f"Added {len(jobs)} jobs")
     
     def add_evaluation(self, evaluation: EvaluationResult):
         """Add evaluation result to the database."""
+        with self._lock:
+            candidate = self._apply_evaluation(evaluation)
+            self.touch()
+            if self.storage:
+                self.storage.save_evaluations([evaluation])
+                if candidate is not None:
+                    self.storage.save_candidates([candidate])
+            logger.info(f"Added evaluation for candidate {evaluation.candidate_id}")
+    
+    def add_evaluations(self, evaluations: Iterable[EvaluationResult]):
+        """Add a batch of evaluation results, persisting them in one bulk write."""
+        evaluations = list(evaluations)
+        with self._lock:
+            candidates = {}
+            for evaluation in evaluations:
+                candidate = self._apply_evaluation(evaluation)
+                if candidate is not None:
+                    candidates[candidate.id] = candidate
+            self.touch()
+            if self.storage and evaluations:
+                self.storage.save_evaluations(evaluations)
+                self.storage.save_candidates(candidates.values())
+            logger.info(f"Added {len(evaluations)} evaluations")
+    
+    def _apply_evaluation(self, evaluation: EvaluationResult) -> Optional[Candidate]:
         self.evaluations.append(evaluation)
-        logger.info(f"Added evaluation for candidate {evaluation.candidate_id}")
+        self.rankings.setdefault(evaluation.job_id, JobRanking()).update(
+            evaluation.candidate_id, evaluation.overall_score
+        )
+        self.job_statistics.setdefault(evaluation.job_id, JobStatistics()).add(evaluation)
+        
+        # Evaluation may have filled in skills parsed from the resume
+        candidate = self.candidates.get(evaluation.candidate_id)
+        if candidate is not None:
+            self._reindex_skills(candidate)
+            self._index_location(candidate)
+        return candidate
     
     def get_top_candidates(self, job_id: str, limit: int = 5) -> List[Tuple[Candidate, float]]:
         """Get top candidates for a specific job based on evaluation scores."""
-        job_evaluations = [e for e in self.evaluations if e.job_id == job_id]
-        job_evaluations.sort(key=lambda x: x.overall_score, reverse=True)
+        ranking = self.rankings.get(job_id)
+        if ranking is None:
+            return []
         
+        # Latest evaluation per candidate, best first
         top_candidates = []
-        for eval_result in job_evaluations[:limit]:
-            candidate = self.candidates.get(eval_result.candidate_id)
+        for candidate_id, score in ranking:
+            if len(top_candidates) >= limit:
+                break
+            candidate = self.candidates.get(candidate_id)
             if candidate:
-                top_candidates.append((candidate, eval_result.overall_score))
+                top_candidates.append((candidate, score))
         
         return top_candidates
     
+    def get_candidate_rank(self, job_id: str, candidate_id: str) -> Optional[int]:
+        """1-based rank of a candidate among everyone evaluated for a job."""
+        ranking = self.rankings.get(job_id)
+        return ranking.rank(candidate_id) if ranking else None
+    
+    @staticmethod
+    def _candidate_record(c: Candidate) -> Dict:
+        return {
+            'name': c.name,
+            'email': c.email,
+            'skills': c.skills,
+            'experience_years': c.experience_years,
+            'education_level': c.education_level,
+            'location': c.location,
+            'evaluation_score': c.evaluation_score,
+            'bias_detected': c.bias_detected
+        }
+    
+    @staticmethod
+    def _job_record(j: Job) -> Dict:
+        return {
+            'title': j.title,
+            'company': j.company,
+            'required_skills': j.required_skills,
+            'experience_required': j.experience_required,
+            'education_required': j.education_required,
+            'location': j.location
+        }
+    
+    @staticmethod
+    def _evaluation_record(e: EvaluationResult) -> Dict:
+        return {
+            'candidate_id': e.candidate_id,
+            'job_id': e.job_id,
+            'overall_score': e.overall_score,
+            'skills_match': e.skills_match,
+            'experience_match': e.experience_match,
+            'education_match': e.education_match,
+            'location_match': e.location_match,
+            'bias_indicators': e.bias_indicators,
+            'recommendations': e.recommendations,
+            'timestamp': e.timestamp.isoformat()
+        }
+    
     def export_data(self, filename: str):
         """Export data to JSON format for analysis."""
         data = {
-            'candidates': {cid: {
-                'name': c.name,
-                'email': c.email,
-                'skills': c.skills,
-                'experience_years': c.experience_years,
-                'education_level': c.education_level,
-                'location': c.location,
-                'evaluation_score': c.evaluation_score,
-                'bias_detected': c.bias_detected
-            } for cid, c in self.candidates.items()},
-            'jobs': {jid: {
-                'title': j.title,
-                'company': j.company,
-                'required_skills': j.required_skills,
-                'experience_required': j.experience_required,
-                'education_required': j.education_required,
-                'location': j.location
-            } for jid, j in self.jobs.items()},
-            'evaluations': [{
-                'candidate_id': e.candidate_id,
-                'job_id': e.job_id,
-                'overall_score': e.overall_score,
-                'skills_match': e.skills_match,
-                'experience_match': e.evaluation_match,
-                'education_match': e.education_match,
-                'location_match': e.location_match,
-                'bias_indicators': e.bias_indicators,
-                'recommendations': e.recommendations,
-                'timestamp': e.timestamp.isoformat()
-            } for e in self.evaluations]
+            'candidates': {cid: self._candidate_record(c) for cid, c in self.candidates.items()},
+            'jobs': {jid: self._job_record(j) for jid, j in self.jobs.items()},
+            'evaluations': [self._evaluation_record(e) for e in self.evaluations]
         }
         
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
         
         logger.info(f"Data exported to {filename}")
+    
+    EXPORT_EVALUATION_COLUMNS = ('candidate_code', 'job_code') + EvaluationStore.SCORE_COLUMNS + ('bias_detected', 'timestamp')
+    
+    def candidate_features(self) -> Dict[str, np.ndarray]:
+        """Numeric and categorical candidate features as NumPy columns."""
+        candidates = list(self.candidates.values())
+        return {
+            'id': np.array([c.id for c in candidates], dtype=str),
+            'experience_years': np.array([c.experience_years for c in candidates], dtype=np.float64),
+            'education_level': np.array([c.education_level for c in candidates], dtype=str),
+            'location': np.array([c.location for c in candidates], dtype=str),
+            'skill_count': np.array([len(c.skills) for c in candidates], dtype=np.int32),
+            'evaluation_score': np.array([c.evaluation_score for c in candidates], dtype=np.float64),
+            'bias_detected': np.array([c.bias_detected for c in candidates], dtype=bool)
+        }
+    
+    def export_columnar(self, directory: str, parquet: Optional[bool] = None) -> List[str]:
+        """Export evaluations and candidate features as columnar files.
+        
+        Every column is written as its own .npy file under directory/evaluations
+        and directory/candidates, so consumers can memory-map it with
+        np.load(path, mmap_mode='r'). Evaluation ids are stored as integer codes
+        plus candidate_ids.npy and job_ids.npy lookup tables. Parquet files are
+        written as well when pyarrow is installed (or when parquet is True).
+        Returns the paths written.
+        """
+        tables = {
+            'evaluations': {name: self.evaluations.column(name) for name in self.EXPORT_EVALUATION_COLUMNS},
+            'candidates': self.candidate_features()
+        }
+        tables['evaluations']['candidate_ids'] = np.array(self.evaluations.candidate_ids, dtype=str)
+        tables['evaluations']['job_ids'] = np.array(self.evaluations.job_ids, dtype=str)
+        
+        paths = []
+        for table, columns in tables.items():
+            os.makedirs(os.path.join(directory, table), exist_ok=True)
+            for name, column in columns.items():
+                path = os.path.join(directory, table, f"{name}.npy")
+                np.save(path, column)
+                paths.append(path)
+        
+        if parquet is None:
+            try:
+                import pyarrow  # noqa: F401
+                parquet = True
+            except ImportError:
+                logger.info("pyarrow not installed, skipping Parquet export")
+                parquet = False
+        if parquet:
+            frames = {'evaluations': self.evaluations.to_dataframe(), 'candidates': pd.DataFrame(tables['candidates'])}
+            for table, frame in frames.items():
+                path = os.path.join(directory, f"{table}.parquet")
+                frame.to_parquet(path, engine='pyarrow', index=False)
+                paths.append(path)
+        
+        logger.info(f"Exported {len(self.evaluations)} evaluations and {len(self.candidates)} candidates to {directory}")
+        return paths
+    
+    def iter_export_records(self) -> Iterator[Dict]:
+        """Yield every candidate, job and evaluation as a flat record tagged with its type."""
+        for cid, c in self.candidates.items():
+            yield {'type': 'candidate', 'id': cid, **self._candidate_record(c)}
+        for jid, j in self.jobs.items():
+            yield {'type': 'job', 'id': jid, **self._job_record(j)}
+        for e in self.evaluations:
+            yield {'type': 'evaluation', **self._evaluation_record(e)}
+    
+    def export_jsonl(self, filename: str, compress: Optional[bool] = None,
+                     buffer_size: int = 1024 * 1024) -> int:
+        """Stream data to a JSON Lines file, one record per line.
+        
+        Records are serialized one at a time into a buffered writer, so memory
+        stays flat however large the database is. The output is gzip-compressed
+        when compress is True, or by default when filename ends in .gz.
+        Returns the number of records written.
+        """
+        if compress is None:
+            compress = filename.endswith('.gz')
+        
+        start = time.perf_counter()
+        count = 0
+        if compress:
+            f = io.BufferedWriter(gzip.open(filename, 'wb', compresslevel=6), buffer_size)
+        else:
+            f = open(filename, 'wb', buffering=buffer_size)
+        with f:
+            encode = json.JSONEncoder(separators=(',', ':')).encode
+            for record in self.iter_export_records():
+                f.write(encode(record).encode('utf-8'))
+                f.write(b'\n')
+                count += 1
+        
+        elapsed = time.perf_counter() - start
+        logger.info(f"Exported {count} records to {filename} ({count / max(elapsed, 1e-9):.0f} records/sec)")
+        return count
+
+@dataclass
+class BulkLoadReport:
+    """Outcome of a bulk load: rows loaded, elapsed time and peak resident memory."""
+    rows: int
+    chunks: int
+    seconds: float
+    peak_rss_mb: float
+    
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB, or 0.0 where it cannot be read."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+# Column defaults for bulk loading; missing columns and empty cells take these values
+CANDIDATE_DEFAULTS = {
+    'name': '', 'email': '', 'resume_text': '', 'skills': None,
+    'experience_years': 0.0, 'education_level': '', 'location': ''
+}
+JOB_DEFAULTS = {
+    'title': '', 'company': '', 'required_skills': None, 'preferred_skills': None,
+    'experience_required': 0.0, 'education_required': '', 'location': '', 'department': '',
+    'salary_min': 0.0, 'salary_max': 0.0
+}
+
+def _read_chunks(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    name = path[:-3] if path.endswith('.gz') else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == '.csv':
+        return pd.read_csv(path, chunksize=chunksize, dtype={'id': str}, keep_default_na=False)
+    if extension in ('.jsonl', '.ndjson'):
+        return pd.read_json(path, lines=True, chunksize=chunksize, dtype={'id': str})
+    raise ValueError(f"Unsupported bulk load format: {path}")
+
+def _list_column(chunk: pd.DataFrame, name: str, separator: str) -> List[List[str]]:
+    """A list-valued column: native lists from JSONL, separator-joined strings from CSV."""
+    if name not in chunk:
+        return [[] for _ in range(len(chunk))]
+    column = chunk[name]
+    values = column.tolist()
+    if any(isinstance(value, list) for value in values):
+        return [value if isinstance(value, list) else [] for value in values]
+    values = column.fillna('').astype(str).tolist()
+    return [[item for item in map(str.strip, value.split(separator)) if item] for value in values]
+
+def _scalar_column(chunk: pd.DataFrame, name: str, default) -> list:
+    if name not in chunk:
+        return [default] * len(chunk)
+    column = chunk[name]
+    if isinstance(default, float):
+        return pd.to_numeric(column, errors='coerce').fillna(default).astype(float).tolist()
+    return column.fillna(default).astype(str).tolist()
+
+def _candidates_from_chunk(chunk: pd.DataFrame, separator: str) -> List[Candidate]:
+    columns = {name: _scalar_column(chunk, name, default)
+               for name, default in CANDIDATE_DEFAULTS.items() if default is not None}
+    skills = _list_column(chunk, 'skills', separator)
+    return [
+        Candidate(id=candidate_id, name=name, email=email, resume_text=resume_text, skills=candidate_skills,
+                  experience_years=experience_years, education_level=education_level, location=location)
+        for candidate_id, name, email, resume_text, candidate_skills, experience_years, education_level, location
+        in zip(chunk['id'].astype(str).tolist(), columns['name'], columns['email'], columns['resume_text'], skills,
+               columns['experience_years'], columns['education_level'], columns['location'])
+    ]
+
+def _jobs_from_chunk(chunk: pd.DataFrame, separator: str) -> List[Job]:
+    columns = {name: _scalar_column(chunk, name, default)
+               for name, default in JOB_DEFAULTS.items() if default is not None}
+    required = _list_column(chunk, 'required_skills', separator)
+    preferred = _list_column(chunk, 'preferred_skills', separator)
+    if 'salary_range' in chunk:
+        salary_ranges = [tuple(value) if isinstance(value, list) else (0.0, 0.0) for value in chunk['salary_range']]
+    else:
+        salary_ranges = list(zip(columns['salary_min'], columns['salary_max']))
+    return [
+        Job(id=job_id, title=title, company=company, required_skills=required_skills,
+            preferred_skills=preferred_skills, experience_required=experience_required,
+            education_required=education_required, location=location, department=department,
+            salary_range=salary_range)
+        for job_id, title, company, required_skills, preferred_skills, experience_required,
+            education_required, location, department, salary_range
+        in zip(chunk['id'].astype(str).tolist(), columns['title'], columns['company'], required, preferred,
+               columns['experience_required'], columns['education_required'], columns['location'],
+               columns['department'], salary_ranges)
+    ]
+
+def bulk_load(database: 'HiringDatabase', path: str, record_type: str = 'candidates',
+              chunksize: int = 50000, list_separator: str = ';') -> BulkLoadReport:
+    """Load candidates or jobs from a CSV or JSON Lines file (optionally .gz) in chunks.
+    
+    Each chunk is read by pandas, turned into records column by column and
+    inserted with a single add_candidates/add_jobs call. In CSV files,
+    list fields such as skills are joined with list_separator. Jobs take
+    their salary range from a salary_range list or salary_min/salary_max.
+    """
+    if record_type == 'candidates':
+        build, insert = _candidates_from_chunk, database.add_candidates
+    elif record_type == 'jobs':
+        build, insert = _jobs_from_chunk, database.add_jobs
+    else:
+        raise ValueError(f"Unknown record type: {record_type}")
+    
+    start = time.perf_counter()
+    rows = chunks = 0
+    for chunk in _read_chunks(path, chunksize):
+        if 'id' not in chunk:
+            raise ValueError(f"{path} has no 'id' column")
+        records = build(chunk, list_separator)
+        insert(records)
+        rows += len(records)
+        chunks += 1
+    
+    report = BulkLoadReport(rows=rows, chunks=chunks, seconds=time.perf_counter() - start, peak_rss_mb=_peak_rss_mb())
+    logger.info(f"Loaded {rows} {record_type} from {path} in {report.seconds:.2f}s "
+                f"({report.rows_per_second:.0f} rows/sec, peak RSS {report.peak_rss_mb:.0f}MB)")
+    return report
+
+def load_columnar_export(directory: str, mmap_mode: Optional[str] = 'r') -> Dict[str, Dict[str, np.ndarray]]:
+    """Load the .npy columns written by HiringDatabase.export_columnar, memory-mapped by default."""
+    tables = {}
+    for table in ('evaluations', 'candidates'):
+        table_dir = os.path.join(directory, table)
+        tables[table] = {
+            entry.name[:-4]: np.load(entry.path, mmap_mode=mmap_mode)
+            for entry in os.scandir(table_dir) if entry.name.endswith('.npy')
+        }
+    return tables
 
 # ============================================================================
 # ANALYTICS AND REPORTING
@@ -447,46 +2896,193 @@ class HiringAnalytics:
     
     def __init__(self, database: HiringDatabase):
         self.db = database
+        
+        # Results computed at the database version in _cache_version
+        self._cache = {}
+        self._cache_version = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._lock = threading.Lock()
+    
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return compute() for key, reusing the result until the database is written to.
+        
+        Cached results are shared between callers and must not be mutated.
+        """
+        with self._lock:
+            version = self.db.version
+            if self._cache_version != version:
+                self._cache = {}
+                self._cache_version = version
+            if key in self._cache:
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+        
+        # Computed outside the lock so slow reports don't hold up other lookups
+        result = compute()
+        with self._lock:
+            # Don't keep a result that a write during compute() may have made stale
+            if self.db.version == version and self._cache_version == version:
+                self._cache[key] = result
+        return result
+    
+    def cache_stats(self) -> Dict:
+        """Hit and miss counts of the analytics cache."""
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'hit_rate': self.cache_hits / lookups if lookups else 0.0,
+                'entries': len(self._cache),
+                'version': self.db.version
+            }
     
     def generate_hiring_report(self, job_id: str) -> Dict:
         """Generate comprehensive hiring report with AI insights."""
+        return self.cached(('hiring_report', job_id), lambda: self._build_hiring_report(job_id))
+    
+    def generate_dashboard_insights(self) -> Dict:
+        """Headline numbers across all candidates, jobs and evaluations."""
+        return self.cached('dashboard', self._build_dashboard_insights)
+    
+    def generate_candidate_insights(self) -> Dict:
+        """How the candidate pool breaks down by skills, education, experience and location."""
+        return self.cached('candidate', self._build_candidate_insights)
+    
+    def generate_job_insights(self) -> Dict:
+        """Per-job evaluation summaries and the skills jobs ask for most."""
+        return self.cached('job', self._build_job_insights)
+    
+    def generate_bias_insights(self) -> Dict:
+        """Bias detection rates overall and per job."""
+        return self.cached('bias', self._build_bias_insights)
+    
+    def _evaluated_statistics(self) -> List[Tuple[Job, JobStatistics]]:
+        """Jobs with at least one counted evaluation, with their running aggregates."""
+        statistics = []
+        for job in list(self.db.jobs.values()):
+            stats = self.db.job_statistics.get(job.id)
+            if stats is not None and stats.count:
+                statistics.append((job, stats))
+        return statistics
+    
+    def _build_dashboard_insights(self) -> Dict:
+        statistics = self._evaluated_statistics()
+        scored = sum(stats.count for _, stats in statistics)
+        biased = sum(stats.bias_count for _, stats in statistics)
+        return {
+            'total_candidates': len(self.db.candidates),
+            'total_jobs': len(self.db.jobs),
+            'total_evaluations': len(self.db.evaluations),
+            'evaluated_jobs': len(statistics),
+            'average_score': sum(stats.mean_score * stats.count for _, stats in statistics) / scored if scored else 0.0,
+            'bias_percentage': (biased / scored) * 100 if scored else 0.0,
+            'top_jobs': [
+                {'job_id': job.id, 'title': job.title, 'candidates': stats.count, 'average_score': stats.mean_score}
+                for job, stats in sorted(statistics, key=lambda item: item[1].mean_score, reverse=True)[:5]
+            ]
+        }
+    
+    def _build_candidate_insights(self) -> Dict:
+        candidates = list(self.db.candidates.values())
+        experience = np.array([c.experience_years for c in candidates], dtype=float)
+        education = {}
+        locations = {}
+        for candidate in candidates:
+            level = candidate.education_level or 'unknown'
+            education[level] = education.get(level, 0) + 1
+            if candidate.location:
+                locations[candidate.location] = locations.get(candidate.location, 0) + 1
+        top_skills = sorted(((skill, len(ids)) for skill, ids in list(self.db.skill_index.items()) if ids),
+                            key=lambda item: (-item[1], item[0]))[:10]
+        return {
+            'total_candidates': len(candidates),
+            'experience': {
+                'average': float(experience.mean()) if len(experience) else 0.0,
+                'median': float(np.median(experience)) if len(experience) else 0.0,
+                'min': float(experience.min()) if len(experience) else 0.0,
+                'max': float(experience.max()) if len(experience) else 0.0
+            },
+            'education_distribution': education,
+            'top_locations': dict(sorted(locations.items(), key=lambda item: (-item[1], item[0]))[:10]),
+            'top_skills': dict(top_skills),
+            'evaluated_candidates': sum(1 for c in candidates if c.evaluation_timestamp is not None)
+        }
+    
+    def _build_job_insights(self) -> Dict:
+        jobs = list(self.db.jobs.values())
+        departments = {}
+        requested_skills = {}
+        for job in jobs:
+            departments[job.department] = departments.get(job.department, 0) + 1
+            for skill in {skill.lower() for skill in job.required_skills}:
+                requested_skills[skill] = requested_skills.get(skill, 0) + 1
+        statistics = {job.id: stats for job, stats in self._evaluated_statistics()}
+        return {
+            'total_jobs': len(jobs),
+            'department_distribution': departments,
+            'most_requested_skills': dict(sorted(requested_skills.items(), key=lambda item: (-item[1], item[0]))[:10]),
+            'jobs': [
+                {
+                    'job_id': job.id,
+                    'title': job.title,
+                    'department': job.department,
+                    'evaluated_candidates': statistics[job.id].count if job.id in statistics else 0,
+                    'average_score': statistics[job.id].mean_score if job.id in statistics else None,
+                    'max_score': statistics[job.id].max_score if job.id in statistics else None
+                } for job in jobs
+            ]
+        }
+    
+    def _build_bias_insights(self) -> Dict:
+        statistics = self._evaluated_statistics()
+        scored = sum(stats.count for _, stats in statistics)
+        biased = sum(stats.bias_count for _, stats in statistics)
+        bias_percentage = (biased / scored) * 100 if scored else 0.0
+        return {
+            'evaluations': scored,
+            'bias_detected_count': biased,
+            'bias_percentage': bias_percentage,
+            'flagged_candidates': sum(1 for c in list(self.db.candidates.values()) if c.bias_detected),
+            'jobs': [
+                {'job_id': job.id, 'title': job.title, 'bias_detected_count': stats.bias_count,
+                 'bias_percentage': stats.bias_percentage}
+                for job, stats in statistics
+            ],
+            'recommendation': 'Consider bias training for evaluators' if bias_percentage > 20 else 'Bias levels are acceptable'
+        }
+    
+    def _build_hiring_report(self, job_id: str) -> Dict:
         try:
             job = self.db.jobs.get(job_id)
             if not job:
                 return {"error": "Job not found"}
             
-            # Get all evaluations for this job
-            job_evaluations = [e for e in self.db.evaluations if e.job_id == job_id]
+            # Running aggregates kept up to date by add_evaluation
+            stats = self.db.job_statistics.get(job_id)
             
-            if not job_evaluations:
+            if stats is None or not stats.count:
                 return {"error": "No evaluations found for this job"}
             
-            # Calculate statistics
-            scores = [e.overall_score for e in job_evaluations]
-            skills_scores = [e.skills_match for e in job_evaluations]
-            experience_scores = [e.experience_match for e in job_evaluations]
-            
             # Identify top performers
             top_candidates = self.db.get_top_candidates(job_id, 3)
             
-            # Bias analysis
-            bias_count = sum(1 for e in job_evaluations if e.bias_indicators)
-            bias_percentage = (bias_count / len(job_evaluations)) * 100
-            
             # Generate insights
-            insights = self._generate_insights(scores, skills_scores, experience_scores, bias_percentage)
+            insights = self._generate_insights(stats)
             
             return {
                 'job_title': job.title,
                 'company': job.company,
-                'total_candidates': len(job_evaluations),
+                'total_candidates': stats.count,
                 'statistics': {
-                    'average_score': np.mean(scores),
-                    'score_std': np.std(scores),
-                    'min_score': np.min(scores),
-                    'max_score': np.max(scores),
-                    'average_skills_match': np.mean(skills_scores),
-                    'average_experience_match': np.mean(experience_scores)
+                    'average_score': stats.mean_score,
+                    'score_std': stats.score_std,
+                    'min_score': stats.min_score,
+                    'max_score': stats.max_score,
+                    'average_skills_match': stats.mean_skills_match,
+                    'average_experience_match': stats.mean_experience_match
                 },
                 'top_candidates': [
                     {
@@ -496,62 +3092,62 @@ class HiringAnalytics:
                     } for c, score in top_candidates
                 ],
                 'bias_analysis': {
-                    'bias_detected_count': bias_count,
-                    'bias_percentage': bias_percentage,
-                    'recommendation': 'Consider bias training for evaluators' if bias_percentage > 20 else 'Bias levels are acceptable'
+                    'bias_detected_count': stats.bias_count,
+                    'bias_percentage': stats.bias_percentage,
+                    'recommendation': 'Consider bias training for evaluators' if stats.bias_percentage > 20 else 'Bias levels are acceptable'
                 },
                 'insights': insights,
-                'recommendations': self._generate_strategic_recommendations(scores, bias_percentage)
+                'recommendations': self._generate_strategic_recommendations(stats)
             }
             
         except Exception as e:
             logger.error(f"Error generating hiring report: {e}")
             return {"error": str(e)}
     
-    def _generate_insights(self, scores: List[float], skills_scores: List[float], 
-                          experience_scores: List[float], bias_percentage: float) -> List[str]:
+    def _generate_insights(self, stats: JobStatistics) -> List[str]:
         """Generate AI-powered insights from evaluation data."""
         insights = []
         
         # Score distribution insights
-        if np.std(scores) < 0.1:
+        score_std = stats.score_std
+        if score_std < 0.1:
             insights.append("Low score variance suggests the evaluation criteria may be too broad")
-        elif np.std(scores) > 0.3:
+        elif score_std > 0.3:
             insights.append("High score variance indicates good candidate differentiation")
         
         # Skills gap insights
-        avg_skills = np.mean(skills_scores)
+        avg_skills = stats.mean_skills_match
         if avg_skills < 0.6:
             insights.append("Skills gap detected - consider training programs or adjusting requirements")
         elif avg_skills > 0.8:
             insights.append("Strong skills alignment - focus on other differentiating factors")
         
         # Experience insights
-        avg_experience = np.mean(experience_scores)
+        avg_experience = stats.mean_experience_match
         if avg_experience < 0.5:
             insights.append("Experience requirements may be too high for available talent pool")
         
         # Bias insights
-        if bias_percentage > 30:
+        if stats.bias_percentage > 30:
             insights.append("High bias detection rate - review evaluation process for fairness")
         
         return insights
     
-    def _generate_strategic_recommendations(self, scores: List[float], bias_percentage: float) -> List[str]:
+    def _generate_strategic_recommendations(self, stats: JobStatistics) -> List[str]:
         """Generate strategic recommendations for hiring process improvement."""
         recommendations = []
         
-        avg_score = np.mean(scores)
+        avg_score = stats.mean_score
         
         if avg_score < 0.6:
             recommendations.append("Consider revising job requirements to better match available talent")
             recommendations.append("Implement targeted recruitment strategies for specific skill sets")
         
-        if bias_percentage > 20:
+        if stats.bias_percentage > 20:
             recommendations.append("Implement bias training for all evaluators")
             recommendations.append("Review and update evaluation criteria for inclusivity")
         
-        if len(scores) < 10:
+        if stats.count < 10:
             recommendations.append("Expand candidate pool for better selection diversity")
         
         recommendations.append("Regularly review and update evaluation criteria based on performance data")
@@ -657,12 +3253,15 @@ def run_demo():
     print("EVALUATING CANDIDATES")
     print("=" * 40)
     
-    for job in jobs:
+    # Score every candidate against every job in one vectorized pass
+    evaluation_matrix = evaluator.evaluate_many(candidates, jobs)
+    
+    for job_index, job in enumerate(jobs):
         print(f"\nEvaluating candidates for: {job.title} at {job.company}")
         print("-" * 50)
         
-        for candidate in candidates:
-            evaluation = evaluator.evaluate_candidate(candidate, job)
+        for candidate_index, candidate in enumerate(candidates):
+            evaluation = evaluation_matrix.result(candidate_index, job_index)
             if evaluation:
                 database.add_evaluation(evaluation)
                 
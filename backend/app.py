@@ -1,8 +1,18 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator, Type
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import dataclasses
+import functools
+import itertools
+import queue
+import threading
+import time
 import uvicorn
 import json
 import sys
@@ -14,13 +24,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from ai_hiring_system import (
     Candidate, Job, EvaluationResult, ResumeParser, SkillsMatcher, 
     BiasDetector, CandidateEvaluator, HiringDatabase, HiringAnalytics,
-    create_sample_data
+    SQLiteStorage, create_sample_data
 )
+from serialization import FastJSONResponse, dumps
 
 app = FastAPI(
     title="AI Hiring Evaluation System API",
     description="Backend API for AI-powered candidate evaluation and hiring analytics",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # Configure CORS
@@ -37,16 +49,216 @@ resume_parser = ResumeParser()
 skills_matcher = SkillsMatcher()
 bias_detector = BiasDetector()
 candidate_evaluator = CandidateEvaluator()
-hiring_db = HiringDatabase()
+# Persist to SQLite when a database path is configured, otherwise keep data in memory
+db_path = os.environ.get("HIRING_DB_PATH")
+hiring_db = HiringDatabase(storage=SQLiteStorage(db_path) if db_path else None)
 hiring_analytics = HiringAnalytics(hiring_db)
 
-# Create sample data on startup
-sample_data = create_sample_data()
-candidates, jobs = sample_data
-for candidate in candidates:
-    hiring_db.add_candidate(candidate)
-for job in jobs:
-    hiring_db.add_job(job)
+class CPUWorkPool:
+    """Runs CPU-bound handler work on worker threads so the event loop stays responsive.
+
+    Threads are used rather than processes because handlers read and update the
+    in-memory database. At most ``workers + queue_depth`` calls may be pending;
+    further calls are rejected with 503, and calls exceeding ``timeout`` seconds
+    return 504 (the worker thread still runs to completion and keeps its slot).
+    With ``workers=0`` work runs inline on the event loop.
+    """
+
+    def __init__(self, workers: int = 4, queue_depth: int = 64, timeout: float = 30.0):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self.executor = (ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cpu-work")
+                         if workers > 0 else None)
+        self._pending = 0
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, future=None):
+        with self._lock:
+            self._pending -= 1
+            self._futures.discard(future)
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` on the pool and await its result"""
+        if self.executor is None:
+            return func(*args, **kwargs)
+
+        with self._lock:
+            if self._pending >= self.workers + self.queue_depth:
+                raise HTTPException(status_code=503, detail="Server busy, try again later")
+            self._pending += 1
+        try:
+            future = self.executor.submit(functools.partial(func, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Request timed out")
+
+    def shutdown(self):
+        if self.executor is not None:
+            # Cancel queued calls by hand; shutdown's cancel_futures needs Python 3.9
+            with self._lock:
+                futures = list(self._futures)
+            for future in futures:
+                future.cancel()
+            self.executor.shutdown(wait=False)
+
+cpu_pool = CPUWorkPool(
+    workers=int(os.environ.get("API_CPU_WORKERS", "4")),
+    queue_depth=int(os.environ.get("API_QUEUE_DEPTH", "64")),
+    timeout=float(os.environ.get("API_REQUEST_TIMEOUT", "30")),
+)
+
+class BackgroundTask:
+    """Progress and outcome of one queued unit of long-running work"""
+
+    def __init__(self, task_id: str, name: str, func: Callable, total: int):
+        self.id = task_id
+        self.name = name
+        self.func = func
+        self.total = total
+        self.completed = 0
+        self.status = "queued"
+        self.error: Optional[str] = None
+        self.result: Any = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def advance(self, count: int = 1):
+        self.completed += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = eta = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+            if self.status == "running" and self.completed:
+                eta = elapsed / self.completed * max(self.total - self.completed, 0)
+        return {
+            "task_id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "completed": self.completed,
+            "total": self.total,
+            "progress": self.completed / self.total if self.total else float(self.finished),
+            "elapsed_seconds": elapsed,
+            "eta_seconds": eta,
+            "created_at": self.created_at.isoformat(),
+            "error": self.error,
+            "result": self.result,
+        }
+
+class BackgroundTaskQueue:
+    """In-process task queue drained by a fixed pool of worker threads.
+
+    ``func(task)`` runs on a worker, reports progress with ``task.advance()``
+    and should return early once ``task.cancelled`` is set. At most
+    ``max_pending`` tasks may wait in the queue; ``submit`` raises
+    ``queue.Full`` beyond that. The newest ``max_history`` finished tasks are
+    kept for polling.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 100, max_history: int = 1000):
+        self.workers = workers
+        self.max_history = max_history
+        self.tasks: "OrderedDict[str, BackgroundTask]" = OrderedDict()
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._work, name=f"task-worker-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, name: str, func: Callable[[BackgroundTask], Any], total: int = 0) -> BackgroundTask:
+        with self._lock:
+            task = BackgroundTask(f"T{next(self._ids):06d}", name, func, total)
+            self._pending.put_nowait(task)
+            self.tasks[task.id] = task
+            self._trim_history()
+        return task
+
+    def get(self, task_id: str) -> Optional[BackgroundTask]:
+        return self.tasks.get(task_id)
+
+    def cancel(self, task_id: str) -> Optional[BackgroundTask]:
+        """Cancel a task; queued tasks never start, running ones stop at their next check"""
+        task = self.tasks.get(task_id)
+        if task is not None and not task.finished:
+            task._cancel.set()
+            if task.status == "queued":
+                task.status = "cancelled"
+        return task
+
+    def shutdown(self):
+        for task in list(self.tasks.values()):
+            self.cancel(task.id)
+        for _ in self._threads:
+            self._pending.put(None)
+
+    def _trim_history(self):
+        finished = [task_id for task_id, task in self.tasks.items() if task.finished]
+        for task_id in finished[:max(0, len(self.tasks) - self.max_history)]:
+            del self.tasks[task_id]
+
+    def _work(self):
+        while True:
+            task = self._pending.get()
+            if task is None:
+                return
+            if task.cancelled:
+                continue
+
+            task.status = "running"
+            task.started_at = time.perf_counter()
+            try:
+                task.result = task.func(task)
+                task.status = "cancelled" if task.cancelled else "completed"
+            except Exception as e:
+                task.error = str(e)
+                task.status = "failed"
+            finally:
+                task.finished_at = time.perf_counter()
+
+task_queue = BackgroundTaskQueue(
+    workers=int(os.environ.get("API_TASK_WORKERS", "2")),
+    max_pending=int(os.environ.get("API_TASK_QUEUE_DEPTH", "100")),
+)
+
+@app.on_event("shutdown")
+def shutdown_cpu_pool():
+    cpu_pool.shutdown()
+    task_queue.shutdown()
+
+# Create sample data on first startup
+if not hiring_db.candidates and not hiring_db.jobs:
+    sample_data = create_sample_data()
+    candidates, jobs = sample_data
+    for candidate in candidates:
+        hiring_db.add_candidate(candidate)
+    for job in jobs:
+        hiring_db.add_job(job)
 
 # Pydantic models for API requests/responses
 class CandidateCreate(BaseModel):
@@ -76,6 +288,27 @@ class ResumeUpload(BaseModel):
     candidate_id: int
     resume_text: str
 
+class CandidateFilter(BaseModel):
+    status: Optional[str] = None
+    experience_min: Optional[int] = None
+    experience_max: Optional[int] = None
+    skills: Optional[str] = None
+    skills_match: str = "any"
+    location: Optional[str] = None
+    radius_km: float = 0.0
+
+class EvaluationPair(BaseModel):
+    candidate_id: str
+    job_id: str
+
+class BatchEvaluationRequest(BaseModel):
+    # Either explicit pairs, or one job scored against every candidate matching the filter
+    pairs: Optional[List[EvaluationPair]] = None
+    job_id: Optional[str] = None
+    candidate_filter: Optional[CandidateFilter] = None
+    chunk_size: int = 256
+    store: bool = True
+
 # API Endpoints
 
 @app.get("/")
@@ -98,6 +331,59 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "message": "AI Hiring System is running"}
 
+def filter_candidates(criteria: CandidateFilter, after: Optional[str] = None) -> Iterator[Candidate]:
+    """Candidates matching every criterion that is set, in id order after the cursor id"""
+    if criteria.status:
+        # Rejected up front, before a batch starts streaming
+        raise HTTPException(status_code=400, detail="Candidates have no status to filter on")
+    # Walk candidates in id order from the cursor and filter lazily, so a page
+    # only scans as far as it needs to instead of collecting every match
+    candidates = hiring_db.iter_candidates(after)
+    if criteria.skills:
+        # Checked against the skill index; skills_match=all requires every skill
+        skill_list = [s.strip() for s in criteria.skills.split(',') if s.strip()]
+        has_skills = hiring_db.skills_filter(skill_list, match_all=criteria.skills_match == "all")
+        candidates = (c for c in candidates if has_skills(c))
+    if criteria.experience_min is not None:
+        candidates = (c for c in candidates if c.experience_years >= criteria.experience_min)
+    if criteria.experience_max is not None:
+        candidates = (c for c in candidates if c.experience_years <= criteria.experience_max)
+    if criteria.location:
+        # Known cities are checked against the location index; radius_km widens to nearby cities
+        is_nearby = hiring_db.location_filter(criteria.location, criteria.radius_km)
+        candidates = (c for c in candidates if is_nearby(c))
+    return iter(candidates)
+
+def parse_fields(fields: Optional[str], record_type: Type) -> Optional[List[str]]:
+    """Validate a comma-separated fields= projection against a record type"""
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(',') if f.strip()]
+    known = {f.name for f in dataclasses.fields(record_type)}
+    unknown = [f for f in requested if f not in known]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+def paginate(records: Iterable, limit: Optional[int], cursor_of: Callable[[Any], Any]):
+    """Take one page of records, along with the next cursor when more remain"""
+    if limit is None:
+        return list(records), None
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    page = list(itertools.islice(records, limit + 1))
+    if len(page) > limit:
+        page = page[:limit]
+        return page, cursor_of(page[-1])
+    return page, None
+
+def list_response(records: List[Any], fields: Optional[List[str]], next_cursor: Any = None) -> FastJSONResponse:
+    """Encode records directly, skipping FastAPI's generic jsonable_encoder"""
+    if fields is not None:
+        records = [{name: getattr(record, name) for name in fields} for record in records]
+    headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor is not None else None
+    return FastJSONResponse(records, headers=headers)
+
 # Candidates endpoints
 @app.get("/candidates", response_model=List[Dict[str, Any]])
 async def get_candidates(
@@ -105,25 +391,22 @@ async def get_candidates(
     experience_min: Optional[int] = None,
     experience_max: Optional[int] = None,
     skills: Optional[str] = None,
-    location: Optional[str] = None
+    skills_match: str = "any",
+    location: Optional[str] = None,
+    radius_km: float = 0.0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """Get all candidates with optional filtering"""
-    candidates = hiring_db.get_all_candidates()
+    """Get candidates with optional filtering, cursor pagination and field projection"""
+    projection = parse_fields(fields, Candidate)
+    candidates = filter_candidates(CandidateFilter(
+        status=status, experience_min=experience_min, experience_max=experience_max,
+        skills=skills, skills_match=skills_match, location=location, radius_km=radius_km
+    ), after=cursor)
     
-    # Apply filters
-    if status:
-        candidates = [c for c in candidates if c.status == status]
-    if experience_min is not None:
-        candidates = [c for c in candidates if c.experience >= experience_min]
-    if experience_max is not None:
-        candidates = [c for c in candidates if c.experience <= experience_max]
-    if skills:
-        skill_list = [s.strip().lower() for s in skills.split(',')]
-        candidates = [c for c in candidates if any(skill in [s.lower() for s in c.skills] for skill in skill_list)]
-    if location:
-        candidates = [c for c in candidates if location.lower() in c.location.lower()]
-    
-    return [c.__dict__ for c in candidates]
+    page, next_cursor = paginate(candidates, limit, lambda c: c.id)
+    return list_response(page, projection, next_cursor)
 
 @app.get("/candidates/{candidate_id}", response_model=Dict[str, Any])
 async def get_candidate(candidate_id: int):
@@ -180,6 +463,7 @@ async def update_candidate(candidate_id: int, candidate_data: CandidateCreate):
         candidate.education = candidate_data.education
         candidate.location = candidate_data.location
         candidate.skills = candidate_data.skills
+        hiring_db.update_candidate(candidate)
         
         return {"message": "Candidate updated successfully", "candidate": candidate.__dict__}
     except Exception as e:
@@ -192,7 +476,7 @@ async def delete_candidate(candidate_id: int):
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    hiring_db.candidates = [c for c in hiring_db.candidates if c.id != candidate_id]
+    hiring_db.remove_candidate(candidate.id)
     return {"message": "Candidate deleted successfully"}
 
 # Jobs endpoints
@@ -200,20 +484,25 @@ async def delete_candidate(candidate_id: int):
 async def get_jobs(
     department: Optional[str] = None,
     location: Optional[str] = None,
-    experience_required: Optional[int] = None
+    experience_required: Optional[int] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
-    """Get all jobs with optional filtering"""
-    jobs = hiring_db.get_all_jobs()
+    """Get jobs with optional filtering, cursor pagination and field projection"""
+    projection = parse_fields(fields, Job)
+    jobs = hiring_db.iter_jobs(after=cursor)
     
-    # Apply filters
+    # Apply filters lazily, so a page only scans as far as it needs to
     if department:
-        jobs = [j for j in jobs if department.lower() in j.department.lower()]
+        jobs = (j for j in jobs if department.lower() in j.department.lower())
     if location:
-        jobs = [j for j in jobs if location.lower() in j.location.lower()]
+        jobs = (j for j in jobs if location.lower() in j.location.lower())
     if experience_required is not None:
-        jobs = [j for j in jobs if j.experience_required <= experience_required]
+        jobs = (j for j in jobs if j.experience_required <= experience_required)
     
-    return [j.__dict__ for j in jobs]
+    page, next_cursor = paginate(jobs, limit, lambda j: j.id)
+    return list_response(page, projection, next_cursor)
 
 @app.get("/jobs/{job_id}", response_model=Dict[str, Any])
 async def get_job(job_id: int):
@@ -246,7 +535,7 @@ async def create_job(job_data: JobCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.put("/jobs/{job_id}", response_model=Dict[str, Any])
-async def update_job(job_id: int, job_data: JobCreate):
+async def update_job(job_id: str, job_data: JobCreate):
     """Update an existing job"""
     job = hiring_db.get_job(job_id)
     if not job:
@@ -263,6 +552,10 @@ async def update_job(job_id: int, job_data: JobCreate):
         job.education_required = job_data.education_required
         job.description = job_data.description
         
+        # Drop the precompiled scoring profile of the old job version
+        candidate_evaluator.invalidate_job(job.id)
+        hiring_db.update_job(job)
+        
         return {"message": "Job updated successfully", "job": job.__dict__}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -277,22 +570,88 @@ async def delete_job(job_id: int):
     hiring_db.jobs = [j for j in hiring_db.jobs if j.id != job_id]
     return {"message": "Job deleted successfully"}
 
+@app.post("/jobs/{job_id}/evaluate-all", status_code=202)
+async def evaluate_all_candidates(job_id: str, chunk_size: int = 256):
+    """Queue a background re-score of every candidate against a job"""
+    job = hiring_db.jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+    
+    def evaluate_all(task: BackgroundTask):
+        candidates = hiring_db.get_all_candidates()
+        task.total = len(candidates)
+        for start in range(0, len(candidates), chunk_size):
+            if task.cancelled:
+                break
+            chunk = candidates[start:start + chunk_size]
+            matrix = candidate_evaluator.evaluate_many(chunk, [job])
+            hiring_db.add_evaluations(matrix.iter_results())
+            task.advance(len(chunk))
+        return {"evaluated": task.completed}
+    
+    try:
+        task = task_queue.submit(f"evaluate-all {job_id}", evaluate_all, total=len(hiring_db.candidates))
+    except queue.Full:
+        raise HTTPException(status_code=503, detail="Task queue is full, try again later")
+    return task.to_dict()
+
+# Background task endpoints
+@app.get("/tasks/{task_id}", response_model=Dict[str, Any])
+async def get_task(task_id: str):
+    """Get the status, progress and ETA of a background task"""
+    task = task_queue.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task.to_dict()
+
+@app.delete("/tasks/{task_id}", response_model=Dict[str, Any])
+async def cancel_task(task_id: str):
+    """Cancel a queued or running background task"""
+    task = task_queue.cancel(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task.to_dict()
+
 # Evaluation endpoints
 @app.get("/evaluations", response_model=List[Dict[str, Any]])
 async def get_evaluations(
-    candidate_id: Optional[int] = None,
-    job_id: Optional[int] = None
+    candidate_id: Optional[str] = None,
+    job_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
+    fields: Optional[str] = None,
+    min_score: Optional[float] = None
 ):
-    """Get all evaluations with optional filtering"""
-    evaluations = hiring_db.get_all_evaluations()
+    """Get evaluations with optional filtering, cursor pagination and field projection"""
+    projection = parse_fields(fields, EvaluationResult)
+    if min_score is not None:
+        # Answered by the storage backend's score index when one is configured
+        if limit is not None or cursor is not None:
+            raise HTTPException(status_code=400, detail="min_score cannot be combined with limit or cursor")
+        evaluations = hiring_db.find_evaluations(candidate_id=candidate_id or None, job_id=job_id or None,
+                                                 min_score=min_score)
+        return list_response(evaluations, projection)
     
-    # Apply filters
-    if candidate_id:
-        evaluations = [e for e in evaluations if e.candidate_id == candidate_id]
-    if job_id:
-        evaluations = [e for e in evaluations if e.job_id == job_id]
+    store = hiring_db.evaluations
+    # Apply filters through the store's candidate and job indexes
+    next_cursor = None
+    if limit is None:
+        rows = store.rows(candidate_id=candidate_id or None, job_id=job_id or None)
+        if cursor is not None:
+            rows = rows[rows > cursor]
+    else:
+        if limit < 1:
+            raise HTTPException(status_code=400, detail="limit must be positive")
+        # The cursor is the row id of the last evaluation on the previous page
+        rows = store.page(after=-1 if cursor is None else cursor, limit=limit + 1,
+                          candidate_id=candidate_id or None, job_id=job_id or None)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = int(rows[-1])
     
-    return [e.__dict__ for e in evaluations]
+    return list_response([store[int(row)] for row in rows], projection, next_cursor)
 
 @app.get("/evaluations/{evaluation_id}", response_model=Dict[str, Any])
 async def get_evaluation(evaluation_id: int):
@@ -315,7 +674,7 @@ async def create_evaluation(evaluation_request: EvaluationRequest):
             raise HTTPException(status_code=404, detail="Job not found")
         
         # Run the AI evaluation
-        evaluation_result = candidate_evaluator.evaluate_candidate(candidate, job)
+        evaluation_result = await cpu_pool.run(candidate_evaluator.evaluate_candidate, candidate, job)
         
         # Store the evaluation
         evaluation = EvaluationResult(
@@ -336,10 +695,10 @@ async def create_evaluation(evaluation_request: EvaluationRequest):
         hiring_db.add_evaluation(evaluation)
         
         # Update candidate's average score
-        candidate_evaluations = [e for e in hiring_db.evaluations if e.candidate_id == candidate.id]
-        if candidate_evaluations:
-            candidate.average_score = sum(e.overall_score for e in candidate_evaluations) / len(candidate_evaluations)
-            candidate.bias_detected = any(e.bias_detected for e in candidate_evaluations)
+        candidate_rows = hiring_db.evaluations.rows(candidate_id=candidate.id)
+        if len(candidate_rows):
+            candidate.average_score = float(hiring_db.evaluations.column('overall_score', candidate_rows).mean())
+            candidate.bias_detected = bool(hiring_db.evaluations.column('bias_detected', candidate_rows).any())
             candidate.last_evaluation = evaluation.evaluation_date
         
         return {
@@ -348,9 +707,71 @@ async def create_evaluation(evaluation_request: EvaluationRequest):
             "candidate": candidate.__dict__,
             "job": job.__dict__
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/evaluations/batch")
+async def create_evaluations_batch(batch: BatchEvaluationRequest):
+    """Evaluate many candidate-job pairs, streaming one NDJSON line per result"""
+    if batch.chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+    
+    # Group the work by job so each chunk is a single evaluate_many call
+    work: Dict[str, List[str]] = {}
+    if batch.pairs is not None:
+        for pair in batch.pairs:
+            work.setdefault(pair.job_id, []).append(pair.candidate_id)
+    elif batch.job_id is not None:
+        if batch.job_id not in hiring_db.jobs:
+            raise HTTPException(status_code=404, detail="Job not found")
+        candidates = list(filter_candidates(batch.candidate_filter or CandidateFilter()))
+        work[batch.job_id] = [c.id for c in candidates]
+    else:
+        raise HTTPException(status_code=400, detail="Provide either pairs or job_id")
+    
+    def error_line(candidate_id, job_id, detail):
+        return dumps({"candidate_id": candidate_id, "job_id": job_id, "error": detail}) + b"\n"
+    
+    def evaluate_chunk(candidates, job):
+        # Scoring and storing both run on the pool, keeping the event loop free
+        results = list(candidate_evaluator.evaluate_many(candidates, [job]).iter_results())
+        if batch.store:
+            hiring_db.add_evaluations(results)
+        return results
+    
+    async def stream_results():
+        for job_id, candidate_ids in work.items():
+            job = hiring_db.jobs.get(job_id)
+            if job is None:
+                for candidate_id in candidate_ids:
+                    yield error_line(candidate_id, job_id, "Job not found")
+                continue
+            
+            for start in range(0, len(candidate_ids), batch.chunk_size):
+                candidates = []
+                for candidate_id in candidate_ids[start:start + batch.chunk_size]:
+                    candidate = hiring_db.get_candidate(candidate_id)
+                    if candidate is None:
+                        yield error_line(candidate_id, job_id, "Candidate not found")
+                    else:
+                        candidates.append(candidate)
+                if not candidates:
+                    continue
+                
+                try:
+                    results = await cpu_pool.run(evaluate_chunk, candidates, job)
+                except Exception as e:
+                    # The 200 header has already been sent, so report the chunk in-band
+                    detail = e.detail if isinstance(e, HTTPException) else str(e)
+                    for candidate in candidates:
+                        yield error_line(candidate.id, job_id, detail)
+                    continue
+                yield b"".join(dumps(result) + b"\n" for result in results)
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 # Resume parsing endpoint
 @app.post("/resume/upload", response_model=Dict[str, Any])
 async def upload_resume(resume_data: ResumeUpload):
@@ -361,11 +782,12 @@ async def upload_resume(resume_data: ResumeUpload):
             raise HTTPException(status_code=404, detail="Candidate not found")
         
         # Extract skills from resume
-        extracted_skills = resume_parser.extract_skills(resume_data.resume_text)
+        extracted_skills = await cpu_pool.run(resume_parser.extract_skills, resume_data.resume_text)
         
         # Update candidate skills
         all_skills = list(set(candidate.skills + extracted_skills))
         candidate.skills = all_skills
+        hiring_db.update_candidate(candidate)
         
         return {
             "message": "Resume parsed successfully",
@@ -373,16 +795,25 @@ async def upload_resume(resume_data: ResumeUpload):
             "all_skills": all_skills,
             "candidate": candidate.__dict__
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 # Analytics endpoints
+@app.get("/analytics/cache", response_model=Dict[str, Any])
+async def get_analytics_cache_stats():
+    """Get analytics cache hit/miss counts"""
+    return hiring_analytics.cache_stats()
+
 @app.get("/analytics/dashboard", response_model=Dict[str, Any])
 async def get_dashboard_analytics():
     """Get dashboard analytics and metrics"""
     try:
-        analytics = hiring_analytics.generate_dashboard_insights(hiring_db)
+        analytics = await cpu_pool.run(hiring_analytics.generate_dashboard_insights)
         return analytics
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -390,8 +821,10 @@ async def get_dashboard_analytics():
 async def get_candidate_analytics():
     """Get candidate-specific analytics"""
     try:
-        analytics = hiring_analytics.generate_candidate_insights(hiring_db)
+        analytics = await cpu_pool.run(hiring_analytics.generate_candidate_insights)
         return analytics
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -399,8 +832,10 @@ async def get_candidate_analytics():
 async def get_job_analytics():
     """Get job-specific analytics"""
     try:
-        analytics = hiring_analytics.generate_job_insights(hiring_db)
+        analytics = await cpu_pool.run(hiring_analytics.generate_job_insights)
         return analytics
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -408,8 +843,10 @@ async def get_job_analytics():
 async def get_bias_analytics():
     """Get bias detection analytics"""
     try:
-        analytics = hiring_analytics.generate_bias_insights(hiring_db)
+        analytics = await cpu_pool.run(hiring_analytics.generate_bias_insights)
         return analytics
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -418,8 +855,8 @@ async def get_bias_analytics():
 async def match_skills(candidate_skills: List[str], job_skills: List[str]):
     """Match candidate skills with job requirements"""
     try:
-        match_score = skills_matcher.calculate_match_score(candidate_skills, job_skills)
-        missing_skills = skills_matcher.identify_missing_skills(candidate_skills, job_skills)
+        match_score = await cpu_pool.run(skills_matcher.calculate_match_score, candidate_skills, job_skills)
+        missing_skills = await cpu_pool.run(skills_matcher.identify_missing_skills, candidate_skills, job_skills)
         
         return {
             "match_score": match_score,
@@ -427,6 +864,8 @@ async def match_skills(candidate_skills: List[str], job_skills: List[str]):
             "candidate_skills": candidate_skills,
             "job_skills": job_skills
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -435,8 +874,10 @@ async def match_skills(candidate_skills: List[str], job_skills: List[str]):
 async def detect_bias(candidate_data: Dict[str, Any]):
     """Detect potential biases in candidate data"""
     try:
-        bias_result = bias_detector.detect_bias(candidate_data)
+        bias_result = await cpu_pool.run(bias_detector.detect_bias, candidate_data)
         return bias_result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
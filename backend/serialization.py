@@ -0,0 +1,98 @@
+"""
+Fast JSON serialization for API responses.
+
+Candidates, jobs and evaluation results are dataclasses, so they are encoded
+straight to bytes instead of going through FastAPI's generic jsonable_encoder.
+orjson is used when installed, then msgspec, then the standard library json
+module. Every backend produces the same JSON: datetimes as ISO 8601 strings,
+dataclasses as objects of their fields, numpy values as plain numbers written
+at their own precision (float32 0.1 as 0.1) and NaN or infinity as null.
+"""
+
+import dataclasses
+import json
+import math
+from datetime import date, datetime
+from typing import Any, Callable, Dict
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    """Convert the values the encoders do not handle natively"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return obj.__dict__
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, np.floating):
+        # Shortest repr at the scalar's own precision, as orjson writes float32
+        return float(str(obj))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _plain(obj: Any) -> Any:
+    """Reduce content to JSON-native values the way orjson encodes them.
+    
+    The json module writes floats itself without consulting ``default``, so
+    non-finite floats are turned into None here rather than raising.
+    """
+    if isinstance(obj, (str, int, type(None))):
+        return obj
+    if isinstance(obj, float):
+        if type(obj) is not float:
+            obj = _default(obj)
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, np.ndarray)):
+        # Iterating an array yields numpy scalars, which keep their precision
+        return [_plain(value) for value in obj]
+    return _plain(_default(obj))
+
+
+def _dumps_stdlib(content: Any) -> bytes:
+    return json.dumps(_plain(content), ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {"stdlib": _dumps_stdlib}
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=_default)
+    ENCODERS["msgspec"] = _msgspec_encoder.encode
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps_orjson(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+    ENCODERS["orjson"] = _dumps_orjson
+
+# Fastest available encoder first
+BACKEND = next(name for name in ("orjson", "msgspec", "stdlib") if name in ENCODERS)
+dumps: Callable[[Any], bytes] = ENCODERS[BACKEND]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the fastest available encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
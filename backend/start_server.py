@@ -43,7 +43,8 @@ def check_ai_system():
         print("Please ensure ai_hiring_system.py is in the parent directory")
         return False
 
-def start_server(host="0.0.0.0", port=8000, reload=False, debug=False):
+def start_server(host="0.0.0.0", port=8000, reload=False, debug=False, db=None,
+                 cpu_workers=4, queue_depth=64, timeout=30.0, task_workers=2, task_queue_depth=100):
     """Start the FastAPI server"""
     try:
         print(f"🚀 Starting AI Hiring System Backend Server...")
@@ -51,12 +52,22 @@ def start_server(host="0.0.0.0", port=8000, reload=False, debug=False):
         print(f"🔌 Port: {port}")
         print(f"🔄 Reload: {reload}")
         print(f"🐛 Debug: {debug}")
+        print(f"💾 Database: {db or 'in-memory'}")
+        print(f"🧵 CPU workers: {cpu_workers} (queue depth {queue_depth}, timeout {timeout}s)")
+        print(f"📋 Task workers: {task_workers} (queue depth {task_queue_depth})")
         print("=" * 50)
         
         # Set environment variables
         os.environ["API_HOST"] = host
         os.environ["API_PORT"] = str(port)
         os.environ["DEBUG"] = str(debug).lower()
+        if db:
+            os.environ["HIRING_DB_PATH"] = db
+        os.environ["API_CPU_WORKERS"] = str(cpu_workers)
+        os.environ["API_QUEUE_DEPTH"] = str(queue_depth)
+        os.environ["API_REQUEST_TIMEOUT"] = str(timeout)
+        os.environ["API_TASK_WORKERS"] = str(task_workers)
+        os.environ["API_TASK_QUEUE_DEPTH"] = str(task_queue_depth)
         
         # Start the server
         uvicorn.run(
@@ -85,6 +96,8 @@ Examples:
   python start_server.py --reload          # Start with auto-reload
   python start_server.py --debug           # Start in debug mode
   python start_server.py --host 127.0.0.1  # Start on localhost only
+  python start_server.py --db hiring.db    # Persist data in SQLite
+  python start_server.py --cpu-workers 8   # Evaluate on 8 worker threads
         """
     )
     
@@ -113,6 +126,46 @@ Examples:
         help="Enable debug mode with verbose logging"
     )
     
+    parser.add_argument(
+        "--db",
+        help="SQLite database file to persist data in (default: in-memory)"
+    )
+    
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=4,
+        help="Worker threads for CPU-bound evaluation, 0 runs it inline (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=64,
+        help="Requests allowed to wait for a CPU worker before returning 503 (default: 64)"
+    )
+    
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds before CPU-bound requests return 504 (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--task-workers",
+        type=int,
+        default=2,
+        help="Worker threads for background tasks such as evaluate-all (default: 2)"
+    )
+    
+    parser.add_argument(
+        "--task-queue-depth",
+        type=int,
+        default=100,
+        help="Background tasks allowed to wait before returning 503 (default: 100)"
+    )
+    
     parser.add_argument(
         "--check",
         action="store_true",
@@ -143,7 +196,13 @@ Examples:
         host=args.host,
         port=args.port,
         reload=args.reload,
-        debug=args.debug
+        debug=args.debug,
+        db=args.db,
+        cpu_workers=args.cpu_workers,
+        queue_depth=args.queue_depth,
+        timeout=args.timeout,
+        task_workers=args.task_workers,
+        task_queue_depth=args.task_queue_depth
     )
 
 if __name__ == "__main__":
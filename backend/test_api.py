@@ -8,7 +8,9 @@ import os
 # Add the parent directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import app
+from app import app, CPUWorkPool, BackgroundTaskQueue
+import serialization
+from fastapi import HTTPException
 
 client = TestClient(app)
 
@@ -63,6 +65,16 @@ class TestAIHiringAPI:
             skills_lower = [skill.lower() for skill in candidate["skills"]]
             assert "python" in skills_lower
     
+    def test_get_candidates_with_all_skills(self):
+        """Test AND skill queries answered from the skill index"""
+        response = client.get("/candidates?skills=python,docker&skills_match=all")
+        assert response.status_code == 200
+        candidates = response.json()
+        assert len(candidates) > 0
+        for candidate in candidates:
+            skills_lower = [skill.lower() for skill in candidate["skills"]]
+            assert "python" in skills_lower and "docker" in skills_lower
+    
     def test_get_candidate_by_id(self):
         """Test getting a specific candidate"""
         # First get all candidates to get an ID
@@ -258,6 +270,33 @@ class TestAIHiringAPI:
         data = response.json()
         assert isinstance(data, dict)
     
+    def test_analytics_cache_hits(self):
+        """Test analytics are served from cache until the next write"""
+        import app as app_module
+        
+        for path in ("/analytics/dashboard", "/analytics/candidates", "/analytics/jobs", "/analytics/bias"):
+            first = client.get(path)
+            assert first.status_code == 200
+            before = client.get("/analytics/cache").json()
+            
+            second = client.get(path)
+            assert second.status_code == 200
+            assert second.json() == first.json()
+            after = client.get("/analytics/cache").json()
+            assert after["hits"] == before["hits"] + 1
+            assert after["misses"] == before["misses"]
+            
+            # Any write invalidates the cached result
+            app_module.hiring_db.touch()
+            assert client.get(path).status_code == 200
+            written = client.get("/analytics/cache").json()
+            assert written["misses"] == after["misses"] + 1
+            assert written["hits"] == after["hits"]
+        
+        dashboard = client.get("/analytics/dashboard").json()
+        assert dashboard["total_candidates"] == len(app_module.hiring_db.candidates)
+        assert dashboard["total_jobs"] == len(app_module.hiring_db.jobs)
+    
     def test_error_handling(self):
         """Test error handling for invalid requests"""
         # Test getting non-existent candidate
@@ -272,6 +311,300 @@ class TestAIHiringAPI:
         response = client.get("/evaluations/99999")
         assert response.status_code == 404
     
+    def test_batch_evaluation_stream(self):
+        """Test batch evaluation streams one NDJSON line per pair"""
+        import app as app_module
+        
+        job_id = next(iter(app_module.hiring_db.jobs))
+        candidate_ids = list(app_module.hiring_db.candidates)
+        
+        response = client.post("/evaluations/batch", json={"job_id": job_id, "chunk_size": 2})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(r["candidate_id"] for r in results) == sorted(candidate_ids)
+        assert all(r["job_id"] == job_id and 0 <= r["overall_score"] <= 1 for r in results)
+        
+        pairs = [{"candidate_id": candidate_ids[0], "job_id": job_id},
+                 {"candidate_id": "missing", "job_id": job_id},
+                 {"candidate_id": candidate_ids[0], "job_id": "missing"}]
+        response = client.post("/evaluations/batch", json={"pairs": pairs, "store": False})
+        assert response.status_code == 200
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert len(results) == 3
+        assert sum("error" in r for r in results) == 2
+        
+        # Unknown job and empty requests are rejected before streaming starts
+        assert client.post("/evaluations/batch", json={"job_id": "missing"}).status_code == 404
+        assert client.post("/evaluations/batch", json={}).status_code == 400
+        
+        # A chunk failing once streaming has started becomes error lines, not a cut-off body
+        class FailingChunks(CPUWorkPool):
+            calls = 0
+            
+            async def run(self, func, *args, **kwargs):
+                self.calls += 1
+                if self.calls == 2:
+                    raise HTTPException(status_code=503, detail="Server busy, try again later")
+                if self.calls == 3:
+                    raise RuntimeError("evaluator failed")
+                return await super().run(func, *args, **kwargs)
+        
+        cpu_pool = app_module.cpu_pool
+        app_module.cpu_pool = FailingChunks(workers=0)
+        try:
+            response = client.post("/evaluations/batch",
+                                   json={"job_id": job_id, "chunk_size": 1, "store": False})
+        finally:
+            app_module.cpu_pool = cpu_pool
+        assert response.status_code == 200
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["candidate_id"] for r in results] == sorted(candidate_ids, key=str)
+        assert [r.get("error") for r in results[1:3]] == ["Server busy, try again later", "evaluator failed"]
+        assert all("overall_score" in r for r in results[:1] + results[3:])
+        
+        # Candidate filters use the Candidate fields; status is rejected before streaming
+        response = client.post("/evaluations/batch", json={
+            "job_id": job_id, "store": False, "candidate_filter": {"experience_min": 4}})
+        assert response.status_code == 200
+        results = [json.loads(line) for line in response.text.splitlines()]
+        expected = [c.id for c in app_module.hiring_db.candidates.values() if c.experience_years >= 4]
+        assert sorted(r["candidate_id"] for r in results) == sorted(expected)
+        response = client.post("/evaluations/batch", json={"job_id": job_id, "candidate_filter": {"status": "new"}})
+        assert response.status_code == 400
+    
+    def test_evaluate_all_task(self):
+        """Test re-scoring a job in the background and polling its progress"""
+        import time
+        import app as app_module
+        
+        job_id = next(iter(app_module.hiring_db.jobs))
+        response = client.post(f"/jobs/{job_id}/evaluate-all")
+        assert response.status_code == 202
+        task_id = response.json()["task_id"]
+        
+        deadline = time.time() + 10
+        while True:
+            task = client.get(f"/tasks/{task_id}").json()
+            if task["status"] not in ("queued", "running") or time.time() > deadline:
+                break
+            time.sleep(0.01)
+        assert task["status"] == "completed"
+        assert task["completed"] == task["total"] == len(app_module.hiring_db.candidates)
+        assert task["progress"] == 1.0
+        assert task["result"] == {"evaluated": task["total"]}
+        
+        assert client.post("/jobs/missing/evaluate-all").status_code == 404
+        assert client.get("/tasks/missing").status_code == 404
+    
+    def test_background_task_cancellation(self):
+        """Test queued and running background tasks can be cancelled"""
+        import threading
+        import queue
+        
+        tasks = BackgroundTaskQueue(workers=1, max_pending=1)
+        started, release = threading.Event(), threading.Event()
+        
+        def step(task):
+            started.set()
+            while not task.cancelled:
+                release.wait(0.01)
+                task.advance()
+        
+        try:
+            running = tasks.submit("running", step, total=1000)
+            assert started.wait(5)
+            queued = tasks.submit("queued", step)
+            with pytest.raises(queue.Full):
+                tasks.submit("overflow", step)
+            
+            assert tasks.cancel(queued.id).status == "cancelled"
+            while running.completed == 0:
+                release.wait(0.01)
+            assert tasks.get(running.id).to_dict()["eta_seconds"] is not None
+            tasks.cancel(running.id)
+            for _ in range(500):
+                if running.finished:
+                    break
+                release.wait(0.01)
+            assert running.status == "cancelled"
+            assert 0 < running.completed < 1000
+            assert queued.completed == 0
+        finally:
+            tasks.shutdown()
+    
+    def test_cursor_pagination(self):
+        """Test list endpoints page with cursors and project fields"""
+        import app as app_module
+        
+        job_id = next(iter(app_module.hiring_db.jobs))
+        client.post("/evaluations/batch", json={"job_id": job_id})
+        
+        for url, key, query in (("/candidates", "id", {}), ("/candidates", "id", {"skills": "python,docker"}),
+                                ("/candidates", "id", {"location": "New York, NY", "radius_km": 100}),
+                                ("/jobs", "id", {}), ("/evaluations", None, {})):
+            everything = client.get(url, params=query).json()
+            pages, cursor = [], None
+            while True:
+                params = {**query, "limit": 2, **({"cursor": cursor} if cursor is not None else {})}
+                response = client.get(url, params=params)
+                assert response.status_code == 200
+                assert len(response.json()) <= 2
+                pages += response.json()
+                cursor = response.headers.get("x-next-cursor")
+                if cursor is None:
+                    break
+            assert len(pages) == len(everything)
+            if key:
+                assert [r[key] for r in pages] == sorted(r[key] for r in everything)
+        
+        # Filtered pages contain only matches
+        python_ids = [c["id"] for c in client.get("/candidates", params={"skills": "python"}).json()]
+        assert python_ids and all("python" in map(str.lower, app_module.hiring_db.candidates[i].skills)
+                                  for i in python_ids)
+        
+        response = client.get("/candidates", params={"fields": "id,name", "limit": 1})
+        assert response.status_code == 200
+        assert set(response.json()[0]) == {"id", "name"}
+        response = client.get("/evaluations", params={"job_id": job_id, "fields": "job_id,overall_score"})
+        assert {r["job_id"] for r in response.json()} == {job_id}
+        response = client.get("/evaluations", params={"job_id": job_id, "min_score": 0.5})
+        assert all(r["overall_score"] >= 0.5 for r in response.json())
+        assert client.get("/evaluations", params={"min_score": 0.5, "limit": 1}).status_code == 400
+        assert client.get("/candidates", params={"fields": "id,password"}).status_code == 400
+        assert client.get("/jobs", params={"limit": 0}).status_code == 400
+    
+    def test_serialization_backends(self):
+        """Test every available encoder produces the same JSON for the record types and special floats"""
+        from datetime import datetime
+        import numpy as np
+        from ai_hiring_system import Candidate, Job, EvaluationResult
+        
+        records = [
+            Candidate(id="C1", name="Zoë", email="z@example.com", resume_text="", skills=["Python"],
+                      experience_years=np.float64(3.5), education_level="master", location="Austin, TX",
+                      evaluation_timestamp=datetime(2024, 5, 1, 9, 30, 0, 123456)),
+            Job(id="J1", title="Engineer", company="Acme", required_skills=["Python"], preferred_skills=[],
+                experience_required=2.0, education_required="bachelor", location="Remote",
+                department="Engineering", salary_range=(90000.0, 120000.0)),
+            EvaluationResult(candidate_id="C1", job_id="J1", overall_score=np.float32(0.5), skills_match=1.0,
+                             experience_match=1.0, education_match=1.0, location_match=0.9,
+                             bias_indicators=[], recommendations=["Strong match"],
+                             timestamp=datetime(2024, 5, 2))
+        ]
+        expected = json.loads(serialization.ENCODERS["stdlib"](records))
+        assert expected[0]["evaluation_timestamp"] == "2024-05-01T09:30:00.123456"
+        assert expected[1]["salary_range"] == [90000.0, 120000.0]
+        assert expected[2]["overall_score"] == 0.5
+        for name, encode in serialization.ENCODERS.items():
+            assert json.loads(encode(records)) == expected, name
+        
+        # Non-finite floats become null and numpy floats keep their own precision
+        values = {"nan": float("nan"), "inf": float("inf"), "-inf": -np.inf, "nan64": np.float64("nan"),
+                  "nan32": np.float32("nan"), "f32": np.float32(0.1), "f64": np.float64(0.1),
+                  "array": np.array([0.1, np.nan, np.inf], dtype=np.float32), "count": np.int64(3)}
+        expected = (b'{"nan":null,"inf":null,"-inf":null,"nan64":null,"nan32":null,'
+                    b'"f32":0.1,"f64":0.1,"array":[0.1,null,null],"count":3}')
+        for name, encode in serialization.ENCODERS.items():
+            assert encode(values) == expected, name
+        
+        assert app.router.default_response_class is serialization.FastJSONResponse
+    
+    def test_cpu_work_pool(self):
+        """Test CPU-bound work runs off the event loop with bounded concurrency and timeouts"""
+        import asyncio
+        import threading
+        
+        pool = CPUWorkPool(workers=1, queue_depth=0, timeout=0.2)
+        release = threading.Event()
+        
+        async def scenario():
+            worker = await pool.run(threading.current_thread)
+            assert worker is not threading.current_thread()
+            
+            blocked = asyncio.ensure_future(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            with pytest.raises(HTTPException) as busy:
+                await pool.run(sum, [1, 2])
+            assert busy.value.status_code == 503
+            
+            with pytest.raises(HTTPException) as timed_out:
+                await blocked
+            assert timed_out.value.status_code == 504
+            # The timed-out call keeps its slot until the worker finishes
+            assert pool.pending == 1
+            release.set()
+            await asyncio.sleep(0.05)
+            assert pool.pending == 0
+            assert await pool.run(sum, [1, 2]) == 3
+        
+        try:
+            asyncio.run(scenario())
+        finally:
+            release.set()
+            pool.shutdown()
+        
+        # Shutting down cancels calls still waiting for a worker
+        pool = CPUWorkPool(workers=1, queue_depth=2, timeout=5)
+        release = threading.Event()
+        
+        async def shutdown_scenario():
+            calls = [asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            pool.shutdown()
+            release.set()
+            return await asyncio.gather(*calls, return_exceptions=True)
+        
+        outcomes = asyncio.run(shutdown_scenario())
+        assert outcomes[0] is True
+        assert all(isinstance(outcome, asyncio.CancelledError) for outcome in outcomes[1:])
+        assert pool.pending == 0
+    
+    def test_concurrent_evaluations(self):
+        """Test one evaluator shared by the CPU pool's threads gives the sequential results"""
+        import asyncio
+        import dataclasses
+        from ai_hiring_system import CandidateEvaluator, create_sample_data
+        
+        sample_candidates, sample_jobs = create_sample_data()
+        
+        def make_candidates():
+            # Empty skills make the evaluator fill candidates in from their resumes
+            return [dataclasses.replace(candidate, id=f"{candidate.id}-{copy}", skills=[])
+                    for copy in range(20) for candidate in sample_candidates]
+        
+        reference = CandidateEvaluator()
+        expected = [reference.evaluate_candidate(candidate, job).overall_score
+                    for candidate in make_candidates() for job in sample_jobs]
+        
+        # Tiny caches so the threads keep evicting each other's entries
+        evaluator = CandidateEvaluator(max_documents=2, max_jobs=1)
+        pool = CPUWorkPool(workers=4, queue_depth=1000, timeout=30)
+        
+        async def scenario():
+            candidates = make_candidates()
+            singles = await asyncio.gather(*(
+                pool.run(evaluator.evaluate_candidate, candidate, job)
+                for candidate in candidates for job in sample_jobs))
+            matrices = await asyncio.gather(*(
+                pool.run(evaluator.evaluate_many, [candidate], sample_jobs)
+                for candidate in make_candidates()))
+            return singles, matrices
+        
+        # Switch threads as often as possible to surface races on the caches
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            singles, matrices = asyncio.run(scenario())
+        finally:
+            sys.setswitchinterval(switch_interval)
+            pool.shutdown()
+        
+        assert all(result is not None for result in singles)
+        assert [result.overall_score for result in singles] == expected
+        batched = [result.overall_score for matrix in matrices for result in matrix.iter_results()]
+        assert batched == pytest.approx(expected)
+    
     def test_cors_headers(self):
         """Test CORS headers are present"""
         response = client.get("/candidates")
@@ -0,0 +1,645 @@
+"""
+Benchmarks for AI-Powered Hiring Evaluation System
+==================================================
+
+Micro-benchmarks for the hot paths of the hiring evaluation system.
+Each benchmark compares an optimized code path against the reference
+implementation on synthetic data.
+
+Run with: python benchmark_system.py
+"""
+
+import sys
+import os
+import itertools
+import random
+import re
+import string
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+import logging
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_hiring_system import (
+    ResumeParser, SkillDictionary, load_skill_dictionary, parse_resumes,
+    ResumeIngestionPipeline, Candidate, Job, SkillsMatcher, SkillsIndex, BiasDetector,
+    CandidateEvaluator, EvaluationResult, ResumeDocument, EvaluationStore,
+    HiringDatabase, SQLiteStorage
+)
+
+# Keep per-record INFO logging out of the timings
+logging.getLogger('ai_hiring_system').setLevel(logging.WARNING)
+
+RESUME_SIZES = [1024, 10 * 1024, 100 * 1024]
+VOCABULARY_SIZES = [100, 2000, 20000]
+
+RESUME_LINES = [
+    "Senior software engineer with {years} years of experience building web platforms.",
+    "Skills: Python, Java, JavaScript, React, Node.js, SQL, Docker and Kubernetes.",
+    "Led a team of engineers using Jira, Confluence, Slack and Git for delivery.",
+    "Strong leadership, communication and problem-solving abilities.",
+    "AWS Certified Solutions Architect, Microsoft Azure certification.",
+    "Bachelor of Science in Computer Science, Masters in Data Engineering.",
+    "Designed data pipelines and dashboards used across the whole company.",
+    "Mentored junior developers and ran weekly architecture reviews.",
+    "Based in Seattle, WA and open to hybrid work arrangements.",
+    "Improved service latency by caching hot queries and batching writes.",
+]
+
+def make_resume(size_bytes: int, seed: int = 0) -> str:
+    """Build a synthetic resume of roughly size_bytes characters."""
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size_bytes:
+        line = rng.choice(RESUME_LINES).format(years=rng.randint(1, 20))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)[:size_bytes]
+
+def time_call(func, repeat: int = 20) -> float:
+    """Return the best wall-clock time of func() over repeat runs, in seconds."""
+    func()  # warm up
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_resume_parser():
+    """Compare the compiled extractors with the per-call regex parser."""
+    print("⏱️  Resume Parser: per-call regex vs compiled")
+    print(f"{'size':>8} {'per-call':>12} {'compiled':>12} {'speedup':>8}")
+
+    reference = ResumeParser()
+    compiled = ResumeParser(compiled=True)
+
+    for size in RESUME_SIZES:
+        resume_text = make_resume(size, seed=size)
+        repeat = max(5, 200 * 1024 // size)
+
+        percall_time = time_call(lambda: reference.parse_resume(resume_text), repeat)
+        compiled_time = time_call(lambda: compiled.parse_resume(resume_text), repeat)
+
+        print(f"{size // 1024:>6}KB {percall_time * 1000:>10.3f}ms {compiled_time * 1000:>10.3f}ms "
+              f"{percall_time / compiled_time:>7.2f}x")
+    print()
+
+def make_vocabulary(size: int, seed: int = 0) -> list:
+    """Build a synthetic skill vocabulary that includes the built-in skills."""
+    rng = random.Random(seed)
+    vocabulary = set(SkillDictionary.from_patterns(ResumeParser().skill_patterns).categories)
+    while len(vocabulary) < size:
+        words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+                 for _ in range(rng.randint(1, 2))]
+        vocabulary.add(' '.join(words))
+    return sorted(vocabulary)
+
+def benchmark_skill_dictionary():
+    """Compare a regex alternation with the Aho-Corasick skill dictionary."""
+    print("⏱️  Skill matching on a 10KB resume: regex alternation vs Aho-Corasick")
+    print(f"{'skills':>8} {'regex':>12} {'automaton':>12} {'load+build':>12} {'cached':>10}")
+
+    resume_text = make_resume(10 * 1024, seed=7).lower()
+
+    for size in VOCABULARY_SIZES:
+        vocabulary = make_vocabulary(size, seed=size)
+        regex = re.compile(r'\b(?:' + '|'.join(re.escape(skill) for skill in vocabulary) + r')\b')
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('\n'.join(vocabulary))
+            taxonomy_path = f.name
+        try:
+            start = time.perf_counter()
+            dictionary = load_skill_dictionary(taxonomy_path)
+            load_time = time.perf_counter() - start
+            cached_time = time_call(lambda: load_skill_dictionary(taxonomy_path), 5)
+        finally:
+            os.remove(taxonomy_path)
+
+        regex_time = time_call(lambda: regex.findall(resume_text), 5)
+        automaton_time = time_call(lambda: dictionary.find_all(resume_text), 5)
+
+        print(f"{size:>8} {regex_time * 1000:>10.3f}ms {automaton_time * 1000:>10.3f}ms "
+              f"{load_time * 1000:>10.1f}ms {cached_time * 1e6:>8.1f}us")
+    print()
+
+def benchmark_batch_parsing():
+    """Measure parse_resumes throughput for different pool sizes."""
+    print("⏱️  Batch parsing of 20,000 1KB resumes")
+    print(f"{'workers':>8} {'total':>12} {'per worker':>24}")
+
+    resumes = [make_resume(1024, seed=i % 50) for i in range(20000)]
+
+    for workers in (1, 2, 4):
+        throughput = {}
+        start = time.perf_counter()
+        for _ in parse_resumes(resumes, workers=workers, chunksize=256, throughput=throughput):
+            pass
+        elapsed = time.perf_counter() - start
+        per_worker = ', '.join(f"{stats.docs_per_second:.0f}" for stats in throughput.values())
+        print(f"{workers:>8} {len(resumes) / elapsed:>8.0f}/sec   docs/sec: {per_worker}")
+    print()
+
+def benchmark_ingestion():
+    """Show that folder ingestion runs in constant memory as the folder grows."""
+    print("⏱️  Folder ingestion of 2KB text resumes")
+    print(f"{'files':>8} {'rate':>14} {'peak memory':>12}")
+
+    for count in (1000, 5000):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i in range(count):
+                with open(os.path.join(tmp_dir, f"resume_{i:06d}.txt"), 'w') as f:
+                    f.write(make_resume(2048, seed=i % 50))
+
+            pipeline = ResumeIngestionPipeline(workers=4, queue_size=32)
+            tracemalloc.start()
+            start = time.perf_counter()
+            for _ in pipeline.run(tmp_dir):
+                pass
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(f"{count:>8} {count / elapsed:>9.0f}/sec {peak / 1024 / 1024:>10.2f}MB")
+    print()
+
+def make_candidates(count: int, seed: int = 0) -> list:
+    """Build synthetic candidates with 3-12 skills each from a 500-skill vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(500, seed=seed)
+    return [
+        Candidate(id=f"C{i:07d}", name=f"Candidate {i}", email=f"candidate{i}@example.com",
+                  resume_text="", skills=rng.sample(vocabulary, rng.randint(3, 12)),
+                  experience_years=float(rng.randint(0, 20)),
+                  education_level=rng.choice(['high school', 'associate', 'bachelor', 'masters', 'phd']),
+                  location=rng.choice(['San Francisco, CA', 'New York, NY', 'Austin, TX', 'Remote']))
+        for i in range(count)
+    ]
+
+def benchmark_skills_index():
+    """Compare scalar skills matching with the bit matrix index for one job."""
+    print("⏱️  Skills match of 100,000 candidates against one job")
+
+    candidates = make_candidates(100000)
+    required_skills = ['python', 'react', 'aws']
+    preferred_skills = ['docker', 'kubernetes', 'sql']
+    matcher = SkillsMatcher()
+
+    start = time.perf_counter()
+    index = SkillsIndex()
+    index.add_candidates(candidates)
+    build_time = time.perf_counter() - start
+
+    scalar_time = time_call(lambda: [matcher.calculate_skills_match(c.skills, required_skills, preferred_skills)
+                                     for c in candidates], 1)
+    index_time = time_call(lambda: index.calculate_skills_match(required_skills, preferred_skills), 5)
+
+    print(f"  scalar: {scalar_time * 1000:.1f}ms   index: {index_time * 1000:.1f}ms "
+          f"({scalar_time / index_time:.0f}x)   index build: {build_time * 1000:.1f}ms")
+    print()
+
+def make_jobs(count: int, seed: int = 0) -> list:
+    """Build synthetic jobs requiring skills from the built-in vocabulary."""
+    rng = random.Random(seed)
+    skills = ['python', 'java', 'react', 'aws', 'docker', 'kubernetes', 'sql', 'git', 'leadership']
+    return [
+        Job(id=f"J{i:05d}", title=rng.choice(['Backend Developer', 'Data Engineer', 'Team Lead']),
+            company=f"Company {i}", required_skills=rng.sample(skills, 3), preferred_skills=rng.sample(skills, 2),
+            experience_required=float(rng.randint(0, 10)),
+            education_required=rng.choice(['associate', 'bachelor', 'masters']),
+            location=rng.choice(['San Francisco, CA', 'New York, NY', 'Remote']),
+            department="Engineering", salary_range=(90000, 180000))
+        for i in range(count)
+    ]
+
+def benchmark_evaluate_many():
+    """Compare the pairwise evaluation loop with matrix evaluation."""
+    print("⏱️  Evaluating 2,000 candidates x 20 jobs")
+
+    candidates = make_candidates(2000, seed=3)
+    for candidate in candidates:
+        candidate.resume_text = make_resume(512, seed=int(candidate.id[1:]) % 50)
+    jobs = make_jobs(20, seed=3)
+    evaluator = CandidateEvaluator()
+
+    loop_time = time_call(lambda: [evaluator.evaluate_candidate(c, j) for j in jobs for c in candidates], 1)
+    matrix_time = time_call(lambda: evaluator.evaluate_many(candidates, jobs), 3)
+
+    print(f"  pairwise loop: {loop_time * 1000:.0f}ms   evaluate_many: {matrix_time * 1000:.0f}ms "
+          f"({loop_time / matrix_time:.0f}x)")
+    print()
+
+def make_evaluations(count: int, seed: int = 0) -> list:
+    """Build synthetic evaluation results spread over 10,000 candidates and 50 jobs."""
+    rng = random.Random(seed)
+    return [
+        EvaluationResult(candidate_id=f"C{rng.randrange(10000):07d}", job_id=f"J{rng.randrange(50):05d}",
+                         overall_score=rng.random(), skills_match=rng.random(), experience_match=rng.random(),
+                         education_match=rng.random(), location_match=rng.random(),
+                         bias_indicators=["Gender-specific language detected"] if rng.random() < 0.1 else [],
+                         recommendations=["Strong match - recommend interview"], timestamp=datetime.now())
+        for _ in range(count)
+    ]
+
+def benchmark_evaluation_store():
+    """Compare the memory of a list of EvaluationResult with the columnar store."""
+    print("⏱️  Storing 100,000 evaluations: list of objects vs columnar store")
+
+    count = 100000
+    tracemalloc.start()
+    evaluations = make_evaluations(count)
+    list_bytes = tracemalloc.get_traced_memory()[0]
+
+    store = EvaluationStore()
+    for evaluation in make_evaluations(count):
+        store.append(evaluation)
+    store_bytes = tracemalloc.get_traced_memory()[0] - list_bytes
+    tracemalloc.stop()
+
+    list_query = time_call(lambda: [e.overall_score for e in evaluations if e.job_id == "J00007"], 3)
+    store_query = time_call(lambda: store.column('overall_score', store.rows(job_id="J00007")), 3)
+
+    print(f"  list: {list_bytes / count:.0f} B/evaluation   store: {store_bytes / count:.0f} B/evaluation "
+          f"({list_bytes / store_bytes:.0f}x)")
+    print(f"  scores for one job: list scan {list_query * 1000:.2f}ms   store index {store_query * 1000:.3f}ms")
+    print()
+
+def benchmark_sqlite_storage():
+    """Compare insert and query rates of the in-memory and SQLite-backed databases."""
+    print("⏱️  100,000 evaluations: in-memory vs SQLite (WAL) backend")
+    print(f"{'backend':>10} {'bulk insert':>14} {'top-10':>10} {'by candidate':>14}")
+
+    evaluations = make_evaluations(100000, seed=5)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        storage = SQLiteStorage(os.path.join(tmp_dir, "hiring.db"))
+        for name, db in (("memory", HiringDatabase()), ("sqlite", HiringDatabase(storage=storage))):
+            start = time.perf_counter()
+            db.add_evaluations(evaluations)
+            insert_time = time.perf_counter() - start
+
+            # Top-k always comes from the in-memory ranking; filters go to storage when configured
+            top_time = time_call(lambda: db.rankings["J00007"].top(10), 20)
+            filter_time = time_call(lambda: db.find_evaluations(candidate_id="C0000042", min_score=0.5), 20)
+
+            print(f"{name:>10} {len(evaluations) / insert_time:>10.0f}/sec {top_time * 1e6:>8.0f}us "
+                  f"{filter_time * 1e6:>12.0f}us")
+        storage.close()
+    print()
+
+def benchmark_jsonl_export():
+    """Compare the nested JSON export with the streaming JSON Lines export."""
+    print("⏱️  Exporting 200,000 evaluations")
+    print(f"{'format':>14} {'rate':>16} {'peak memory':>12}")
+
+    db = HiringDatabase()
+    db.add_evaluations(make_evaluations(200000, seed=9))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exports = (
+            ("json", lambda path: db.export_data(path)),
+            ("jsonl", lambda path: db.export_jsonl(path)),
+            ("jsonl.gz", lambda path: db.export_jsonl(path, compress=True))
+        )
+        for name, export in exports:
+            path = os.path.join(tmp_dir, f"export.{name}")
+            tracemalloc.start()
+            start = time.perf_counter()
+            export(path)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:>14} {len(db.evaluations) / elapsed:>9.0f} rec/sec {peak / 1024 / 1024:>10.1f}MB")
+    print()
+
+def benchmark_columnar_export():
+    """Compare loading scores from the JSON export with memory-mapped .npy columns."""
+    print("⏱️  Loading 500,000 evaluations into pandas")
+
+    import json
+    import pandas as pd
+    from ai_hiring_system import load_columnar_export
+
+    db = HiringDatabase()
+    db.add_evaluations(make_evaluations(500000, seed=13))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "hiring_data_export.json")
+        db.export_data(json_path)
+        start = time.perf_counter()
+        db.export_columnar(tmp_dir)
+        export_time = time.perf_counter() - start
+
+        def load_json():
+            with open(json_path) as f:
+                return pd.DataFrame(json.load(f)['evaluations'])
+
+        def load_npy():
+            columns = load_columnar_export(tmp_dir)['evaluations']
+            return pd.DataFrame({name: columns[name] for name in HiringDatabase.EXPORT_EVALUATION_COLUMNS}, copy=False)
+
+        json_time = time_call(load_json, 1)
+        npy_time = time_call(load_npy, 3)
+
+    print(f"  json re-parse: {json_time * 1000:.0f}ms   mmap .npy: {npy_time * 1000:.1f}ms "
+          f"({json_time / npy_time:.0f}x)   columnar export: {export_time * 1000:.0f}ms")
+    print()
+
+def benchmark_bulk_load():
+    """Compare per-object add_candidate calls with the chunked CSV bulk loader."""
+    print("⏱️  Loading 200,000 candidates from CSV")
+
+    import csv
+    from ai_hiring_system import bulk_load
+
+    candidates = make_candidates(200000, seed=17)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "candidates.csv")
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'name', 'email', 'skills', 'experience_years', 'education_level', 'location'])
+            for c in candidates:
+                writer.writerow([c.id, c.name, c.email, ';'.join(c.skills), c.experience_years,
+                                 c.education_level, c.location])
+        del candidates
+
+        def load_per_object():
+            db = HiringDatabase()
+            with open(path, newline='') as f:
+                for row in csv.DictReader(f):
+                    db.add_candidate(Candidate(
+                        id=row['id'], name=row['name'], email=row['email'], resume_text='',
+                        skills=[s for s in row['skills'].split(';') if s],
+                        experience_years=float(row['experience_years']),
+                        education_level=row['education_level'], location=row['location']))
+
+        per_object_time = time_call(load_per_object, 1)
+        report = bulk_load(HiringDatabase(), path)
+
+    print(f"  per-object: {200000 / per_object_time:.0f} rows/sec   bulk_load: {report.rows_per_second:.0f} rows/sec "
+          f"in {report.chunks} chunks   peak RSS: {report.peak_rss_mb:.0f}MB")
+    print()
+
+def benchmark_bias_detector():
+    """Compare the per-indicator substring test with the compiled word-bounded matcher."""
+    print("⏱️  Bias detection on 10,000 resumes without bias indicators")
+
+    detector = BiasDetector()
+    neutral_lines = [line for line in RESUME_LINES if not detector.detect_bias(line, "")]
+    rng = random.Random(0)
+    corpus = [" ".join(rng.choice(neutral_lines).format(years=rng.randint(1, 20)) for _ in range(25))
+              for _ in range(10000)]
+    indicators = [(bias_type, indicator) for bias_type, values in detector.bias_indicators.items() for indicator in values]
+
+    def substring_scan():
+        results = []
+        for text in corpus:
+            text_lower = text.lower()
+            found = {}
+            for bias_type, indicator in indicators:
+                if indicator in text_lower:
+                    found.setdefault(bias_type, []).append(indicator)
+            results.append(found)
+        return results
+
+    substring_time = time_call(substring_scan, 3)
+    batch_time = time_call(lambda: detector.detect_bias_batch(corpus), 3)
+    substring_rate = sum(1 for found in substring_scan() if found) / len(corpus)
+    batch_rate = sum(1 for found in detector.detect_bias_batch(corpus) if found) / len(corpus)
+
+    print(f"  substring: {substring_time * 1000:.0f}ms, {substring_rate:.0%} flagged   "
+          f"detect_bias_batch: {batch_time * 1000:.0f}ms, {batch_rate:.0%} flagged")
+    print()
+
+def benchmark_resume_document():
+    """Compare per-pair bias scans of raw text with a shared ResumeDocument."""
+    print("⏱️  Bias checks for 1,000 2KB resumes x 20 jobs")
+
+    detector = BiasDetector()
+    resumes = [make_resume(2048, seed=i % 50) + f" #{i}" for i in range(1000)]
+    job_descriptions = [f"{job.title} {job.company}" for job in make_jobs(20, seed=5)]
+
+    text_time = time_call(lambda: [detector.detect_bias(resume, job) for resume in resumes
+                                   for job in job_descriptions], 1)
+
+    def with_documents():
+        documents = [ResumeDocument(resume) for resume in resumes]
+        return [detector.detect_bias(document, job) for document in documents for job in job_descriptions]
+
+    document_time = time_call(with_documents, 1)
+    print(f"  raw text per pair: {text_time * 1000:.0f}ms   shared document: {document_time * 1000:.0f}ms "
+          f"({text_time / document_time:.1f}x)")
+    print()
+
+def benchmark_compiled_job():
+    """Compare per-candidate job-side work with a precompiled job profile."""
+    print("⏱️  Scoring 20,000 candidates against one job")
+
+    candidates = make_candidates(20000, seed=19)
+    for candidate in candidates:
+        candidate.resume_text = make_resume(512, seed=int(candidate.id[1:]) % 50)
+    job = make_jobs(1, seed=19)[0]
+    evaluator = CandidateEvaluator()
+    for candidate in candidates:
+        evaluator.document_for(candidate)
+
+    def score_raw():
+        # The job-side work evaluate_candidate did for every candidate before job profiles
+        for c in candidates:
+            evaluator.skills_matcher.calculate_skills_match(c.skills, job.required_skills, job.preferred_skills)
+            evaluator._calculate_education_match(c.education_level, job.education_required)
+            evaluator._calculate_location_match(c.location, job.location)
+            evaluator.bias_detector.detect_bias(evaluator.document_for(c), f"{job.title} {job.company}")
+
+    def score_compiled():
+        compiled = evaluator.compile_job(job)
+        for c in candidates:
+            evaluator.skills_matcher.calculate_lowered_skills_match(
+                [skill.lower() for skill in c.skills], compiled.required_skills, compiled.preferred_skills)
+            evaluator._education_level_match(evaluator.education_hierarchy.get(c.education_level.lower(), 1),
+                                             compiled.education_level)
+            evaluator._compiled_location_match(c.location.lower(), compiled)
+            evaluator.bias_detector.detect_bias_precomputed(evaluator.document_for(c), compiled.description,
+                                                            compiled.bias_hits)
+
+    raw_time = time_call(score_raw, 3)
+    compiled_time = time_call(score_compiled, 3)
+    full_time = time_call(lambda: [evaluator.evaluate_candidate(c, job) for c in candidates], 1)
+    print(f"  raw job: {raw_time * 1000:.0f}ms   compiled job: {compiled_time * 1000:.0f}ms "
+          f"({raw_time / compiled_time:.1f}x)   full evaluate_candidate: {full_time * 1000:.0f}ms")
+    print()
+
+def benchmark_location_search():
+    """Compare substring location filtering with the gazetteer location index."""
+    print("⏱️  Location search over 100,000 candidates")
+
+    rng = random.Random(23)
+    db = HiringDatabase()
+    from ai_hiring_system import default_gazetteer
+    cities = default_gazetteer().names
+    candidates = make_candidates(100000, seed=23)
+    for candidate in candidates:
+        candidate.location = rng.choice(cities)
+    db.add_candidates(candidates)
+
+    scan_time = time_call(lambda: [c for c in candidates if "seattle, wa" in c.location.lower()], 5)
+    index_time = time_call(lambda: db.find_candidates_by_location("Seattle, WA"), 5)
+    radius_time = time_call(lambda: db.find_candidates_by_location("New York, NY", radius_km=50), 5)
+    print(f"  substring scan: {scan_time * 1000:.1f}ms   index lookup: {index_time * 1000:.2f}ms "
+          f"({scan_time / index_time:.0f}x)   50km radius: {radius_time * 1000:.2f}ms")
+    print()
+
+def benchmark_pagination():
+    """Compare materializing full lists with keyset pages of 100 records."""
+    print("⏱️  One page of 100 from 300,000 evaluations and 100,000 candidates")
+
+    store = EvaluationStore()
+    for evaluation in make_evaluations(300000, seed=31):
+        store.append(evaluation)
+    db = HiringDatabase()
+    db.add_candidates(make_candidates(100000, seed=31))
+    middle = sorted(db.candidates)[50000]
+
+    full_evaluations = time_call(lambda: [e.__dict__ for e in store], 1)
+    page_evaluations = time_call(lambda: [store[int(r)].__dict__ for r in store.page(after=150000, limit=100)])
+    full_job = time_call(lambda: [e.__dict__ for e in store.select(job_id="J00007")], 3)
+    page_job = time_call(lambda: [store[int(r)].__dict__ for r in store.page(after=150000, limit=100, job_id="J00007")])
+    full_candidates = time_call(lambda: sorted(db.get_all_candidates(), key=lambda c: c.id), 3)
+    page_candidates = time_call(lambda: list(itertools.islice(db.iter_candidates(after=middle), 100)))
+    print(f"  evaluations: all {full_evaluations * 1000:.0f}ms   page {page_evaluations * 1000:.2f}ms   "
+          f"one job: all {full_job * 1000:.0f}ms   page {page_job * 1000:.2f}ms")
+    print(f"  candidates:  all sorted {full_candidates * 1000:.0f}ms   page {page_candidates * 1000:.3f}ms")
+    print()
+
+def benchmark_serialization():
+    """Compare FastAPI's jsonable_encoder with the API's direct encoders per record type."""
+    print("⏱️  Encoding 20,000 records per type (records/second)")
+    try:
+        import json
+        from fastapi.encoders import jsonable_encoder
+        sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+        import serialization
+    except ImportError as e:
+        print(f"  skipped: {e}")
+        print()
+        return
+
+    candidates = make_candidates(20000, seed=37)
+    for candidate in candidates:
+        candidate.evaluation_timestamp = datetime.now()
+    record_types = {
+        'Candidate': candidates,
+        'Job': make_jobs(20000, seed=37),
+        'EvaluationResult': make_evaluations(20000, seed=37)
+    }
+    encoders = {'jsonable_encoder': lambda records: json.dumps(jsonable_encoder(records)).encode()}
+    encoders.update(serialization.ENCODERS)
+
+    for type_name, records in record_types.items():
+        rates = {name: len(records) / time_call(lambda: encode(records), 3) for name, encode in encoders.items()}
+        baseline = rates['jsonable_encoder']
+        print(f"  {type_name:<17}" + "   ".join(
+            f"{name}: {rate / 1000:.0f}k/s" + ("" if name == 'jsonable_encoder' else f" ({rate / baseline:.0f}x)")
+            for name, rate in rates.items()))
+    print(f"  default API encoder: {serialization.BACKEND}")
+    print()
+
+def benchmark_api_latency():
+    """Compare /health p99 latency under mixed load with inline and pooled evaluation."""
+    print("⏱️  API p99 latency under mixed load (8 evaluation batches + 200 health checks)")
+    try:
+        import asyncio
+        import httpx
+        from fastapi import FastAPI
+        sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+        from app import CPUWorkPool
+    except ImportError as e:
+        print(f"  skipped: {e}")
+        print()
+        return
+
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    candidates = make_candidates(1000, seed=29)
+    for candidate in candidates:
+        candidate.resume_text = make_resume(4096, seed=int(candidate.id[1:]))
+    job = make_jobs(1, seed=29)[0]
+
+    def evaluate_batch():
+        # A fresh evaluator per request so no request is served from another's caches
+        evaluator = CandidateEvaluator()
+        return len([evaluator.evaluate_candidate(c, job) for c in candidates])
+
+    def measure(pool):
+        bench_app = FastAPI()
+
+        @bench_app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+
+        @bench_app.post("/evaluate")
+        async def evaluate():
+            return {"evaluated": await pool.run(evaluate_batch)}
+
+        async def send(start, client, method, url):
+            # Latency is measured from the scheduled send time, so time spent
+            # waiting for a blocked event loop counts against the request
+            await asyncio.sleep(max(0.0, start - time.perf_counter()))
+            response = await client.request(method, url)
+            assert response.status_code == 200
+            return url, time.perf_counter() - start
+
+        async def mixed_load():
+            transport = httpx.ASGITransport(app=bench_app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                begin = time.perf_counter()
+                requests = [send(begin + i * 0.1, client, "POST", "/evaluate") for i in range(8)]
+                requests += [send(begin + i * 0.005, client, "GET", "/health") for i in range(200)]
+                return await asyncio.gather(*requests)
+
+        results = asyncio.run(mixed_load())
+        pool.shutdown()
+        health = sorted(elapsed for url, elapsed in results if url == "/health")
+        evaluate = sorted(elapsed for url, elapsed in results if url == "/evaluate")
+        p99 = health[min(len(health) - 1, int(len(health) * 0.99))]
+        return p99, evaluate[-1]
+
+    inline_p99, inline_total = measure(CPUWorkPool(workers=0))
+    pooled_p99, pooled_total = measure(CPUWorkPool(workers=2, queue_depth=16))
+    print(f"  inline: health p99 {inline_p99 * 1000:.0f}ms, slowest evaluate {inline_total * 1000:.0f}ms")
+    print(f"  pooled: health p99 {pooled_p99 * 1000:.0f}ms, slowest evaluate {pooled_total * 1000:.0f}ms "
+          f"({inline_p99 / pooled_p99:.0f}x lower p99)")
+    print()
+
+def run_all_benchmarks():
+    """Run all benchmark functions."""
+    print("🚀 Starting AI Hiring System Benchmarks...\n")
+
+    benchmarks = [
+        benchmark_resume_parser,
+        benchmark_skill_dictionary,
+        benchmark_batch_parsing,
+        benchmark_ingestion,
+        benchmark_skills_index,
+        benchmark_evaluate_many,
+        benchmark_evaluation_store,
+        benchmark_sqlite_storage,
+        benchmark_jsonl_export,
+        benchmark_columnar_export,
+        benchmark_bulk_load,
+        benchmark_bias_detector,
+        benchmark_resume_document,
+        benchmark_compiled_job,
+        benchmark_location_search,
+        benchmark_pagination,
+        benchmark_serialization,
+        benchmark_api_latency
+    ]
+
+    for benchmark in benchmarks:
+        benchmark()
+
+if __name__ == "__main__":
+    run_all_benchmarks()
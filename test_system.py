@@ -10,13 +10,25 @@ Run with: python test_system.py
 
 import sys
 import os
+import copy
+import dataclasses
+import random
+import tempfile
+import zipfile
+from datetime import datetime
+
+import numpy as np
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from ai_hiring_system import (
-    Candidate, Job, ResumeParser, SkillsMatcher, 
-    BiasDetector, CandidateEvaluator, HiringDatabase
+    Candidate, Job, EvaluationResult, ResumeParser, SkillsMatcher, 
+    BiasDetector, CandidateEvaluator, HiringDatabase,
+    SkillDictionary, load_skill_dictionary, parse_resumes, ResumeParseCache,
+    ResumeIngestionPipeline, SkillsIndex, EvaluationStore, HiringAnalytics,
+    SQLiteStorage, load_columnar_export, bulk_load, ResumeDocument, default_gazetteer, Gazetteer,
+    create_sample_data
 )
 
 def test_resume_parser():
@@ -45,6 +57,212 @@ def test_resume_parser():
     
     print("✅ Resume Parser: PASSED")
 
+def test_compiled_resume_parser():
+    """Test that the compiled parser returns the same result as the per-call parser."""
+    print("🧪 Testing Compiled Resume Parser...")
+    
+    reference = ResumeParser()
+    compiled = ResumeParser(compiled=True)
+    
+    resumes = [
+        "Experienced Python developer with 5 years in web development. Proficient in React, Node.js, and AWS.",
+        "JAVA engineer, 12 yrs. Certified Scrum master with a PhD and Masters. Lives in New York, NY.",
+        "Associate degree. Teamwork, problem-solving, Jira and Confluence. AWS certification.",
+        "No recognisable content here",
+        ""
+    ]
+    
+    for resume_text in resumes:
+        expected = reference.parse_resume(resume_text)
+        result = compiled.parse_resume(resume_text)
+        assert set(result['skills']) == set(expected['skills']), f"Skills differ for: {resume_text}"
+        for field in ('experience_years', 'education_level', 'location'):
+            assert result[field] == expected[field], f"{field} differs for: {resume_text}"
+    
+    print("✅ Compiled Resume Parser: PASSED")
+
+def test_skill_dictionary():
+    """Test the Aho-Corasick skill dictionary."""
+    print("🧪 Testing Skill Dictionary...")
+    
+    dictionary = SkillDictionary({
+        'programming': ['C++', 'Java', 'JavaScript', 'Node.js', 'node', 'Machine Learning'],
+        'tools': ['git']
+    })
+    
+    skills = dictionary.find_all("Wrote C++, Node.js and JavaScript; some machine learning. github, git.")
+    assert skills == ['c++', 'node.js', 'javascript', 'machine learning', 'git'], f"Unexpected matches: {skills}"
+    assert dictionary.categories['c++'] == 'programming', "Category not recorded"
+    
+    # Built from the default patterns it finds the same skills as the regex parser
+    reference = ResumeParser()
+    parser = ResumeParser(skill_dictionary=SkillDictionary.from_patterns(reference.skill_patterns))
+    resume_text = "Python and React developer, AWS certified, uses Jira, Slack and Docker. Teamwork."
+    assert set(parser.parse_resume(resume_text)['skills']) == set(reference.parse_resume(resume_text)['skills'])
+    
+    # Taxonomy files are loaded once while unchanged
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'skills.txt')
+        with open(path, 'w') as f:
+            f.write("# taxonomy\nprogramming\tRust\nTerraform\n")
+        loaded = load_skill_dictionary(path)
+        assert load_skill_dictionary(path) is loaded, "Taxonomy was not cached"
+        assert loaded.categories == {'rust': 'programming', 'terraform': 'general'}
+        assert loaded.find_all("Rust and Terraform") == ['rust', 'terraform']
+    
+    print("✅ Skill Dictionary: PASSED")
+
+def test_batch_resume_parsing():
+    """Test process-pool batch parsing keeps input order and reports throughput."""
+    print("🧪 Testing Batch Resume Parsing...")
+    
+    parser = ResumeParser()
+    resumes = [f"Python developer with {i} years of experience in Austin, TX" for i in range(1, 101)]
+    
+    throughput = {}
+    results = list(parse_resumes(iter(resumes), workers=2, chunksize=7, throughput=throughput))
+    
+    assert len(results) == len(resumes), "Some resumes were not parsed"
+    assert [r['experience_years'] for r in results] == [float(i) for i in range(1, 101)], "Input order not kept"
+    expected = parser.parse_resume(resumes[0])
+    assert set(results[0]['skills']) == set(expected['skills']), "Batch result differs from parse_resume"
+    assert results[0]['location'] == expected['location'], "Batch result differs from parse_resume"
+    assert sum(stats.documents for stats in throughput.values()) == len(resumes), "Throughput not recorded"
+    assert all(stats.docs_per_second > 0 for stats in throughput.values())
+    
+    print("✅ Batch Resume Parsing: PASSED")
+
+def test_resume_parse_cache():
+    """Test the content-addressed parse cache."""
+    print("🧪 Testing Resume Parse Cache...")
+    
+    parser = ResumeParser()
+    resume_text = "Python developer with 4 years of experience. Based in Seattle, WA."
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ResumeParseCache(directory=tmp_dir)
+        first = cache.parse(parser, resume_text)
+        first['skills'].append('mutated')
+        second = cache.parse(parser, resume_text)
+        assert second['skills'] == ['python'], "Cached entry was mutated by the caller"
+        assert (cache.hits, cache.misses) == (1, 1), f"Unexpected counters: {cache.stats()}"
+        
+        # A different parser configuration is a different entry
+        other_parser = ResumeParser()
+        other_parser.education_levels = ['phd']
+        cache.parse(other_parser, resume_text)
+        assert cache.misses == 2, "Parser configuration not part of the key"
+        
+        # The disk tier survives a new cache instance
+        restarted = ResumeParseCache(directory=tmp_dir)
+        assert restarted.parse(parser, resume_text)['experience_years'] == 4.0
+        assert restarted.stats()['disk_hits'] == 1, "Entry not served from disk"
+    
+    # The memory tier evicts least recently used entries by size
+    small = ResumeParseCache(max_bytes=300)
+    for i in range(10):
+        small.parse(parser, f"{resume_text} Resume number {i}")
+    assert small.current_bytes <= 300 and small.evictions > 0, "Cache did not evict"
+    
+    # The evaluator goes through the cache when skills are missing
+    evaluator = CandidateEvaluator(parse_cache=ResumeParseCache())
+    job = Job(id="J1", title="Developer", company="Co", required_skills=["python"],
+              preferred_skills=[], experience_required=2.0, education_required="bachelor",
+              location="Seattle, WA", department="Engineering", salary_range=(1, 2))
+    for candidate_id in ("A", "B"):
+        candidate = Candidate(id=candidate_id, name="Same Resume", email="x@example.com",
+                              resume_text=resume_text, skills=[], experience_years=0.0,
+                              education_level="", location="")
+        evaluator.evaluate_candidate(candidate, job)
+    assert evaluator.parse_cache.stats()['hits'] == 1, "Evaluator did not reuse the parse"
+    
+    print("✅ Resume Parse Cache: PASSED")
+
+def test_resume_ingestion_pipeline():
+    """Test streaming ingestion from a folder with nested files and an archive."""
+    print("🧪 Testing Resume Ingestion Pipeline...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'batch'))
+        with open(os.path.join(tmp_dir, 'jane_doe.txt'), 'w') as f:
+            f.write("Jane Doe jane@example.com\nPython engineer, 6 years. Masters degree. Boston, MA")
+        for i in range(20):
+            with open(os.path.join(tmp_dir, 'batch', f'candidate_{i}.txt'), 'w') as f:
+                f.write(f"Java developer with {i + 1} years experience")
+        with open(os.path.join(tmp_dir, 'notes.md'), 'w') as f:
+            f.write("Not a resume")
+        with open(os.path.join(tmp_dir, 'broken.pdf'), 'wb') as f:
+            f.write(b"not really a pdf")
+        with zipfile.ZipFile(os.path.join(tmp_dir, 'archive.zip'), 'w') as archive:
+            archive.writestr('zipped/john_smith.txt', "Docker and Kubernetes, 3 years")
+        
+        pipeline = ResumeIngestionPipeline(workers=3, queue_size=2)
+        candidates = {c.name: c for c in pipeline.run(tmp_dir)}
+    
+    assert len(candidates) == 22, f"Expected 22 candidates, got {len(candidates)}"
+    assert pipeline.processed == 22 and pipeline.failed == 1, "Broken file not counted as failed"
+    
+    jane = candidates['Jane Doe']
+    assert jane.email == 'jane@example.com', "Email not extracted"
+    assert jane.skills == ['python'] and jane.experience_years == 6.0
+    assert jane.education_level == 'masters' and jane.location == 'Boston, MA'
+    assert set(candidates['John Smith'].skills) == {'docker', 'kubernetes'}, "Archive member not ingested"
+    assert len({c.id for c in candidates.values()}) == 22, "Candidate ids are not unique"
+    
+    print("✅ Resume Ingestion Pipeline: PASSED")
+
+def test_resume_document():
+    """Test that a shared ResumeDocument is processed once across many jobs."""
+    print("🧪 Testing Resume Document...")
+    
+    document = ResumeDocument("He knows Python.\nThe experience: 5 years")
+    assert document.lower == document.text.lower()
+    assert document.feature("length", lambda d: len(d.text)) == len(document.text)
+    assert document.feature("length", lambda d: -1) == len(document.text), "Feature was recomputed"
+    
+    parser = ResumeParser()
+    first = parser.parse_resume(document)
+    assert first == parser.parse_resume(document.text)
+    first['skills'].append("cobol")
+    assert "cobol" not in parser.parse_resume(document)['skills'], "Cached parse result was mutated"
+    
+    # Count how often the evaluator parses and bias-scans the resume text
+    evaluator = CandidateEvaluator()
+    parse_text = evaluator.resume_parser._parse_text
+    parsed_texts = []
+    def counting_parse(resume_text, text_lower):
+        parsed_texts.append(resume_text)
+        return parse_text(resume_text, text_lower)
+    evaluator.resume_parser._parse_text = counting_parse
+    
+    indicator_regex = evaluator.bias_detector._indicator_regex
+    scanned_texts = []
+    class CountingRegex:
+        def findall(self, text):
+            scanned_texts.append(text)
+            return indicator_regex.findall(text)
+    evaluator.bias_detector._indicator_regex = CountingRegex()
+    
+    resume_text = "Experienced Python developer, 6 years of experience. He led the data team. Bachelor degree."
+    candidate = Candidate(
+        id="R1", name="Dana", email="", resume_text=resume_text, skills=[],
+        experience_years=0.0, education_level="", location=""
+    )
+    jobs = [
+        Job(id=f"J{i}", title=title, company="Acme", required_skills=["python"], preferred_skills=[],
+            experience_required=3.0, education_required="bachelor", location="Remote", department="Engineering",
+            salary_range=(0, 0))
+        for i, title in enumerate(["Backend Developer", "Data Engineer", "Senior Developer"])
+    ]
+    results = [evaluator.evaluate_candidate(candidate, job) for job in jobs]
+    
+    assert parsed_texts == [resume_text], f"Resume parsed {len(parsed_texts)} times"
+    assert scanned_texts.count(resume_text.lower()) == 1, "Resume scanned for bias more than once"
+    assert all(result.bias_indicators[0] == 'gender_bias' for result in results)
+    assert 'age_bias' in results[2].bias_indicators
+    
+    print("✅ Resume Document: PASSED")
+
 def test_skills_matcher():
     """Test the skills matching functionality."""
     print("🧪 Testing Skills Matcher...")
@@ -64,6 +282,40 @@ def test_skills_matcher():
     
     print("✅ Skills Matcher: PASSED")
 
+def test_skills_index():
+    """Test that the bit matrix index scores like the scalar skills matcher."""
+    print("🧪 Testing Skills Index...")
+    
+    matcher = SkillsMatcher()
+    rng = random.Random(42)
+    vocabulary = ['python', 'java', 'javascript', 'react', 'aws', 'aws lambda',
+                  'docker', 'kubernetes', 'sql', 'nosql', 'c++', 'node.js']
+    candidates = [
+        Candidate(id=f"C{i}", name=f"Candidate {i}", email="", resume_text="",
+                  skills=rng.sample(vocabulary, rng.randint(0, 6)), experience_years=0.0,
+                  education_level="bachelor", location="")
+        for i in range(500)
+    ]
+    
+    index = SkillsIndex()
+    index.add_candidates(candidates[:200])
+    index.add_candidates(candidates[200:])
+    assert index.candidate_ids == [c.id for c in candidates], "Rows not in insertion order"
+    
+    jobs = [(['python', 'react'], ['aws', 'docker']), (['AWS'], ['SQL']), ([], ['python']), (['ruby'], [])]
+    for required_skills, preferred_skills in jobs:
+        scores = index.calculate_skills_match(required_skills, preferred_skills)
+        expected = [matcher.calculate_skills_match(c.skills, required_skills, preferred_skills)
+                    for c in candidates]
+        assert scores.tolist() == expected, f"Scores differ for {required_skills}/{preferred_skills}"
+    
+    # Re-adding a candidate replaces its skills
+    candidates[0].skills = ['python', 'react']
+    index.add_candidates([candidates[0]])
+    assert len(index) == 500 and index.calculate_skills_match(['python', 'react'], [])[0] == 0.8
+    
+    print("✅ Skills Index: PASSED")
+
 def test_bias_detector():
     """Test the bias detection functionality."""
     print("🧪 Testing Bias Detector...")
@@ -83,6 +335,105 @@ def test_bias_detector():
     
     print("✅ Bias Detector: PASSED")
 
+def test_bias_detector_word_boundaries():
+    """Test that bias indicators only match whole words, in single and batch mode."""
+    print("🧪 Testing Bias Detector Word Boundaries...")
+    
+    detector = BiasDetector()
+    
+    # Neutral sentences full of words that contain indicators as substrings
+    neutral_words = ["the", "experience", "there", "other", "shell", "history", "hero", "ahead",
+                     "together", "cold", "holder", "seniority", "localization", "remotely", "dishonest",
+                     "whereas", "shepherd", "therapist", "oldest", "bold"]
+    rng = random.Random(3)
+    corpus = [" ".join(rng.choice(neutral_words) for _ in range(40)) for _ in range(500)]
+    
+    results = detector.detect_bias_batch(corpus)
+    false_positive_rate = sum(1 for result in results if result) / len(corpus)
+    assert false_positive_rate == 0.0, f"False positive rate {false_positive_rate:.1%} on neutral corpus"
+    
+    # The substring test this replaces flags nearly all of them
+    substring_flags = sum(1 for text in corpus if any(
+        indicator in text for indicators in detector.bias_indicators.values() for indicator in indicators))
+    assert substring_flags / len(corpus) > 0.9
+    
+    texts = [
+        "He led the platform team.",
+        "She's a Fresh Graduate from a prestigious school",
+        "Experienced engineer, open to relocation.",
+        "Other than that, the history holds."
+    ]
+    expected = [
+        {'gender_bias': ['he']},
+        {'gender_bias': ['she'], 'age_bias': ['fresh graduate'], 'education_bias': ['prestigious']},
+        {'location_bias': ['relocation']},
+        {}
+    ]
+    assert detector.detect_bias_batch(texts) == expected
+    assert [detector.detect_bias(text, "") for text in texts] == expected
+    
+    # Multi-word indicators still match across the resume/job join
+    assert detector.detect_bias("Applicant is a fresh", "graduate role")['age_bias'] == ['fresh graduate']
+    masks = detector.detect_bias_matrix(["Applicant is a fresh", "so refresh"], ["graduate role", "graduates"])
+    assert masks.tolist() == [[2, 0], [0, 0]]
+    
+    print("✅ Bias Detector Word Boundaries: PASSED")
+
+def test_gazetteer_locations():
+    """Test gazetteer resolution, radius queries and location-based scoring and search."""
+    print("🧪 Testing Gazetteer Locations...")
+    
+    gazetteer = default_gazetteer()
+    seattle = gazetteer.resolve("Seattle, WA")
+    assert seattle is not None
+    assert gazetteer.resolve("seattle wa") == gazetteer.resolve("Seattle, Washington, USA") == seattle
+    assert gazetteer.resolve("Portland") is None, "Ambiguous bare city should not resolve"
+    assert gazetteer.names[gazetteer.resolve("Portland, Oregon")] == "Portland, OR"
+    assert gazetteer.resolve("Remote") is None
+    
+    new_york = gazetteer.resolve("New York, NY")
+    nearby = [gazetteer.names[i] for i in gazetteer.near(new_york, 30)]
+    assert nearby[0] == "New York, NY" and "Jersey City, NJ" in nearby and "Boston, MA" not in nearby
+    assert 300 < gazetteer.distance_km(new_york, gazetteer.resolve("Boston, MA")) < 320
+    
+    # Lookups are memoized, but only up to max_resolved distinct strings
+    bounded = Gazetteer([("Seattle", "WA", 47.6, -122.3)], max_resolved=3)
+    for i in range(100):
+        assert bounded.resolve(f"Nowhere {i}") is None
+    assert bounded.resolve("Seattle, WA") == 0
+    assert bounded._resolve_cached.cache_info().currsize == 3
+    
+    evaluator = CandidateEvaluator()
+    assert evaluator._calculate_location_match("Seattle, Washington", "Seattle, WA") == 1.0
+    assert evaluator._calculate_location_match("Jersey City, NJ", "New York, NY") == 0.7
+    assert evaluator._calculate_location_match("Portland, ME", "Portland, OR") == 0.3
+    assert evaluator._calculate_location_match("Austin, TX", "Remote") == 0.9
+    assert evaluator._calculate_location_match("Springfield, XY", "Springfield area") == 0.7
+    
+    db = HiringDatabase()
+    for candidate_id, location in (("R1", "New York, NY"), ("R2", "Jersey City, NJ"), ("R3", "Boston, MA"),
+                                   ("R4", "Brooklyn, NY"), ("R5", "Unknown")):
+        db.add_candidate(Candidate(
+            id=candidate_id, name=candidate_id, email="", resume_text="", skills=[],
+            experience_years=1.0, education_level="bachelor", location=location
+        ))
+    assert [c.id for c in db.find_candidates_by_location("new york ny")] == ["R1"]
+    assert [c.id for c in db.find_candidates_by_location("NYC", radius_km=30)] == ["R1", "R2", "R4"]
+    assert [c.id for c in db.find_candidates_by_location("unknown")] == ["R5"]
+    for location, radius_km in (("new york ny", 0.0), ("NYC", 30), ("unknown", 0.0)):
+        is_nearby = db.location_filter(location, radius_km)
+        assert ([c.id for c in filter(is_nearby, db.iter_candidates())]
+                == [c.id for c in db.find_candidates_by_location(location, radius_km)])
+    
+    moved = copy.copy(db.get_candidate("R3"))
+    moved.location = "Newark, NJ"
+    db.update_candidate(moved)
+    assert [c.id for c in db.find_candidates_by_location("New York, NY", radius_km=30)] == ["R1", "R2", "R3", "R4"]
+    db.remove_candidate("R1")
+    assert db.find_candidates_by_location("New York, NY") == []
+    
+    print("✅ Gazetteer Locations: PASSED")
+
 def test_candidate_evaluator():
     """Test the candidate evaluation functionality."""
     print("🧪 Testing Candidate Evaluator...")
@@ -125,6 +476,102 @@ def test_candidate_evaluator():
     
     print("✅ Candidate Evaluator: PASSED")
 
+def test_compiled_job():
+    """Test that compiled job profiles score like the raw job and are invalidated on edit."""
+    print("🧪 Testing Compiled Job Profiles...")
+    
+    evaluator = CandidateEvaluator()
+    candidates, jobs = create_sample_data()
+    job = jobs[0]
+    
+    compiled = evaluator.compile_job(job)
+    assert evaluator.compile_job(job) is compiled, "Profile should be built once per job"
+    assert compiled.required_skills == [skill.lower() for skill in job.required_skills]
+    
+    reference = CandidateEvaluator()
+    for candidate in candidates:
+        result = evaluator.evaluate_candidate(copy.deepcopy(candidate), compiled)
+        expected = reference.evaluate_candidate(copy.deepcopy(candidate), job)
+        for field in ('overall_score', 'skills_match', 'experience_match', 'education_match',
+                      'location_match', 'bias_indicators', 'recommendations'):
+            assert getattr(result, field) == getattr(expected, field), f"{candidate.name}: {field} differs"
+    
+    # Editing the job in place takes effect once the profile is invalidated
+    candidate = copy.deepcopy(candidates[0])
+    job.required_skills = ["cobol"]
+    evaluator.invalidate_job(job.id)
+    assert evaluator.compile_job(job) is not compiled
+    assert evaluator.evaluate_candidate(candidate, job).skills_match == 0.0
+    
+    # Only the most recently used profiles are kept
+    bounded = CandidateEvaluator(max_jobs=2)
+    postings = [dataclasses.replace(jobs[1], id=f"LRU{i}") for i in range(4)]
+    for posting in postings[:3]:
+        bounded.compile_job(posting)
+    bounded.compile_job(postings[1])
+    bounded.compile_job(postings[3])
+    assert list(bounded._compiled_jobs) == ["LRU1", "LRU3"]
+    
+    print("✅ Compiled Job Profiles: PASSED")
+
+def test_evaluate_many():
+    """Test that matrix evaluation matches pairwise evaluation."""
+    print("🧪 Testing Matrix Evaluation...")
+    
+    evaluator = CandidateEvaluator()
+    rng = random.Random(7)
+    resumes = ["Young developer", "Experienced engineer", "Fresh", "Top", "Graduated from an ivy league school"]
+    candidates = [
+        Candidate(id=f"M{i}", name=f"Candidate {i}", email="", resume_text=rng.choice(resumes),
+                  skills=rng.sample(['python', 'react', 'aws', 'docker', 'sql'], rng.randint(1, 4)),
+                  experience_years=float(rng.randint(0, 10)),
+                  education_level=rng.choice(['high school', 'associate', 'bachelor', 'masters', 'phd']),
+                  location=rng.choice(['San Francisco, CA', 'Austin, TX', 'New York, NY']))
+        for i in range(40)
+    ]
+    jobs = [
+        Job(id=f"MJ{i}", title=title, company=company, required_skills=required, preferred_skills=['docker', 'sql'],
+            experience_required=experience, education_required=education, location=location,
+            department="Engineering", salary_range=(100000, 150000))
+        for i, (title, company, required, experience, education, location) in enumerate([
+            ("Backend Developer", "Acme", ['python', 'aws'], 5.0, 'bachelor', 'Austin, TX'),
+            ("Graduate Engineer", "Remote First", ['react'], 1.0, 'masters', 'Remote'),
+            ("University Liaison", "Old Corp", [], 3.0, 'phd', 'New York, NY')
+        ])
+    ]
+    
+    matrix = evaluator.evaluate_many(copy.deepcopy(candidates), jobs)
+    assert matrix.overall_score.shape == (40, 3), "Score matrix has the wrong shape"
+    
+    for candidate_index, candidate in enumerate(candidates):
+        for job_index, job in enumerate(jobs):
+            expected = evaluator.evaluate_candidate(copy.deepcopy(candidate), job)
+            result = matrix.result(candidate_index, job_index)
+            for field in ('candidate_id', 'job_id', 'overall_score', 'skills_match', 'experience_match',
+                          'education_match', 'location_match', 'bias_indicators', 'recommendations'):
+                assert getattr(result, field) == getattr(expected, field), \
+                    f"{field} differs for {candidate.id}/{job.id}"
+    
+    frame = matrix.to_dataframe()
+    assert len(frame) == 120 and frame['overall_score'].tolist() == matrix.overall_score.ravel().tolist()
+    
+    # Case-variant duplicates, as resume uploads produce, count once on both paths
+    duplicates = [
+        Candidate(id=f"D{i}", name=f"Duplicate {i}", email="", resume_text="Fresh", skills=skills,
+                  experience_years=3.0, education_level='bachelor', location='Austin, TX')
+        for i, skills in enumerate([["docker", "Docker", "sql"], ["Python", "python", "AWS", "aws"]])
+    ]
+    matrix = evaluator.evaluate_many(copy.deepcopy(duplicates), jobs)
+    for candidate_index, candidate in enumerate(duplicates):
+        for job_index, job in enumerate(jobs):
+            expected = evaluator.evaluate_candidate(copy.deepcopy(candidate), job)
+            result = matrix.result(candidate_index, job_index)
+            assert (result.skills_match, result.overall_score) == (expected.skills_match, expected.overall_score), \
+                f"Duplicate skills scored differently for {candidate.id}/{job.id}"
+    assert evaluator.skills_matcher.calculate_skills_match(["docker", "Docker", "sql"], ["python"], ["docker"]) == 0.1
+    
+    print("✅ Matrix Evaluation: PASSED")
+
 def test_database_operations():
     """Test the database operations."""
     print("🧪 Testing Database Operations...")
@@ -153,6 +600,553 @@ def test_database_operations():
     
     print("✅ Database Operations: PASSED")
 
+def test_database_skill_index():
+    """Test the inverted skill index kept by the database."""
+    print("🧪 Testing Database Skill Index...")
+    
+    db = HiringDatabase()
+    for candidate_id, skills in [("S1", ["Python", "AWS"]), ("S2", ["python", "docker"]), ("S3", ["java"])]:
+        db.add_candidate(Candidate(
+            id=candidate_id, name=candidate_id, email="", resume_text="", skills=skills,
+            experience_years=1.0, education_level="bachelor", location=""
+        ))
+    
+    def ids(candidates):
+        return [c.id for c in candidates]
+    
+    assert ids(db.find_candidates_by_skills(["python"])) == ["S1", "S2"], "Skill lookup is not case-insensitive"
+    assert ids(db.find_candidates_by_skills(["aws", "java"])) == ["S1", "S3"], "OR query failed"
+    assert ids(db.find_candidates_by_skills(["python", "docker"], match_all=True)) == ["S2"], "AND query failed"
+    assert db.find_candidates_by_skills(["python", "rust"], match_all=True) == []
+    
+    # The lazy predicates agree with the index lookups
+    for skills, match_all in ((["python"], False), (["aws", "java"], False), (["python", "docker"], True),
+                              (["python", "rust"], True), ([], False)):
+        has_skills = db.skills_filter(skills, match_all)
+        assert ids(filter(has_skills, db.iter_candidates())) == ids(db.find_candidates_by_skills(skills, match_all))
+    
+    # Updates and removals keep the postings in sync
+    candidate = db.get_candidate("S3")
+    candidate.skills = ["python", "docker"]
+    db.update_candidate(candidate)
+    assert ids(db.find_candidates_by_skills(["python", "docker"], match_all=True)) == ["S2", "S3"]
+    assert "java" not in db.skill_index, "Empty posting list not dropped"
+    
+    db.remove_candidate("S2")
+    assert ids(db.find_candidates_by_skills(["docker"])) == ["S3"], "Removed candidate still indexed"
+    
+    print("✅ Database Skill Index: PASSED")
+
+def test_job_rankings():
+    """Test the per-job ranking maintained by add_evaluation."""
+    print("🧪 Testing Job Rankings...")
+    
+    db = HiringDatabase()
+    for candidate_id in ("R1", "R2", "R3", "R4"):
+        db.add_candidate(Candidate(
+            id=candidate_id, name=candidate_id, email="", resume_text="", skills=[],
+            experience_years=1.0, education_level="bachelor", location=""
+        ))
+    
+    def evaluate(candidate_id, job_id, score):
+        db.add_evaluation(EvaluationResult(
+            candidate_id=candidate_id, job_id=job_id, overall_score=score, skills_match=score,
+            experience_match=score, education_match=score, location_match=score,
+            bias_indicators=[], recommendations=[], timestamp=datetime.now()
+        ))
+    
+    evaluate("R1", "J1", 0.5)
+    evaluate("R2", "J1", 0.9)
+    evaluate("R3", "J1", 0.7)
+    evaluate("R4", "J1", 0.7)
+    evaluate("R1", "J2", 0.1)
+    
+    top = [(c.id, score) for c, score in db.get_top_candidates("J1", 3)]
+    assert top == [("R2", 0.9), ("R3", 0.7), ("R4", 0.7)], f"Unexpected ranking: {top}"
+    assert db.get_candidate_rank("J1", "R1") == 4
+    assert db.get_candidate_rank("J2", "R1") == 1
+    assert db.get_candidate_rank("J1", "missing") is None
+    
+    # Re-evaluation replaces the previous entry instead of duplicating it
+    evaluate("R1", "J1", 0.95)
+    top = [(c.id, score) for c, score in db.get_top_candidates("J1", 10)]
+    assert top == [("R1", 0.95), ("R2", 0.9), ("R3", 0.7), ("R4", 0.7)], f"Duplicate or stale entry: {top}"
+    
+    db.remove_candidate("R2")
+    assert db.get_candidate_rank("J1", "R3") == 2, "Removed candidate still ranked"
+    
+    print("✅ Job Rankings: PASSED")
+
+def test_evaluation_store():
+    """Test the columnar evaluation store and its indexes."""
+    print("🧪 Testing Evaluation Store...")
+    
+    store = EvaluationStore(capacity=2)
+    evaluations = [
+        EvaluationResult(
+            candidate_id=f"R{i % 3}", job_id=f"J{i % 2}", overall_score=i / 10, skills_match=0.5,
+            experience_match=0.25, education_match=1.0, location_match=0.0,
+            bias_indicators=["Age-related language detected"] if i == 4 else [],
+            recommendations=["Consider for interview"], timestamp=datetime(2024, 1, 1, 12, i)
+        )
+        for i in range(7)
+    ]
+    for evaluation in evaluations:
+        store.append(evaluation)
+    
+    assert len(store) == 7
+    assert list(store) == evaluations, "Stored evaluations do not round-trip"
+    assert store[-1] == evaluations[-1]
+    assert store.select(job_id="J0") == [e for e in evaluations if e.job_id == "J0"]
+    assert store.select(candidate_id="R1", job_id="J1") == [e for e in evaluations if e.candidate_id == "R1" and e.job_id == "J1"]
+    assert store.select(job_id="missing") == []
+    
+    rows = store.rows(job_id="J0")
+    assert store.column('overall_score', rows).tolist() == [e.overall_score for e in evaluations if e.job_id == "J0"]
+    assert store.column('bias_detected').sum() == 1
+    
+    frame = store.to_dataframe()
+    assert list(frame['candidate_id']) == [e.candidate_id for e in evaluations]
+    assert frame['overall_score'].tolist() == [e.overall_score for e in evaluations]
+    
+    db = HiringDatabase()
+    db.add_job(Job(
+        id="J1", title="Engineer", company="Acme", required_skills=[], preferred_skills=[],
+        experience_required=0.0, education_required="bachelor", location="", department="Engineering",
+        salary_range=(0, 0)
+    ))
+    for evaluation in evaluations:
+        db.add_evaluation(evaluation)
+    analytics = HiringAnalytics(db)
+    report = analytics.generate_hiring_report("J1")
+    assert report['total_candidates'] == 3
+    
+    # Removing a candidate deletes its rows and compacts the rest
+    remaining = [e for e in evaluations if e.candidate_id != "R1"]
+    assert store.remove_candidate("R1") == 2
+    assert store.remove_candidate("R1") == 0
+    assert len(store) == len(remaining) and list(store) == remaining
+    assert store.select(candidate_id="R1") == []
+    assert store.select(job_id="J0") == [e for e in remaining if e.job_id == "J0"]
+    assert list(store.page(after=1, limit=2, job_id="J1")) == [
+        row for row, e in enumerate(remaining) if e.job_id == "J1" and row > 1][:2]
+    assert store.to_dataframe()['overall_score'].tolist() == [e.overall_score for e in remaining]
+    store.append(evaluations[1])
+    assert store.select(candidate_id="R1") == [evaluations[1]]
+    
+    db.add_candidate(Candidate(id="R1", name="R1", email="", resume_text="", skills=[],
+                               experience_years=0.0, education_level="", location=""))
+    db.remove_candidate("R1")
+    assert db.find_evaluations(candidate_id="R1") == []
+    assert list(db.evaluations) == remaining
+    
+    print("✅ Evaluation Store: PASSED")
+
+def test_incremental_job_report():
+    """Test that incrementally maintained job reports match the batch computation."""
+    print("🧪 Testing Incremental Job Reports...")
+    
+    rng = random.Random(11)
+    db = HiringDatabase()
+    db.add_job(Job(
+        id="J1", title="Engineer", company="Acme", required_skills=[], preferred_skills=[],
+        experience_required=0.0, education_required="bachelor", location="", department="Engineering",
+        salary_range=(0, 0)
+    ))
+    evaluations = []
+    for i in range(500):
+        evaluation = EvaluationResult(
+            candidate_id=f"R{i}", job_id="J1", overall_score=rng.random(), skills_match=rng.random(),
+            experience_match=rng.random(), education_match=1.0, location_match=0.5,
+            bias_indicators=["Gender-specific language detected"] if rng.random() < 0.3 else [],
+            recommendations=[], timestamp=datetime.now()
+        )
+        evaluations.append(evaluation)
+        db.add_evaluation(evaluation)
+    
+    report = HiringAnalytics(db).generate_hiring_report("J1")
+    scores = np.array([e.overall_score for e in evaluations])
+    expected = {
+        'average_score': np.mean(scores),
+        'score_std': np.std(scores),
+        'min_score': np.min(scores),
+        'max_score': np.max(scores),
+        'average_skills_match': np.mean([e.skills_match for e in evaluations]),
+        'average_experience_match': np.mean([e.experience_match for e in evaluations])
+    }
+    for name, value in expected.items():
+        assert abs(report['statistics'][name] - value) < 1e-9, f"{name}: {report['statistics'][name]} != {value}"
+    
+    bias_count = sum(1 for e in evaluations if e.bias_indicators)
+    assert report['total_candidates'] == len(evaluations)
+    assert report['bias_analysis']['bias_detected_count'] == bias_count
+    assert abs(report['bias_analysis']['bias_percentage'] - bias_count / len(evaluations) * 100) < 1e-9
+    
+    print("✅ Incremental Job Reports: PASSED")
+
+def test_keyset_pagination():
+    """Test id-ordered candidate iteration and evaluation row pages."""
+    print("🧪 Testing Keyset Pagination...")
+    
+    db = HiringDatabase()
+    def candidate(candidate_id):
+        return Candidate(id=candidate_id, name=candidate_id, email="", resume_text="", skills=[],
+                         experience_years=0.0, education_level="", location="")
+    db.add_candidate(candidate("C05"))
+    db.add_candidates([candidate(f"C{i:02d}") for i in range(100, 0, -1)])
+    db.add_candidate(candidate("C00"))
+    db.remove_candidate("C50")
+    
+    ids = [c.id for c in db.iter_candidates()]
+    assert ids == sorted(db.candidates) and len(ids) == 100
+    assert [c.id for c in db.iter_candidates(after="C97")] == ["C98", "C99"]
+    
+    rng = random.Random(5)
+    store = EvaluationStore()
+    pairs = [(f"C{rng.randrange(5)}", f"J{rng.randrange(3)}") for _ in range(300)]
+    for candidate_id, job_id in pairs:
+        store.append(EvaluationResult(
+            candidate_id=candidate_id, job_id=job_id, overall_score=rng.random(), skills_match=0.5,
+            experience_match=0.5, education_match=0.5, location_match=0.5, bias_indicators=[],
+            recommendations=[], timestamp=datetime.now()
+        ))
+    
+    for candidate_id, job_id in ((None, None), ("C1", None), (None, "J2"), ("C3", "J0"), ("C9", None)):
+        expected = store.rows(candidate_id=candidate_id, job_id=job_id).tolist()
+        paged, after = [], -1
+        while True:
+            page = store.page(after=after, limit=7, candidate_id=candidate_id, job_id=job_id).tolist()
+            paged += page
+            if len(page) < 7:
+                break
+            after = page[-1]
+        assert paged == expected, (candidate_id, job_id)
+    
+    print("✅ Keyset Pagination: PASSED")
+
+def test_job_statistics_reevaluation():
+    """Test that job reports count only each candidate's latest evaluation."""
+    print("🧪 Testing Job Statistics Re-evaluation...")
+    
+    rng = random.Random(13)
+    db = HiringDatabase()
+    db.add_job(Job(
+        id="J1", title="Engineer", company="Acme", required_skills=[], preferred_skills=[],
+        experience_required=0.0, education_required="bachelor", location="", department="Engineering",
+        salary_range=(0, 0)
+    ))
+    for i in range(40):
+        db.add_candidate(Candidate(id=f"R{i}", name=f"R{i}", email="", resume_text="", skills=[],
+                                   experience_years=0.0, education_level="", location=""))
+    
+    latest = {}
+    for _ in range(300):
+        evaluation = EvaluationResult(
+            candidate_id=f"R{rng.randrange(40)}", job_id="J1", overall_score=rng.random(),
+            skills_match=rng.random(), experience_match=rng.random(), education_match=1.0, location_match=0.5,
+            bias_indicators=["Gender-specific language detected"] if rng.random() < 0.3 else [],
+            recommendations=[], timestamp=datetime.now()
+        )
+        latest[evaluation.candidate_id] = evaluation
+        db.add_evaluation(evaluation)
+        stats = db.job_statistics["J1"]
+        scores = [e.overall_score for e in latest.values()]
+        assert (stats.min_score, stats.max_score) == (min(scores), max(scores)), "Bounds lost a re-evaluation"
+    
+    # Remove the best and the worst candidate so both bounds have to move
+    ranked = sorted(latest.values(), key=lambda e: e.overall_score)
+    for evaluation in (ranked[0], ranked[-1], ranked[len(ranked) // 2]):
+        db.remove_candidate(evaluation.candidate_id)
+        del latest[evaluation.candidate_id]
+    
+    report = HiringAnalytics(db).generate_hiring_report("J1")
+    evaluations = list(latest.values())
+    scores = np.array([e.overall_score for e in evaluations])
+    expected = {
+        'average_score': np.mean(scores),
+        'score_std': np.std(scores),
+        'min_score': np.min(scores),
+        'max_score': np.max(scores),
+        'average_skills_match': np.mean([e.skills_match for e in evaluations]),
+        'average_experience_match': np.mean([e.experience_match for e in evaluations])
+    }
+    for name, value in expected.items():
+        assert abs(report['statistics'][name] - value) < 1e-9, f"{name}: {report['statistics'][name]} != {value}"
+    
+    bias_count = sum(1 for e in evaluations if e.bias_indicators)
+    assert report['total_candidates'] == len(evaluations) == len(db.rankings["J1"])
+    assert report['bias_analysis']['bias_detected_count'] == bias_count
+    assert report['top_candidates'][0]['score'] == np.max(scores)
+    
+    print("✅ Job Statistics Re-evaluation: PASSED")
+
+def test_concurrent_database_writes():
+    """Test that writes from several threads leave the indexes consistent."""
+    print("🧪 Testing Concurrent Database Writes...")
+    
+    import threading
+    
+    db = HiringDatabase()
+    jobs = [Job(
+        id=f"J{j}", title="Engineer", company="Acme", required_skills=[], preferred_skills=[],
+        experience_required=0.0, education_required="bachelor", location="", department="Engineering",
+        salary_range=(0, 0)
+    ) for j in range(4)]
+    db.add_jobs(jobs)
+    
+    def write(worker):
+        rng = random.Random(worker)
+        for i in range(50):
+            candidate_id = f"W{worker}-{i:02d}"
+            db.add_candidate(Candidate(id=candidate_id, name=candidate_id, email="", resume_text="",
+                                       skills=["python"], experience_years=0.0, education_level="",
+                                       location=""))
+            db.add_evaluations(EvaluationResult(
+                candidate_id=candidate_id, job_id=job.id, overall_score=rng.random(),
+                skills_match=0.5, experience_match=0.5, education_match=1.0, location_match=0.5,
+                bias_indicators=[], recommendations=[], timestamp=datetime.now()
+            ) for job in jobs)
+    
+    # Switch threads as often as possible to surface unsynchronized writes
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    
+    assert len(db.candidates) == 200
+    assert [candidate_id for _, candidate_id in db._candidate_order] == sorted(db.candidates)
+    assert len(db.skill_index["python"]) == 200
+    assert len(db.evaluations) == 800
+    for job in jobs:
+        assert len(db.rankings[job.id]) == 200
+        assert db.job_statistics[job.id].count == 200
+    
+    print("✅ Concurrent Database Writes: PASSED")
+
+def test_analytics_cache():
+    """Test that analytics results are cached until the database is written to."""
+    print("🧪 Testing Analytics Cache...")
+    
+    db = HiringDatabase()
+    analytics = HiringAnalytics(db)
+    job = Job(
+        id="J1", title="Engineer", company="Acme", required_skills=[], preferred_skills=[],
+        experience_required=0.0, education_required="bachelor", location="", department="Engineering",
+        salary_range=(0, 0)
+    )
+    db.add_job(job)
+    
+    def evaluation(candidate_id, score):
+        return EvaluationResult(
+            candidate_id=candidate_id, job_id="J1", overall_score=score, skills_match=score,
+            experience_match=score, education_match=1.0, location_match=0.5,
+            bias_indicators=[], recommendations=[], timestamp=datetime.now()
+        )
+    
+    db.add_evaluation(evaluation("R1", 0.5))
+    first = analytics.generate_hiring_report("J1")
+    assert analytics.generate_hiring_report("J1") is first
+    assert analytics.cache_stats()['hits'] == 1 and analytics.cache_stats()['misses'] == 1
+    
+    # Every write path bumps the version and invalidates cached results
+    version = db.version
+    db.add_evaluation(evaluation("R2", 0.9))
+    assert db.version > version
+    second = analytics.generate_hiring_report("J1")
+    assert second is not first and second['total_candidates'] == 2
+    
+    for write in (lambda: db.add_candidate(Candidate(id="R3", name="Sam", email="", resume_text="", skills=[],
+                                                        experience_years=0.0, education_level="", location="")),
+                  lambda: db.add_job(job),
+                  lambda: db.add_evaluations([evaluation("R3", 0.1)]),
+                  lambda: db.remove_candidate("R3"),
+                  db.touch):
+        version = db.version
+        write()
+        assert db.version > version
+    # R3 was removed again, so only R1 and R2 are counted
+    assert analytics.generate_hiring_report("J1")['total_candidates'] == 2
+    
+    stats = analytics.cache_stats()
+    assert stats['misses'] == 3 and stats['hits'] == 1 and stats['entries'] == 1
+    assert abs(stats['hit_rate'] - 0.25) < 1e-9
+    
+    print("✅ Analytics Cache: PASSED")
+
+def test_sqlite_storage():
+    """Test that a SQLite-backed database persists and reloads its records."""
+    print("🧪 Testing SQLite Storage...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "hiring.db")
+        storage = SQLiteStorage(path)
+        db = HiringDatabase(storage=storage)
+        
+        job = Job(
+            id="J1", title="Engineer", company="Acme", required_skills=["python"], preferred_skills=[],
+            experience_required=2.0, education_required="bachelor", location="Remote", department="Engineering",
+            salary_range=(100000, 150000)
+        )
+        db.add_job(job)
+        for candidate_id in ("R1", "R2", "R3"):
+            db.add_candidate(Candidate(
+                id=candidate_id, name=candidate_id, email="", resume_text="", skills=["Python"],
+                experience_years=3.0, education_level="bachelor", location="Remote"
+            ))
+        db.remove_candidate("R3")
+        
+        def evaluation(candidate_id, score):
+            return EvaluationResult(
+                candidate_id=candidate_id, job_id="J1", overall_score=score, skills_match=score,
+                experience_match=score, education_match=score, location_match=score,
+                bias_indicators=[], recommendations=["Consider for interview"], timestamp=datetime(2024, 1, 1)
+            )
+        db.add_evaluation(evaluation("R1", 0.6))
+        db.add_evaluations([evaluation("R2", 0.8), evaluation("R1", 0.9)])
+        
+        assert [e.overall_score for e in db.find_evaluations(candidate_id="R1")] == [0.6, 0.9]
+        assert [e.candidate_id for e in db.find_evaluations(job_id="J1", min_score=0.7)] == ["R2", "R1"]
+        assert [e.candidate_id for e in HiringDatabase.find_evaluations(db, job_id="J1")] == ["R1", "R2", "R1"]
+        
+        # Edited jobs are saved; removed candidates take their evaluations with them
+        job.title = "Senior Engineer"
+        db.update_job(job)
+        db.add_candidate(Candidate(
+            id="R4", name="R4", email="", resume_text="", skills=["Python"],
+            experience_years=3.0, education_level="bachelor", location="Remote"
+        ))
+        db.add_evaluation(evaluation("R4", 0.95))
+        db.remove_candidate("R4")
+        assert db.find_evaluations(candidate_id="R4") == []
+        assert db.evaluations.select(candidate_id="R4") == [], "In-memory rows outlived the candidate"
+        assert storage.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        storage.close()
+        
+        # A fresh database on the same file sees everything again
+        storage = SQLiteStorage(path)
+        reloaded = HiringDatabase(storage=storage)
+        assert sorted(reloaded.candidates) == ["R1", "R2"]
+        assert reloaded.jobs["J1"] == job and reloaded.jobs["J1"].title == "Senior Engineer"
+        assert list(reloaded.evaluations) == list(db.evaluations)
+        assert [(c.id, s) for c, s in reloaded.get_top_candidates("J1")] == [("R1", 0.9), ("R2", 0.8)]
+        assert reloaded.job_statistics["J1"].count == 2
+        assert [c.id for c in reloaded.find_candidates_by_skills(["python"])] == ["R1", "R2"]
+        storage.close()
+    
+    print("✅ SQLite Storage: PASSED")
+
+def test_jsonl_export():
+    """Test the JSON export and the streaming JSON Lines export."""
+    print("🧪 Testing JSON Lines Export...")
+    
+    import gzip
+    import json
+    
+    db = HiringDatabase()
+    candidates, jobs = create_sample_data()
+    for candidate in candidates:
+        db.add_candidate(candidate)
+    for job in jobs:
+        db.add_job(job)
+    evaluator = CandidateEvaluator()
+    db.add_evaluations(evaluator.evaluate_candidate(c, j) for c in candidates for j in jobs)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "export.json")
+        db.export_data(json_path)
+        with open(json_path) as f:
+            exported = json.load(f)
+        
+        for filename, opener in (("export.jsonl", open), ("export.jsonl.gz", gzip.open)):
+            path = os.path.join(tmp_dir, filename)
+            count = db.export_jsonl(path)
+            with opener(path, 'rt') as f:
+                records = [json.loads(line) for line in f]
+            
+            assert count == len(records) == len(candidates) + len(jobs) + len(candidates) * len(jobs)
+            evaluations = [r for r in records if r.pop('type') == 'evaluation']
+            assert evaluations == exported['evaluations'], f"{filename} evaluations differ from export_data"
+            assert {r['id'] for r in records if 'id' in r} == set(exported['candidates']) | set(exported['jobs'])
+    
+    print("✅ JSON Lines Export: PASSED")
+
+def test_columnar_export():
+    """Test the memory-mappable columnar export of evaluations and candidates."""
+    print("🧪 Testing Columnar Export...")
+    
+    db = HiringDatabase()
+    candidates, jobs = create_sample_data()
+    for candidate in candidates:
+        db.add_candidate(candidate)
+    for job in jobs:
+        db.add_job(job)
+    evaluator = CandidateEvaluator()
+    evaluations = [evaluator.evaluate_candidate(c, j) for c in candidates for j in jobs]
+    db.add_evaluations(evaluations)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db.export_columnar(tmp_dir, parquet=False)
+        tables = load_columnar_export(tmp_dir)
+        columns = tables['evaluations']
+        
+        assert isinstance(columns['overall_score'], np.memmap), "Columns should be memory-mapped"
+        assert columns['overall_score'].tolist() == [e.overall_score for e in evaluations]
+        assert columns['bias_detected'].tolist() == [bool(e.bias_indicators) for e in evaluations]
+        assert [columns['candidate_ids'][code] for code in columns['candidate_code']] == [e.candidate_id for e in evaluations]
+        assert [columns['job_ids'][code] for code in columns['job_code']] == [e.job_id for e in evaluations]
+        assert columns['timestamp'][0].item() == evaluations[0].timestamp
+        
+        features = tables['candidates']
+        assert features['id'].tolist() == [c.id for c in candidates]
+        assert features['skill_count'].tolist() == [len(c.skills) for c in candidates]
+        del tables, columns, features
+    
+    print("✅ Columnar Export: PASSED")
+
+def test_bulk_load():
+    """Test chunked bulk loading of candidates and jobs from CSV and JSON Lines."""
+    print("🧪 Testing Bulk Load...")
+    
+    import json
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "candidates.csv")
+        with open(csv_path, 'w') as f:
+            f.write("id,name,email,skills,experience_years,education_level,location\n")
+            f.write("007,Ann Lee,ann@example.com,Python; SQL,4,masters,\"Austin, TX\"\n")
+            f.write("008,Bob Ray,,,,,\n")
+            f.write("009,Cy Dunn,cy@example.com,python,1.5,bachelor,Remote\n")
+        
+        jobs_path = os.path.join(tmp_dir, "jobs.jsonl")
+        with open(jobs_path, 'w') as f:
+            f.write(json.dumps({"id": "J1", "title": "Engineer", "required_skills": ["python"],
+                                "experience_required": 2, "salary_range": [90000, 120000]}) + "\n")
+            f.write(json.dumps({"id": "J2", "title": "Analyst"}) + "\n")
+        
+        db = HiringDatabase()
+        report = bulk_load(db, csv_path, chunksize=2)
+        assert (report.rows, report.chunks) == (3, 2)
+        assert report.rows_per_second > 0
+        
+        ann = db.get_candidate("007")
+        assert (ann.name, ann.skills, ann.experience_years, ann.location) == ("Ann Lee", ["Python", "SQL"], 4.0, "Austin, TX")
+        bob = db.get_candidate("008")
+        assert (bob.email, bob.skills, bob.experience_years) == ("", [], 0.0)
+        assert [c.id for c in db.find_candidates_by_skills(["python"])] == ["007", "009"]
+        
+        bulk_load(db, jobs_path, record_type='jobs')
+        assert db.jobs["J1"].required_skills == ["python"]
+        assert db.jobs["J1"].salary_range == (90000, 120000)
+        assert db.jobs["J2"].required_skills == [] and db.jobs["J2"].experience_required == 0.0
+    
+    print("✅ Bulk Load: PASSED")
+
 def test_end_to_end():
     """Test the complete system end-to-end."""
     print("🧪 Testing End-to-End System...")
@@ -210,10 +1204,33 @@ def run_all_tests():
     
     tests = [
         test_resume_parser,
+        test_compiled_resume_parser,
+        test_skill_dictionary,
+        test_batch_resume_parsing,
+        test_resume_parse_cache,
+        test_resume_ingestion_pipeline,
+        test_resume_document,
         test_skills_matcher,
+        test_skills_index,
         test_bias_detector,
+        test_bias_detector_word_boundaries,
+        test_gazetteer_locations,
         test_candidate_evaluator,
+        test_compiled_job,
+        test_evaluate_many,
         test_database_operations,
+        test_database_skill_index,
+        test_job_rankings,
+        test_evaluation_store,
+        test_incremental_job_report,
+        test_job_statistics_reevaluation,
+        test_concurrent_database_writes,
+        test_analytics_cache,
+        test_keyset_pagination,
+        test_sqlite_storage,
+        test_jsonl_export,
+        test_columnar_export,
+        test_bulk_load,
         test_end_to_end
     ]
     